@@ -0,0 +1,144 @@
+"""Asyncio interface to the Validator.
+Created on October 18, 2026
+
+Validator.validate blocks while it fetches from Onshape and runs the checks,
+which would stall an event loop. AsyncValidator runs both in an executor, so
+one process can keep many validations in flight:
+
+    validator = AsyncValidator(max_fetches=8, timeout=120)
+    results = await validator.validate_many(urls)
+"""
+
+import asyncio
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from aide_validation.validator import ValidationResult, Validator
+
+
+class AsyncValidator(object):
+    """Validates AguaClara plants from asyncio code"""
+
+    def __init__(self, max_fetches=8, timeout=None, executor=None, **validator_kwargs):
+        """
+        Args:
+            max_fetches: maximum number of concurrent requests to Onshape.
+                Defaults to 8
+
+            timeout: default number of seconds a validation may take.
+                Defaults to None which waits as long as it takes
+
+            executor: concurrent.futures executor to fetch and run the checks
+                in. Defaults to None which creates a ThreadPoolExecutor that
+                close shuts down
+
+            validator_kwargs: passed to the Validator of each URL, such as
+                cache, fetcher, report_dir or pdf. Timings are copied for
+                each URL.
+        """
+        self.max_fetches = max_fetches
+        # semaphore of each running event loop, since an asyncio semaphore
+        # can only be used in the loop it was first used in
+        self.semaphores = weakref.WeakKeyDictionary()
+        self.timeout = timeout
+        self.owns_executor = executor is None
+        self.executor = ThreadPoolExecutor() if executor is None else executor
+        self.validator_kwargs = validator_kwargs
+
+    def _semaphore(self):
+        loop = asyncio.get_running_loop()
+        if loop not in self.semaphores:
+            self.semaphores[loop] = asyncio.Semaphore(self.max_fetches)
+        return self.semaphores[loop]
+
+    def _validator(self):
+        kwargs = dict(self.validator_kwargs)
+        if kwargs.get("timings") is not None:
+            # concurrent validations record their phases separately
+            kwargs["timings"] = kwargs["timings"].copy()
+        return Validator(**kwargs)
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def _error(self, validator, url, message):
+        # writes the report of a validation which failed with an error
+        validator.report_writer.set_result("Error: {}".format(message))
+        pdf = await self._run(validator.save_pdf)
+        return ValidationResult(
+            validator.report_writer.get_result(),
+            url,
+            validator.report_writer.report_name,
+            pdf,
+            validator.timings if validator.timings.enabled else None,
+        )
+
+    async def _validate(self, validator, url):
+        async with self._semaphore():
+            try:
+                measurements, processes = await self._run(validator.fetch, url)
+            except Exception as e:
+                return await self._error(validator, url, e)
+        return await self._run(
+            validator.validate_measurements, measurements, processes, url=url
+        )
+
+    async def validate(self, url, timeout=None):
+        """Validates the AguaClara component or plant model at the given URL.
+        Errors, including timeouts, are returned as "Error: ..." results.
+        Cancelling the call stops waiting for the validation, although a fetch
+        or check already running in the executor still finishes.
+
+        Args:
+            url: URL of Onshape model to validate (string)
+
+            timeout: number of seconds the validation may take. Defaults to
+                None which uses the timeout of this AsyncValidator
+
+        Returns:
+            result: text which represents validation result (ValidationResult)
+        """
+        timeout = self.timeout if timeout is None else timeout
+        validator = self._validator()
+        try:
+            return await asyncio.wait_for(self._validate(validator, url), timeout)
+        except asyncio.TimeoutError:
+            # a fetch or check still running in the executor may yet write to
+            # the report of validator, so the error gets a report of its own
+            return await self._error(
+                self._validator(),
+                url,
+                "Validation timed out after {} seconds".format(timeout),
+            )
+
+    async def validate_many(self, urls, timeout=None):
+        """Validates many Onshape models concurrently, each with its own report
+
+        Args:
+            urls: URLs of Onshape models to validate (iterable of strings)
+
+            timeout: number of seconds each validation may take. Defaults to
+                None which uses the timeout of this AsyncValidator
+
+        Returns:
+            results: validation result of each URL, in input order
+            (list of ValidationResult)
+        """
+        return list(
+            await asyncio.gather(*[self.validate(url, timeout) for url in urls])
+        )
+
+    def close(self):
+        """Shuts down the executor if this AsyncValidator created it
+
+        Args:
+            none
+
+        Returns:
+            none
+        """
+        if self.owns_executor:
+            self.executor.shutdown(wait=False)
@@ -0,0 +1,427 @@
+"""Benchmarks of the validation checks, report rendering and validators.
+Created on October 18, 2026
+
+Each benchmark calls a function repeatedly and reports its throughput, the
+percentiles of its latency and the peak memory it allocates. Results can be
+saved as a JSON baseline and later runs compared against it:
+
+    python -m aide_validation.benchmark --save baseline.json
+    (change some code)
+    python -m aide_validation.benchmark --compare baseline.json
+
+Benchmarks run on hand-written measurements of valid unit processes, so no
+network access is needed.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+import numpy as np
+from aide_validation.units import u
+
+BenchmarkResult = namedtuple(
+    "BenchmarkResult",
+    [
+        "name",
+        "iterations",
+        "ops_per_sec",
+        "mean",
+        "p50",
+        "p90",
+        "p99",
+        "peak_memory",
+    ],
+)
+BenchmarkResult.__doc__ = """Result of one benchmark. Latencies are in seconds
+and peak_memory is the peak number of bytes allocated by one call."""
+
+
+def lfom_measurements():
+    """Returns the parsed measurements of a valid LFOM"""
+    return {
+        "N.LfomOrifices": [17.0, 4.0, 6.0, 3.0, 4.0, 3.0, 3.0, 3.0, 3.0, 2.0, 3.0, 1.0],
+        "H.LfomOrifices": [
+            0.0079375 * u.m,
+            0.02467613636363637 * u.m,
+            0.04141477272727274 * u.m,
+            0.0581534090909091 * u.m,
+            0.07489204545454548 * u.m,
+            0.09163068181818185 * u.m,
+            0.1083693181818182 * u.m,
+            0.1251079545454546 * u.m,
+            0.14184659090909096 * u.m,
+            0.15858522727272734 * u.m,
+            0.1753238636363637 * u.m,
+            0.19206250000000008 * u.m,
+        ],
+        "D.LfomOrifices": 0.015875 * u.m,
+        "Flow": 10 * u.L,
+    }
+
+
+def floc_measurements():
+    """Returns the parsed measurements of a valid flocculator"""
+    return {
+        "Flow": 30 * u.L,
+        "TempCelsius": 20,
+        "N.FlocChannels": 8,
+        "N.FlocChannelBaffles": 5,
+        "S.FlocBaffle": 0.3085 * u.m,
+        "W.FlocChannel": 0.312 * u.m,
+        "L.FlocChannel": 1.851 * u.m,
+        "H.FlocChannel": 2.528 * u.m,
+        "FB": 0.1 * u.m,
+    }
+
+
+def sed_measurements():
+    """Returns the parsed measurements of a valid sedimentation tank"""
+    return {
+        "Flow": 1 * u.L,
+        "TempCelsius": 20,
+        "V.SedUp": 0.85 * u.mm,
+        "V.SedC": 0.12 * u.mm,
+        "ID.SedManifold": 0.085 * u.m,
+        "HL.Diffuser": 0.05 * u.m,
+        "Pi.QLaunderOrifices": 0.8,
+        "W.Sed": 1.06 * u.m,
+        "L.Sed": 1.193 * u.m,
+        "N.SedPlates": 32,
+        "L.SedPlate": 0.5 * u.m,
+        "W.SedPlate": 1.06 * u.m,
+        "T.SedPlate": 0.01 * u.m,
+        "AN.SedPlate": 60 * u.deg,
+        "S.SedPlate": 0.025 * u.m,
+        "W.SedDiffuserInner": 1 / 8 * u.inch,
+        "HL.SedLaunderBod": 0.05 * u.m,
+        "D.SedLaunderOrifice": 0.015875 * u.m,
+        "N.SedLaunderOrifices": 10,
+    }
+
+
+def benchmarks(output_dir):
+    """Returns the benchmarks to run, each a function without arguments.
+    Checks write to a new ReportSection on every call so that reports don't
+    grow while they are timed.
+
+    Args:
+        output_dir: directory for the reports and PDFs written by benchmarks
+
+    Returns:
+        benchmarks: dictionary of function by benchmark name
+    """
+    import aide_validation.floc_validation as floc
+    import aide_validation.lfom_validation as lfom
+    import aide_validation.sed_validation as sed
+    from aide_validation.report_writer import ReportSection, ReportWriter
+    from aide_validation.validator import Validator
+
+    lfom_args = (
+        0.015875 * u.m,
+        lfom_measurements()["H.LfomOrifices"],
+        lfom_measurements()["N.LfomOrifices"],
+        0.05,
+        10 * u.L / u.s,
+    )
+    # one Flow overrides the others, so not every process is valid, but every
+    # check still runs
+    plant = {**lfom_measurements(), **floc_measurements(), **sed_measurements()}
+    validator = Validator(report_dir=output_dir)
+
+    # a report as long as one of a whole plant, to render as a PDF
+    pdf_writer = ReportWriter(output_dir=output_dir)
+    validator.validate_measurements(plant, ["ET", "Floc", "Sed"])
+    for section in validator.report_writer.sections:
+        pdf_writer.add_section(section)
+    message_writer = ReportWriter(output_dir=output_dir)
+
+    def write_message():
+        message_writer.write_message("The G Theta, 40000, was above 30000.\n")
+        if len(message_writer.records) > 1000:
+            message_writer.records.clear()
+
+    return {
+        "floc.check_baffle_spacing": lambda: floc.check_baffle_spacing(
+            1.851 * u.m, 0.3085 * u.m, ReportSection()
+        ),
+        "floc.check_G_theta": lambda: floc.check_G_theta(
+            30 * u.L / u.s,
+            1.851 * u.m,
+            2.428 * u.m,
+            8,
+            0.312 * u.m,
+            0.594365454 * u.m,
+            20 * u.degC,
+            ReportSection(),
+        ),
+        "sed.check_inlet_manifold": lambda: sed.check_inlet_manifold(
+            3 * u.inch, 0.8, 0.2856 * u.m / u.s, 1 * u.L / u.s, ReportSection()
+        ),
+        "sed.check_plate_settlers": lambda: sed.check_plate_settlers(
+            0.12 * u.mm / u.s,
+            26,
+            60 * u.cm,
+            42 * u.inch,
+            2.5 * u.cm,
+            60 * u.deg,
+            1 * u.mm,
+            1 * u.L / u.s,
+            ReportSection(),
+        ),
+        "sed.check_sed_tank": lambda: sed.check_sed_tank(
+            1.1 * u.m, 42 * u.inch, 0.85 * u.mm / u.s, 0.9 * u.L / u.s, ReportSection()
+        ),
+        "sed.check_diffuser": lambda: sed.check_diffuser(
+            42 * u.inch,
+            1 / 8 * u.inch,
+            0.85 * u.mm / u.s,
+            1 * u.cm,
+            20 * u.degC,
+            ReportSection(),
+        ),
+        "sed.check_outlet_manifold": lambda: sed.check_outlet_manifold(
+            9, 0.015875 * u.m, 0.05 * u.m, 1 * u.L / u.s, ReportSection()
+        ),
+        "lfom.check_flow_lfom_vert": lambda: lfom.check_flow_lfom_vert(
+            *lfom_args, ReportSection()
+        ),
+        "lfom.check_lfom_rating_curve": lambda: lfom.check_lfom_rating_curve(
+            *lfom_args, ReportSection()
+        ),
+        "ReportWriter.write_message": write_message,
+        "ReportWriter.to_text": pdf_writer.to_text,
+        "ReportWriter.to_pdf": pdf_writer.to_pdf,
+        "Validator.validate_lfom": lambda: validator.validate_lfom(
+            lfom_measurements(), ReportSection()
+        ),
+        "Validator.validate_floc": lambda: validator.validate_floc(
+            floc_measurements(), ReportSection()
+        ),
+        "Validator.validate_sed": lambda: validator.validate_sed(
+            sed_measurements(), ReportSection()
+        ),
+        "Validator.validate_measurements": lambda: Validator(
+            report_dir=output_dir
+        ).validate_measurements(plant, ["ET", "Floc", "Sed"]),
+    }
+
+
+def run_benchmark(name, func, min_time=1.0, max_iterations=100000):
+    """Times func until min_time has passed, then measures the peak memory of
+    one more call with tracemalloc, which would slow down the timed calls.
+
+    Args:
+        name: name of the benchmark (string)
+
+        func: function without arguments to benchmark
+
+        min_time: minimum number of seconds to spend timing. Defaults to 1.0
+
+        max_iterations: maximum number of timed calls. Defaults to 100000
+
+    Returns:
+        result: BenchmarkResult
+    """
+    # warm up caches and lazy imports
+    func()
+
+    latencies = []
+    start = time.perf_counter()
+    while len(latencies) < max_iterations:
+        call_start = time.perf_counter()
+        func()
+        call_end = time.perf_counter()
+        latencies.append(call_end - call_start)
+        if call_end - start >= min_time:
+            break
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies = np.array(latencies)
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+    return BenchmarkResult(
+        name,
+        len(latencies),
+        len(latencies) / latencies.sum(),
+        latencies.mean(),
+        p50,
+        p90,
+        p99,
+        peak_memory,
+    )
+
+
+def run_benchmarks(pattern="*", min_time=1.0, output_dir=None):
+    """Runs every benchmark whose name matches pattern
+
+    Args:
+        pattern: fnmatch pattern of benchmark names. Defaults to "*"
+
+        min_time: minimum number of seconds to spend timing each benchmark.
+            Defaults to 1.0
+
+        output_dir: directory for the reports written by benchmarks. Defaults
+            to None which uses a temporary directory
+
+    Returns:
+        results: list of BenchmarkResult
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_dir = tmp_dir if output_dir is None else output_dir
+        return [
+            run_benchmark(name, func, min_time)
+            for name, func in benchmarks(output_dir).items()
+            if fnmatch.fnmatch(name, pattern)
+        ]
+
+
+def save_baseline(results, path):
+    """Saves benchmark results to a JSON baseline file
+
+    Args:
+        results: list of BenchmarkResult
+
+        path: path of the JSON file
+
+    Returns:
+        none
+    """
+    baseline = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {
+            result.name: {
+                field: float(value) if field != "iterations" else value
+                for field, value in result._asdict().items()
+                if field != "name"
+            }
+            for result in results
+        },
+    }
+    with open(path, "w") as file:
+        json.dump(baseline, file, indent=2)
+
+
+def load_baseline(path):
+    """Loads benchmark results from a JSON baseline file
+
+    Args:
+        path: path of the JSON file
+
+    Returns:
+        results: dictionary of BenchmarkResult by benchmark name
+    """
+    with open(path, "r") as file:
+        baseline = json.load(file)
+    return {
+        name: BenchmarkResult(name=name, **fields)
+        for name, fields in baseline["results"].items()
+    }
+
+
+def compare(results, baseline, tolerance=0.1):
+    """Compares benchmark results to a baseline
+
+    Args:
+        results: list of BenchmarkResult
+
+        baseline: dictionary of BenchmarkResult by benchmark name
+
+        tolerance: fraction by which throughput may drop before it counts as
+            a regression. Defaults to 0.1
+
+    Returns:
+        changes: list of (name, change in ops/sec as a fraction of the
+        baseline, whether it is a regression) for benchmarks in the baseline
+    """
+    changes = []
+    for result in results:
+        if result.name not in baseline:
+            continue
+        old = baseline[result.name].ops_per_sec
+        change = (result.ops_per_sec - old) / old
+        changes.append((result.name, change, change < -tolerance))
+    return changes
+
+
+def format_results(results):
+    """Formats benchmark results as a table
+
+    Args:
+        results: list of BenchmarkResult
+
+    Returns:
+        table: text table (string)
+    """
+    lines = [
+        "{:<34} {:>12} {:>10} {:>10} {:>10} {:>10}".format(
+            "benchmark", "ops/sec", "p50 (ms)", "p90 (ms)", "p99 (ms)", "peak (KiB)"
+        )
+    ]
+    for result in results:
+        lines.append(
+            "{:<34} {:>12.1f} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.1f}".format(
+                result.name,
+                result.ops_per_sec,
+                result.p50 * 1000,
+                result.p90 * 1000,
+                result.p99 * 1000,
+                result.peak_memory / 1024,
+            )
+        )
+    return "\n".join(lines)
+
+
+def main(args=None):
+    """Runs the benchmarks from the command line
+
+    Args:
+        args: command line arguments. Defaults to None which uses sys.argv
+
+    Returns:
+        status: 1 if a benchmark regressed against the baseline, else 0
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", default="*", help="fnmatch pattern")
+    parser.add_argument("--min-time", type=float, default=1.0)
+    parser.add_argument("--save", help="save results to this JSON baseline")
+    parser.add_argument("--compare", help="compare results to this JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args(args)
+
+    results = run_benchmarks(args.filter, args.min_time)
+    print(format_results(results))
+
+    status = 0
+    if args.compare is not None:
+        print()
+        for name, change, regressed in compare(
+            results, load_baseline(args.compare), args.tolerance
+        ):
+            print(
+                "{:<34} {:>+8.1%}{}".format(
+                    name, change, "  REGRESSION" if regressed else ""
+                )
+            )
+            status = status or int(regressed)
+    if args.save is not None:
+        directory = os.path.dirname(args.save)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        save_baseline(results, args.save)
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
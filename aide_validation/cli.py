@@ -0,0 +1,229 @@
+"""Command line interface to validate many Onshape models.
+Created on October 18, 2026
+
+aide-validate reads URLs from its arguments, from a file, or from standard
+input, validates them concurrently and writes one JSON object per line to
+standard output as each validation finishes:
+
+    aide-validate --concurrency 8 --cache-dir .cache < urls.txt > results.jsonl
+
+Each line has the URL, its position in the input, the result, and the paths
+of the reports written for it. URLs are read as they are needed and at most
+a few validations per worker are in flight, so memory use doesn't grow with
+the number of URLs. Blank lines and lines starting with # are skipped.
+
+The exit status is 0 if every model is valid and 1 otherwise.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from aide_validation.measurement_cache import MeasurementCache
+from aide_validation.report_writer import REPORT_DIR
+from aide_validation.validator import Validator
+
+# report formats written besides the text report
+REPORT_FORMATS = ["pdf", "json"]
+# validations in flight per worker, so that a worker never waits for the
+# next URL to be read
+PENDING_PER_WORKER = 2
+
+
+def read_urls(lines):
+    """Returns the URLs in lines of text, skipping blank lines and comments
+
+    Args:
+        lines: lines of text (iterable of strings)
+
+    Returns:
+        urls: generator of URLs (strings)
+    """
+    for line in lines:
+        url = line.strip()
+        if url and not url.startswith("#"):
+            yield url
+
+
+def validate_url(url, formats=("pdf",), **validator_kwargs):
+    """Validates one Onshape model. Errors fetching or validating it are
+    reported as an Error result instead of raised.
+
+    Args:
+        url: URL of Onshape model to validate (string)
+
+        formats: report formats to write besides the text report, from
+            REPORT_FORMATS. Defaults to ("pdf",)
+
+        validator_kwargs: passed to the Validator
+
+    Returns:
+        line: JSON-compatible dictionary with the URL, result and the path of
+        each report written
+    """
+    start = time.perf_counter()
+    validator = Validator(pdf="pdf" in formats, **validator_kwargs)
+    report_writer = validator.report_writer
+    try:
+        result = validator.validate(url)
+        pdf = result.pdf.result()
+    except Exception as e:
+        report_writer.set_result("Error: {}".format(e))
+        pdf = validator.save_pdf().result()
+
+    json_name = None
+    if "json" in formats:
+        json_name = os.path.splitext(report_writer.report_name)[0] + ".json"
+        with open(json_name, "w") as json_file:
+            json_file.write(report_writer.to_json())
+
+    return {
+        "url": url,
+        "result": report_writer.get_result(),
+        "report": report_writer.report_name,
+        "pdf": pdf,
+        "json": json_name,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def validate_stream(urls, concurrency=8, **kwargs):
+    """Validates URLs concurrently, yielding each result as soon as it is
+    ready. Only concurrency * PENDING_PER_WORKER URLs are taken from urls
+    ahead of the results.
+
+    Args:
+        urls: URLs of Onshape models to validate (iterable of strings)
+
+        concurrency: number of models validated at once. Default: 8
+
+        kwargs: passed to validate_url
+
+    Returns:
+        lines: generator of the dictionaries returned by validate_url, each
+        with the "index" of its URL in urls, in the order they finish
+    """
+    urls = iter(enumerate(urls))
+    max_pending = concurrency * PENDING_PER_WORKER
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = {}
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < max_pending:
+                try:
+                    index, url = next(urls)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[executor.submit(validate_url, url, **kwargs)] = index
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                line = {"index": pending.pop(future)}
+                line.update(future.result())
+                yield line
+
+
+def main(args=None, stdin=None, stdout=None):
+    """Validates the URLs given on the command line and writes the results as
+    JSON lines
+
+    Args:
+        args: command line arguments. Defaults to None which uses sys.argv
+
+        stdin: file to read URLs from when none are given. Defaults to None
+            which uses sys.stdin
+
+        stdout: file to write results to. Defaults to None which uses
+            sys.stdout
+
+    Returns:
+        status: 0 if every model is valid, otherwise 1
+    """
+    parser = argparse.ArgumentParser(
+        prog="aide-validate", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "urls", nargs="*", help="URLs to validate. - or none reads standard input"
+    )
+    parser.add_argument("-f", "--file", help="read URLs from this file, one per line")
+    parser.add_argument(
+        "-j",
+        "--concurrency",
+        type=int,
+        default=8,
+        help="number of models validated at once",
+    )
+    parser.add_argument("--cache-dir", help="cache Onshape versions here")
+    parser.add_argument("--report-dir", default=REPORT_DIR)
+    parser.add_argument(
+        "--format",
+        dest="formats",
+        action="append",
+        choices=REPORT_FORMATS,
+        help="report format to write besides text, may be repeated. Defaults to pdf",
+    )
+    parser.add_argument("--no-pdf", action="store_true", help="don't write PDF reports")
+    parser.add_argument(
+        "--lfom-rating-curve",
+        action="store_true",
+        help="also check the LFOM's flow over its whole range of water heights",
+    )
+    parser.add_argument(
+        "--sensitivity",
+        action="store_true",
+        help="add the sensitivity of each check to its measurements to JSON reports",
+    )
+    options = parser.parse_args(args)
+
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+    formats = set(options.formats or ["pdf"])
+    if options.no_pdf:
+        formats.discard("pdf")
+
+    sources = [url for url in options.urls if url != "-"]
+    file = None
+    if options.file is not None:
+        file = open(options.file)
+        sources.append(file)
+    if "-" in options.urls or (not options.urls and file is None):
+        sources.append(stdin)
+
+    def urls():
+        for source in sources:
+            if isinstance(source, str):
+                yield source
+            else:
+                yield from read_urls(source)
+
+    status = 0
+    try:
+        for line in validate_stream(
+            urls(),
+            concurrency=options.concurrency,
+            formats=formats,
+            cache=(
+                None
+                if options.cache_dir is None
+                else MeasurementCache(options.cache_dir)
+            ),
+            report_dir=options.report_dir,
+            lfom_rating_curve=options.lfom_rating_curve,
+            sensitivity=options.sensitivity,
+        ):
+            stdout.write(json.dumps(line) + "\n")
+            stdout.flush()
+            if line["result"] != "Valid":
+                status = 1
+    finally:
+        if file is not None:
+            file.close()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
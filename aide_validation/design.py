@@ -0,0 +1,162 @@
+"""Inverse design of the flocculator.
+Created on October 18, 2026
+
+When check_G_theta or check_baffle_spacing fails, the model has to be changed
+in Onshape and validated again. solve_floc answers which values of the baffle
+spacing, the number of baffles per channel and the channel width would pass
+both checks, each with the other measurements as they are:
+
+    intervals = solve_floc(measurements)
+    intervals["S.FlocBaffle"]  # Interval(low=0.3085, high=0.4792) in m
+
+Head loss and G theta are computed by the same graph nodes and sweep as
+Validator.validate_floc. The boundary where G theta reaches its minimum is
+found by bracketing: each step evaluates a geometric grid of points across
+the bracket at once and keeps the two points either side of the boundary,
+until they are within RTOL of each other.
+"""
+
+import functools
+import math
+from collections import namedtuple
+import numpy as np
+import aide_validation.sweep as sw
+from aide_validation.graph import CHECK_GRAPH, Evaluation
+from aide_validation.measurements import PROCESS_MEASUREMENTS, to_si_measurements
+
+# inclusive bounds of a feasible interval, as SI magnitudes. high is inf if
+# there is no upper bound.
+Interval = namedtuple("Interval", ["low", "high"])
+
+# range of the ratio of channel length to baffle spacing check_baffle_spacing
+# accepts
+BAFFLE_RATIO_MIN = 3
+BAFFLE_RATIO_MAX = 6
+# relative width at which a bracket is accepted
+RTOL = 1e-9
+# points evaluated across a bracket in each step
+BRACKET_POINTS = 64
+# how far from the measured value an unbounded search looks, as a factor
+SEARCH_FACTOR = 1e6
+
+
+def _G_theta_passed(m, key, values, min_G_theta=30000):
+    # whether check_G_theta passes with measurement key replaced by values
+    m = dict(m)
+    m[key] = values
+    evaluation = Evaluation(CHECK_GRAPH, m)
+    return sw.sweep_G_theta(
+        m["Flow"],
+        m["L.FlocChannel"],
+        evaluation.get("floc.design_water_height"),
+        m["N.FlocChannels"],
+        m["W.FlocChannel"],
+        evaluation.get("floc.headloss"),
+        m["TempCelsius"],
+        min_G_theta,
+    ).passed
+
+
+def bracket(passed, low, high, rtol=RTOL, points=BRACKET_POINTS):
+    """Narrows [low, high] around the boundary of a monotonic check
+
+    Args:
+        passed: function of an array of positive values returning whether the
+            check passes at each, which must differ at low and high
+
+        low, high: positive ends of the bracket
+
+        rtol: relative width of the returned bracket. Default: RTOL
+
+        points: points evaluated in each step. Default: BRACKET_POINTS
+
+    Returns:
+        low, high: ends of a bracket at most rtol wide, where passed is the
+        same as at the given low and high respectively
+    """
+    passed_low = passed(np.array([low]))[0]
+    while high / low - 1 > rtol:
+        values = np.geomspace(low, high, points)
+        # passed only changes once, so the points on the side of low come
+        # first
+        i = np.argmin(passed(values) == passed_low)
+        low, high = values[i - 1], values[i]
+    return low, high
+
+
+def _G_theta_bound(m, key, min_G_theta, low, high):
+    # largest value of key in [low, high] at which G theta passes, for keys
+    # G theta decreases with. None if it fails at low.
+    passed = functools.partial(_G_theta_passed, m, key, min_G_theta=min_G_theta)
+    at_ends = passed(np.array([low, high]))
+    if not at_ends[0]:
+        return None
+    elif at_ends[1]:
+        return high
+    return float(bracket(passed, low, high)[0])
+
+
+def solve_floc(measurements, min_G_theta=30000):
+    """Finds the values of the baffle spacing, number of baffles per channel
+    and channel width at which the flocculator passes check_baffle_spacing and
+    check_G_theta. Each is varied on its own, with the other measurements as
+    given.
+
+    Args:
+        measurements: dictionary of parsed variables of a flocculator
+
+        min_G_theta: minimum allowable G theta. Default: 30000
+
+    Returns:
+        intervals: dictionary of Interval by measurement key
+        ("S.FlocBaffle", "N.FlocChannelBaffles" and "W.FlocChannel"), or
+        None for a measurement no value of which passes. Bounds are SI
+        magnitudes and the number of baffles is a whole number.
+    """
+    m = to_si_measurements(measurements, PROCESS_MEASUREMENTS["Floc"])
+    channel_l = m["L.FlocChannel"]
+    baffle_s = m["S.FlocBaffle"]
+    ratio_passed = (
+        BAFFLE_RATIO_MIN * baffle_s <= channel_l <= BAFFLE_RATIO_MAX * baffle_s
+    )
+
+    intervals = {}
+    # G theta falls as the baffles get further apart
+    low = channel_l / BAFFLE_RATIO_MAX
+    high = _G_theta_bound(
+        m, "S.FlocBaffle", min_G_theta, low, channel_l / BAFFLE_RATIO_MIN
+    )
+    intervals["S.FlocBaffle"] = None if high is None else Interval(low, high)
+
+    # G theta falls as the channels get wider
+    width = m["W.FlocChannel"]
+    high = _G_theta_bound(
+        m, "W.FlocChannel", min_G_theta, width / SEARCH_FACTOR, width * SEARCH_FACTOR
+    )
+    if ratio_passed and high is not None:
+        high = math.inf if high == width * SEARCH_FACTOR else high
+        intervals["W.FlocChannel"] = Interval(0.0, high)
+    else:
+        intervals["W.FlocChannel"] = None
+
+    # G theta rises with the number of baffles. The bracket is searched for
+    # the number of baffle spaces per channel, which is positive.
+    def passed(spaces):
+        return _G_theta_passed(m, "N.FlocChannelBaffles", spaces - 1, min_G_theta)
+
+    spaces = m["N.FlocChannelBaffles"] + 1
+    if passed(np.array([1.0]))[0]:
+        baffles = 0
+    elif passed(np.array([spaces * SEARCH_FACTOR]))[0]:
+        high = float(bracket(passed, 1.0, spaces * SEARCH_FACTOR)[1])
+        # the first whole number which passes is the one above the bracket,
+        # or the one inside it
+        candidates = np.arange(max(math.ceil(high) - 1, 1), math.ceil(high) + 1)
+        baffles = int(candidates[np.argmax(passed(candidates))]) - 1
+    else:
+        baffles = None
+    if ratio_passed and baffles is not None:
+        intervals["N.FlocChannelBaffles"] = Interval(baffles, math.inf)
+    else:
+        intervals["N.FlocChannelBaffles"] = None
+    return intervals
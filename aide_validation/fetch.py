@@ -0,0 +1,312 @@
+"""Shared, rate limited fetches from the Onshape API.
+Created on October 18, 2026
+
+Setting up an Onshape client and its connections for every URL is slow, and
+a batch of many URLs sent at once gets throttled. OnshapeFetcher is a
+fetcher, like those of the recorder module, which:
+
+    - shares one onshape_client Client, and the pool of HTTP connections it
+      holds, among every fetch and thread
+    - fetches each document, version or workspace and element once at a
+      time. Callers which ask for one already in flight wait for the same
+      Future instead of sending another request.
+    - starts at most rate requests per second, with bursts of up to burst,
+      across all threads
+    - retries responses with status 429 or 5xx up to max_retries times,
+      waiting for the server's Retry-After or else backoff seconds, doubled
+      after each retry
+
+The Validator fetches with the OnshapeFetcher returned by default_fetcher
+unless it is given another fetcher. Without Onshape API keys configured, its
+client is configured like the one onshape_parser.get_parsed_measurements
+creates for each request, with the parser's own keys.
+"""
+
+import functools
+import os
+import threading
+import time
+from concurrent.futures import Future
+from aide_validation.measurement_cache import URL_PATTERN
+from aide_validation.recorder import eval_documenter
+
+# default requests started per second, and the size of a burst
+DEFAULT_RATE = 5.0
+DEFAULT_BURST = 5
+# default retries of a throttled or failed request, and the wait before the
+# first retry (s)
+DEFAULT_RETRIES = 5
+DEFAULT_BACKOFF = 0.5
+# longest wait between retries (s)
+MAX_BACKOFF = 30.0
+# file onshape_client reads API keys from
+KEYS_FILE = "~/.onshape_client_config.yaml"
+
+
+def request_key(url):
+    """Returns the key under which identical requests are coalesced: the
+    document, workspace/version/microversion and element of an Onshape URL
+
+    Args:
+        url: URL of Onshape model (string)
+
+    Returns:
+        key: tuple of IDs, or url if it isn't an Onshape element URL
+    """
+    match = URL_PATTERN.search(url)
+    if match is None:
+        return url
+    return match.group("did", "wvm", "wvmid", "eid")
+
+
+def is_retryable(error):
+    """Returns whether a failed request should be retried: the server
+    throttled it (429) or failed (5xx)
+
+    Args:
+        error: exception raised by the request. Errors of the Onshape API
+            have the HTTP status
+
+    Returns:
+        retryable: bool
+    """
+    status = getattr(error, "status", None)
+    return status == 429 or (status is not None and 500 <= status <= 599)
+
+
+def _retry_after(error):
+    # seconds the server asked to wait before retrying, or None
+    headers = getattr(error, "headers", None) or {}
+    try:
+        return max(float(headers.get("Retry-After")), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter(object):
+    """Token bucket which spaces out requests shared by many threads"""
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, sleep=time.sleep):
+        """
+        Args:
+            rate: requests per second. Default: DEFAULT_RATE
+
+            burst: requests which may start at once after a pause.
+                Default: DEFAULT_BURST
+
+            sleep: function to wait a number of seconds. Defaults to
+                time.sleep
+        """
+        self.rate = rate
+        self.burst = burst
+        self.sleep = sleep
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Waits until a request may start
+
+        Args:
+            none
+
+        Returns:
+            wait: seconds waited (float)
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            # each caller takes its token now, so callers which have to wait
+            # queue up in order
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate, 0.0)
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+
+class OnshapeFetcher(object):
+    """Fetcher which shares one Onshape client, coalesces identical requests,
+    limits the request rate and retries throttled requests"""
+
+    def __init__(
+        self,
+        client=None,
+        configuration=None,
+        rate_limiter=None,
+        max_retries=DEFAULT_RETRIES,
+        backoff=DEFAULT_BACKOFF,
+        request=eval_documenter,
+        sleep=time.sleep,
+    ):
+        """
+        Args:
+            client: onshape_client Client to use. Defaults to None which
+                creates one on the first fetch, configured from the
+                ONSHAPE_API_ACCESS_KEY and ONSHAPE_API_SECRET_KEY environment
+                variables or ~/.onshape_client_config.yaml
+
+            configuration: onshape_client configuration of the client created
+                on the first fetch, which takes precedence over the
+                environment and the keys file. Defaults to None which only
+                sets the base URL
+
+            rate_limiter: RateLimiter to start requests with. Defaults to None
+                which creates one with the default rate
+
+            max_retries: retries of a request with status 429 or 5xx.
+                Default: DEFAULT_RETRIES
+
+            backoff: seconds to wait before the first retry, if the server
+                doesn't say. Default: DEFAULT_BACKOFF
+
+            request: function of a client and URL returning the raw response.
+                Defaults to eval_documenter
+
+            sleep: function to wait a number of seconds. Defaults to
+                time.sleep
+        """
+        self.client = client
+        self.configuration = {"base_url": "https://cad.onshape.com"}
+        if configuration is not None:
+            self.configuration.update(configuration)
+        self.rate_limiter = RateLimiter() if rate_limiter is None else rate_limiter
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.request = request
+        self.sleep = sleep
+        # Future of each request in flight, by request_key
+        self.in_flight = {}
+        self.lock = threading.Lock()
+
+    def get_client(self):
+        """Returns the client every fetch shares, creating it if needed
+
+        Args:
+            none
+
+        Returns:
+            client: onshape_client Client
+        """
+        with self.lock:
+            if self.client is None:
+                from onshape_client import Client
+
+                self.client = Client(configuration=dict(self.configuration))
+            return self.client
+
+    def _fetch(self, url):
+        client = self.get_client()
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                return self.request(client, url)
+            except Exception as e:
+                if attempt == self.max_retries or not is_retryable(e):
+                    raise
+                wait = _retry_after(e)
+                if wait is None:
+                    wait = min(self.backoff * 2**attempt, MAX_BACKOFF)
+                self.sleep(wait)
+
+    def __call__(self, url):
+        key = request_key(url)
+        with self.lock:
+            future = self.in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self.in_flight[key] = Future()
+        if owner:
+            try:
+                future.set_result(self._fetch(url))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self.lock:
+                    del self.in_flight[key]
+        return future.result()
+
+
+def parser_configuration():
+    """Returns the configuration onshape_parser.get_parsed_measurements
+    creates its Client with, including the parser's API keys. It is read from
+    the parser's source, so that the keys are only kept there.
+
+    Args:
+        none
+
+    Returns:
+        configuration: dictionary of onshape_client configuration values
+    """
+    import ast
+    import inspect
+    import aguaclara.core.onshape_parser as par
+
+    tree = ast.parse(inspect.getsource(par.get_parsed_measurements))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "Client":
+            for keyword in node.keywords:
+                if keyword.arg == "configuration":
+                    return ast.literal_eval(keyword.value)
+    raise ValueError("onshape_parser doesn't configure a Client")
+
+
+def has_api_keys(keys_file=KEYS_FILE):
+    """Returns whether Onshape API keys, or OAuth credentials, are configured,
+    without creating an onshape_client Client
+
+    Args:
+        keys_file: onshape_client configuration file. Default: KEYS_FILE
+
+    Returns:
+        configured: bool
+    """
+    from onshape_client import Client
+
+    # the environment takes precedence over the file, as in Client
+    configuration = Client._get_configuration_from_keys_file(
+        os.path.expanduser(keys_file), None
+    )
+    configuration.update(Client._get_from_environment())
+    if configuration.get("access_token"):
+        return True
+    return any(
+        configuration.get(first) and configuration.get(second)
+        for first, second in [
+            ("client_id", "client_secret"),
+            ("access_key", "secret_key"),
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def default_fetcher():
+    """Returns the OnshapeFetcher shared by every Validator without a fetcher
+
+    Args:
+        none
+
+    Returns:
+        fetcher: OnshapeFetcher whose client uses the Onshape API keys
+        configured in the environment or KEYS_FILE, or else the keys of
+        onshape_parser
+    """
+    if has_api_keys():
+        return OnshapeFetcher()
+    return OnshapeFetcher(configuration=parser_configuration())
+
+
+def default_client():
+    """Returns the onshape_client Client of default_fetcher, creating it if
+    needed
+
+    Args:
+        none
+
+    Returns:
+        client: onshape_client Client
+    """
+    return default_fetcher().get_client()
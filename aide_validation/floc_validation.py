@@ -4,9 +4,9 @@ Created on January 6, 2021
 @author: fchapin@aguaclarareach.org
 """
 
-import math
-import aguaclara.core.physchem as pc
-import aguaclara.core.constants as con
+from aide_validation.units import u
+import aide_validation.kernels as k
+from aide_validation.report_writer import Display, ParsedUnit
 
 
 def check_baffle_spacing(channel_l, baffle_s, report_writer):
@@ -23,22 +23,43 @@ def check_baffle_spacing(channel_l, baffle_s, report_writer):
     Returns:
         none
     """
+    channel_l = k.to_si(channel_l, u.m)
+    baffle_s = k.to_si(baffle_s, u.m)
+
+    inputs = {"channel_l": channel_l, "baffle_s": baffle_s}
+    args = (
+        Display(channel_l, u.m, ParsedUnit({"L.FlocChannel": 1})),
+        Display(baffle_s, u.m, ParsedUnit({"S.FlocBaffle": 1})),
+    )
+
     try:
-        assert 3 <= channel_l / baffle_s
-        assert channel_l / baffle_s <= 6
+        ratio = k.baffle_ratio(channel_l, baffle_s)
+        assert 3 <= ratio
+        assert ratio <= 6
 
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_baffle_spacing",
             "Ratio of channel length, {!s}, "
             "to baffle spacing, {!s} "
             "was within the acceptable range "
-            "(between 3 and 6).\n".format(channel_l, baffle_s)
+            "(between 3 and 6).\n",
+            args,
+            inputs,
+            ratio,
+            (3, 6),
         )
     except AssertionError:
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_baffle_spacing",
             "INVALID: Ratio of channel length, {!s}, "
             "to baffle spacing, {!s} "
             "was not in the acceptable range "
-            "(between 3 and 6).\n".format(channel_l, baffle_s)
+            "(between 3 and 6).\n",
+            args,
+            inputs,
+            ratio,
+            (3, 6),
+            passed=False,
         )
         report_writer.set_result("Invalid: Check Validation Report")
 
@@ -80,19 +101,35 @@ def check_G_theta(
     Returns:
         none
     """
+    inputs = {
+        "q": k.to_si(q, u.m**3 / u.s),
+        "channel_l": k.to_si(channel_l, u.m),
+        "design_water_height": k.to_si(design_water_height, u.m),
+        "channel_n": channel_n,
+        "channel_w": k.to_si(channel_w, u.m),
+        "hl": k.to_si(hl, u.m),
+        "temp": k.to_si(temp, u.K),
+    }
+
     try:
-        theta = (channel_l * design_water_height * channel_n * channel_w) / q
-        G_theta = math.sqrt(
-            con.GRAVITY * hl * theta / pc.viscosity_kinematic_water(temp)
-        )
+        G_theta = k.G_theta(**inputs)
         assert G_theta > min_G_theta
-        report_writer.write_message(
-            "The G Theta, {!s}, was above the minimum "
-            "value of {!s}.\n".format(G_theta, min_G_theta)
+        report_writer.write_check(
+            "check_G_theta",
+            "The G Theta, {!s}, was above the minimum value of {!s}.\n",
+            (G_theta, min_G_theta),
+            inputs,
+            G_theta,
+            min_G_theta,
         )
     except AssertionError:
-        report_writer.write_message(
-            "INVALID: G Theta, {!s}, was below the minimum "
-            "value of {!s}.\n".format(G_theta, min_G_theta)
+        report_writer.write_check(
+            "check_G_theta",
+            "INVALID: G Theta, {!s}, was below the minimum value of {!s}.\n",
+            (G_theta, min_G_theta),
+            inputs,
+            G_theta,
+            min_G_theta,
+            passed=False,
         )
         report_writer.set_result("Invalid: Check Validation Report")
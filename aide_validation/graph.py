@@ -0,0 +1,342 @@
+"""Dependency graph of the validation checks.
+Created on October 18, 2026
+
+Each check, and each quantity derived from the measurements before a check
+runs, is a Node declared with the names of the measurements and nodes it is
+computed from. An Evaluation computes each node at most once, only when a
+requested check needs it, and can run independent nodes concurrently:
+
+    evaluation = Evaluation(CHECK_GRAPH, si_measurements)
+    evaluation.evaluate(["check_G_theta", "check_baffle_spacing"])
+    section = evaluation.get("check_G_theta")
+
+Measurements are SI magnitudes, as returned by to_si_measurements. A check
+node writes to a new ReportSection, which becomes its value.
+"""
+
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, wait
+import aide_validation.kernels as k
+from aide_validation.floc_validation import check_baffle_spacing, check_G_theta
+from aide_validation.instrumentation import NULL_TIMINGS
+from aide_validation.lfom_validation import (
+    LFOM_TOLERANCE,
+    check_flow_lfom_vert,
+    check_lfom_rating_curve,
+)
+from aide_validation.report_writer import ReportSection
+from aide_validation.sed_validation import (
+    check_inlet_manifold,
+    check_outlet_manifold,
+    check_diffuser,
+    check_sed_tank,
+    check_plate_settlers,
+)
+
+# func is called with the value of each input in order, and check nodes are
+# also passed the ReportSection to write to
+Node = namedtuple("Node", ["name", "func", "inputs", "check"])
+Node.__new__.__defaults__ = (False,)
+
+
+class CheckGraph(object):
+    """Checks and derived quantities, by name"""
+
+    def __init__(self, nodes):
+        """
+        Args:
+            nodes: Nodes of the graph (list). Inputs which aren't nodes are
+                measurements.
+        """
+        self.nodes = {node.name: node for node in nodes}
+        # raises ValueError if the graph has a cycle
+        self.dependencies(self.nodes)
+
+    @property
+    def checks(self):
+        """Names of the check nodes, in the order they were declared"""
+        return [name for name, node in self.nodes.items() if node.check]
+
+    def dependencies(self, names):
+        """Returns the nodes the given nodes are computed from, including
+        themselves, ordered so that each node comes after its inputs
+
+        Args:
+            names: names of nodes (iterable of strings)
+
+        Returns:
+            names: list of node names
+        """
+        order = []
+        visiting = set()
+
+        def visit(name):
+            if name in order or name not in self.nodes:
+                return
+            if name in visiting:
+                raise ValueError("{} depends on itself".format(name))
+            visiting.add(name)
+            for input in self.nodes[name].inputs:
+                visit(input)
+            visiting.discard(name)
+            order.append(name)
+
+        for name in names:
+            visit(name)
+        return order
+
+    def measurements(self, name):
+        """Returns the measurements a node depends on, directly or through
+        other nodes
+
+        Args:
+            name: name of node (string)
+
+        Returns:
+            keys: measurement keys in order of first use (list of strings)
+        """
+        keys = []
+        for dependency in self.dependencies([name]):
+            for input in self.nodes[dependency].inputs:
+                if input not in self.nodes and input not in keys:
+                    keys.append(input)
+        return keys
+
+
+class Evaluation(object):
+    """Values of the nodes of a CheckGraph for one set of measurements"""
+
+    def __init__(
+        self, graph, measurements, executor=None, timings=NULL_TIMINGS, units=None
+    ):
+        """
+        Args:
+            graph: CheckGraph to evaluate
+
+            measurements: dictionary of SI magnitudes by measurement key
+
+            executor: concurrent.futures executor to run independent nodes in
+                at the same time. Defaults to None which runs them in turn
+
+            timings: Timings to record a span named after each node in.
+                Defaults to NULL_TIMINGS
+
+            units: dictionary of the unit each measurement was parsed in, as
+                filled in by to_si_measurements, to show them in. Defaults to
+                None which shows them in their fallback units
+        """
+        self.graph = graph
+        self.executor = executor
+        self.timings = timings
+        self.units = {} if units is None else units
+        # measurements and the nodes computed so far
+        self.values = dict(measurements)
+        # exception raised by each node which failed
+        self.errors = {}
+
+    def _run(self, name):
+        node = self.graph.nodes[name]
+        try:
+            for input in node.inputs:
+                if input in self.errors:
+                    raise self.errors[input]
+            args = [self.values[input] for input in node.inputs]
+            with self.timings.span(name):
+                if node.check:
+                    section = ReportSection()
+                    section.units = self.units
+                    node.func(*args, section)
+                    self.values[name] = section
+                else:
+                    self.values[name] = node.func(*args)
+        except Exception as e:
+            self.errors[name] = e
+
+    def evaluate(self, names):
+        """Computes the given nodes and the nodes they need which haven't
+        been computed yet. Errors are kept until the node is read with get.
+
+        Args:
+            names: names of nodes (iterable of strings)
+
+        Returns:
+            none
+        """
+        pending = [
+            name
+            for name in self.graph.dependencies(names)
+            if name not in self.values and name not in self.errors
+        ]
+        if self.executor is None:
+            for name in pending:
+                self._run(name)
+            return
+
+        # inputs of each pending node which are still to be computed
+        waiting = {
+            name: set(self.graph.nodes[name].inputs).intersection(pending)
+            for name in pending
+        }
+        running = {}
+        while waiting or running:
+            for name in [name for name, inputs in waiting.items() if not inputs]:
+                del waiting[name]
+                running[self.executor.submit(self._run, name)] = name
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                for inputs in waiting.values():
+                    inputs.discard(name)
+
+    def get(self, name):
+        """Returns the value of a node, computing it if needed
+
+        Args:
+            name: name of node (string)
+
+        Returns:
+            value: value of the node, or the ReportSection of a check
+
+        Raises:
+            the exception the node, or one of its inputs, raised
+        """
+        self.evaluate([name])
+        if name in self.errors:
+            raise self.errors[name]
+        return self.values[name]
+
+
+def _baffle_k():
+    # a class attribute, so no Flocculator has to be built
+    from aguaclara.design.floc import Flocculator
+
+    return Flocculator.BAFFLE_K
+
+
+def _difference(a, b):
+    return a - b
+
+
+def _lfom_tolerance():
+    return LFOM_TOLERANCE
+
+
+_LFOM_INPUTS = ["D.LfomOrifices", "H.LfomOrifices", "N.LfomOrifices", "lfom.tolerance"]
+
+CHECK_GRAPH = CheckGraph(
+    [
+        # LFOM
+        Node("lfom.tolerance", _lfom_tolerance, []),
+        Node(
+            "check_flow_lfom_vert", check_flow_lfom_vert, _LFOM_INPUTS + ["Flow"], True
+        ),
+        Node(
+            "check_lfom_rating_curve",
+            check_lfom_rating_curve,
+            _LFOM_INPUTS + ["Flow"],
+            True,
+        ),
+        # flocculator
+        Node("floc.baffle_k", _baffle_k, []),
+        # estimate head loss with minor loss equation and coefficient for baffles
+        Node(
+            "floc.headloss",
+            k.headloss_floc,
+            [
+                "Flow",
+                "S.FlocBaffle",
+                "W.FlocChannel",
+                "N.FlocChannels",
+                "N.FlocChannelBaffles",
+                "floc.baffle_k",
+            ],
+        ),
+        Node("floc.design_water_height", _difference, ["H.FlocChannel", "FB"]),
+        Node(
+            "check_G_theta",
+            check_G_theta,
+            [
+                "Flow",
+                "L.FlocChannel",
+                "floc.design_water_height",
+                "N.FlocChannels",
+                "W.FlocChannel",
+                "floc.headloss",
+                "TempCelsius",
+            ],
+            True,
+        ),
+        Node(
+            "check_baffle_spacing",
+            check_baffle_spacing,
+            ["L.FlocChannel", "S.FlocBaffle"],
+            True,
+        ),
+        # sedimentation tank
+        Node(
+            "sed.vel_diffuser",
+            k.vel_diffuser,
+            ["V.SedUp", "W.Sed", "W.SedDiffuserInner"],
+        ),
+        Node(
+            "check_diffuser",
+            check_diffuser,
+            ["W.Sed", "W.SedDiffuserInner", "V.SedUp", "HL.Diffuser", "TempCelsius"],
+            True,
+        ),
+        Node(
+            "check_inlet_manifold",
+            check_inlet_manifold,
+            ["ID.SedManifold", "Pi.QLaunderOrifices", "sed.vel_diffuser", "Flow"],
+            True,
+        ),
+        Node(
+            "check_plate_settlers",
+            check_plate_settlers,
+            [
+                "V.SedC",
+                "N.SedPlates",
+                "L.SedPlate",
+                "W.SedPlate",
+                "S.SedPlate",
+                "AN.SedPlate",
+                "T.SedPlate",
+                "Flow",
+            ],
+            True,
+        ),
+        Node(
+            "check_sed_tank",
+            check_sed_tank,
+            ["L.Sed", "W.Sed", "V.SedUp", "Flow"],
+            True,
+        ),
+        Node(
+            "check_outlet_manifold",
+            check_outlet_manifold,
+            ["N.SedLaunderOrifices", "D.SedLaunderOrifice", "HL.SedLaunderBod", "Flow"],
+            True,
+        ),
+    ]
+)
+
+# checks of each Onshape Documenter unit process, in report order. The LFOM
+# rating curve is only checked when the Validator is asked to.
+PROCESS_CHECKS = {
+    "ET": ["check_flow_lfom_vert", "check_lfom_rating_curve"],
+    "Floc": ["check_G_theta", "check_baffle_spacing"],
+    "Sed": [
+        "check_diffuser",
+        "check_inlet_manifold",
+        "check_plate_settlers",
+        "check_sed_tank",
+        "check_outlet_manifold",
+    ],
+}
+
+# measurements each check depends on, including through the quantities
+# derived from them, so that a check only needs to run again when one of
+# them changes
+CHECK_MEASUREMENTS = {
+    check: CHECK_GRAPH.measurements(check) for check in CHECK_GRAPH.checks
+}
@@ -0,0 +1,136 @@
+"""Incremental revalidation of Onshape models which change between validations.
+Created on October 18, 2026
+
+A Validator given a RevalidationCache remembers the measurements and check
+results of the last validation of each Onshape element. When the element is
+validated again, only the checks which depend on a changed measurement, as
+declared in CHECK_MEASUREMENTS, run again. The results of the other checks
+are copied into the new report. Each validation has a Validator, and so a
+report, of its own, and they share the RevalidationCache:
+
+    revalidation = RevalidationCache()
+    Validator(revalidation=revalidation).validate(url)
+    # after S.FlocBaffle is changed in Onshape, only check_baffle_spacing and
+    # check_G_theta run
+    Validator(revalidation=revalidation).validate(url)
+"""
+
+import threading
+import numpy as np
+from aide_validation.measurement_cache import URL_PATTERN
+from aide_validation.graph import CHECK_MEASUREMENTS
+
+
+def element_key(url):
+    """Returns the document and element an Onshape URL points to. Workspaces,
+    versions and microversions of the same element share a key, so that each
+    one is compared to the last one validated.
+
+    Args:
+        url: URL of Onshape model (string)
+
+    Returns:
+        key: (document ID, element ID), or url if it isn't an Onshape URL
+    """
+    match = URL_PATTERN.search(url)
+    if match is None:
+        return url
+    return match.group("did"), match.group("eid")
+
+
+def _equal(a, b):
+    # measurements are quantities, numbers or lists of either. Quantities in
+    # different units are equal when they convert to the same value.
+    try:
+        return bool(np.all(a == b))
+    except Exception:
+        return False
+
+
+def changed_measurements(old, new):
+    """Returns the measurements which were added, removed or changed
+
+    Args:
+        old: dictionary of previously parsed variables
+
+        new: dictionary of parsed variables
+
+    Returns:
+        changed: set of measurement keys
+    """
+    changed = set(old).symmetric_difference(new)
+    changed.update(
+        key for key in set(old).intersection(new) if not _equal(old[key], new[key])
+    )
+    return changed
+
+
+def records_by_check(sections):
+    """Groups the records of report sections by the check which wrote them.
+    Plain messages are left out.
+
+    Args:
+        sections: ReportSections (list)
+
+    Returns:
+        records: dictionary of lists of CheckRecords by check name
+    """
+    records = {}
+    for section in sections:
+        for record in section.records:
+            if record.check is not None:
+                records.setdefault(record.check, []).append(record)
+    return records
+
+
+class RevalidationCache(object):
+    """Remembers the last validation of each Onshape element in memory"""
+
+    def __init__(self):
+        # element key -> (measurements, records by check)
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def reusable(self, url, measurements):
+        """Returns the results of the last validation of url which are still
+        valid for the given measurements
+
+        Args:
+            url: URL of Onshape model (string)
+
+            measurements: dictionary of parsed variables
+
+        Returns:
+            records: dictionary of lists of CheckRecords by the name of each
+            check which doesn't need to run again. Empty if url hasn't been
+            validated.
+        """
+        with self.lock:
+            entry = self.entries.get(element_key(url))
+        if entry is None:
+            return {}
+        previous, records = entry
+        changed = changed_measurements(previous, measurements)
+        return {
+            check: check_records
+            for check, check_records in records.items()
+            # checks without declared measurements depend on all of them
+            if changed.isdisjoint(CHECK_MEASUREMENTS.get(check, changed))
+        }
+
+    def put(self, url, measurements, sections):
+        """Remembers the measurements and results of a validation of url
+
+        Args:
+            url: URL of Onshape model (string)
+
+            measurements: dictionary of parsed variables
+
+            sections: ReportSections the results were written to (list)
+
+        Returns:
+            none
+        """
+        entry = (dict(measurements), records_by_check(sections))
+        with self.lock:
+            self.entries[element_key(url)] = entry
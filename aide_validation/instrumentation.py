@@ -0,0 +1,208 @@
+"""Timing instrumentation and profiling hooks for the Validator.
+Created on October 18, 2026
+
+A Validator given a Timings object records a span for each phase of a
+validation: the Onshape fetch, measurement parsing, unit conversion, each
+check and the report. The Timings are attached to the result:
+
+    validator = Validator(timings=Timings(trace_path="trace.jsonl"))
+    result = validator.validate(url)
+    result.timings.totals()  # seconds spent in each phase
+
+Validators without Timings use NULL_TIMINGS, whose spans do nothing.
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+
+# start is in seconds since the Timings were created
+Span = namedtuple("Span", ["name", "start", "duration", "thread"])
+
+# trace files may be shared by the Timings of many validators
+_trace_lock = threading.Lock()
+
+
+class _NullSpan(object):
+    # context manager which does nothing, shared by every disabled span
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullTimings(object):
+    """Timings which record nothing, for when instrumentation is disabled"""
+
+    enabled = False
+    profiling = False
+
+    def span(self, name):
+        return _NULL_SPAN
+
+    def profiled(self):
+        return _NULL_SPAN
+
+    def copy(self):
+        return self
+
+
+NULL_TIMINGS = NullTimings()
+
+
+class Timings(object):
+    """Records how long each phase of a validation takes"""
+
+    enabled = True
+
+    def __init__(self, trace_path=None, profile=False, trace_memory=False):
+        """
+        Args:
+            trace_path: path of a JSON-lines file to append each span to.
+                Defaults to None which doesn't write a trace
+
+            profile: run the validation under cProfile. Unit processes are
+                then validated one at a time, since cProfile only sees the
+                thread it was started in. Defaults to False
+
+            trace_memory: record the peak memory of the validation with
+                tracemalloc. Defaults to False
+        """
+        self.trace_path = trace_path
+        self.profiling = profile
+        self.trace_memory = trace_memory
+        self.origin = time.perf_counter()
+        self.spans = []
+        self.lock = threading.Lock()
+        # set by profiled
+        self.profile_stats = None
+        self.memory_peak = None
+        self._depth = 0
+
+    def copy(self):
+        """Returns new, empty Timings with the same settings
+
+        Args:
+            none
+
+        Returns:
+            timings: Timings
+        """
+        return Timings(self.trace_path, self.profiling, self.trace_memory)
+
+    @contextmanager
+    def span(self, name):
+        """Context manager which records how long its block takes
+
+        Args:
+            name: name of the phase (string)
+
+        Returns:
+            none
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            span = Span(
+                name,
+                start - self.origin,
+                time.perf_counter() - start,
+                threading.current_thread().name,
+            )
+            with self.lock:
+                self.spans.append(span)
+            if self.trace_path is not None:
+                with _trace_lock, open(self.trace_path, "a") as trace:
+                    trace.write(json.dumps(span._asdict()) + "\n")
+
+    @contextmanager
+    def profiled(self):
+        """Context manager which profiles its block with cProfile and
+        tracemalloc, if enabled. Nested blocks are part of the outermost one.
+
+        Args:
+            none
+
+        Returns:
+            none
+        """
+        self._depth += 1
+        if self._depth > 1:
+            try:
+                yield
+            finally:
+                self._depth -= 1
+            return
+
+        profiler = cProfile.Profile() if self.profiling else None
+        traced = self.trace_memory and not tracemalloc.is_tracing()
+        if traced:
+            tracemalloc.start()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self.profile_stats = pstats.Stats(profiler)
+            if traced:
+                self.memory_peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            self._depth -= 1
+
+    def totals(self):
+        """Returns the total duration of each phase
+
+        Args:
+            none
+
+        Returns:
+            totals: dictionary of seconds by span name, in order of first use
+        """
+        totals = {}
+        for span in self.spans:
+            totals[span.name] = totals.get(span.name, 0) + span.duration
+        return totals
+
+    def profile_report(self, limit=20):
+        """Returns the functions which took the most cumulative time
+
+        Args:
+            limit: number of functions to list. Defaults to 20
+
+        Returns:
+            report: pstats output (string), or None if not profiled
+        """
+        if self.profile_stats is None:
+            return None
+        stream = io.StringIO()
+        self.profile_stats.stream = stream
+        self.profile_stats.sort_stats("cumulative").print_stats(limit)
+        return stream.getvalue()
+
+    def as_dict(self):
+        """Returns the spans, totals and peak memory as JSON-compatible types
+
+        Args:
+            none
+
+        Returns:
+            timings: dictionary
+        """
+        return {
+            "spans": [span._asdict() for span in self.spans],
+            "totals": self.totals(),
+            "memory_peak": self.memory_peak,
+        }
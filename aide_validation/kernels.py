@@ -0,0 +1,217 @@
+"""Unit-free kernels for the validation checks.
+Created on October 18, 2026
+
+Each kernel takes plain floats or NumPy arrays in SI base units (m, s, kg, K,
+rad) and returns results in SI base units, broadcasting over array inputs.
+Inputs are converted with to_si once, where measurements enter the Validator,
+and units are only reattached with from_si to format report text.
+"""
+
+import numpy as np
+from aide_validation.units import u
+
+# kernels use the water properties of the water module, which are exact for
+# single temperatures and interpolated in tables for arrays
+from aide_validation.water import density_water, viscosity_kinematic_water
+
+# aguaclara.core.constants GRAVITY (m / s^2) and VC_ORIFICE_RATIO, repeated
+# here so that importing the kernels doesn't import aguaclara
+GRAVITY = 9.80665
+VC_ORIFICE_RATIO = 0.63
+
+
+def to_si(value, unit):
+    """Returns the magnitude of a measurement in the given SI unit. Sequences
+    become NumPy arrays and values without units are assumed to already be SI.
+
+    Args:
+        value: quantity, number, or sequence of either
+
+        unit: SI unit to convert to (e.g. u.m)
+
+    Returns:
+        magnitude: float or NumPy array in the given unit
+    """
+    if isinstance(value, u.Quantity):
+        return value.to(unit).magnitude
+    elif isinstance(value, (list, tuple)):
+        return np.array([to_si(item, unit) for item in value])
+    return value
+
+
+def from_si(value, unit, display_unit=None):
+    """Reattaches units to an SI magnitude so it can be written in a report
+
+    Args:
+        value: SI magnitude (float or NumPy array)
+
+        unit: SI unit of value (e.g. u.m)
+
+        display_unit: unit to display value in. Defaults to None which
+            keeps the SI unit
+
+    Returns:
+        quantity: value with units attached
+    """
+    quantity = value * unit
+    if display_unit is not None:
+        quantity = quantity.to(display_unit)
+    return quantity
+
+
+def baffle_ratio(channel_l, baffle_s):
+    """Returns the ratio of flocculator channel length to baffle spacing"""
+    return channel_l / baffle_s
+
+
+def headloss_floc(q, baffle_s, channel_w, channel_n, baffle_n_per_chan, baffle_k):
+    """Returns the head loss (m) through a flocculator, estimated with the minor
+    loss equation and a loss coefficient of baffle_k for each baffle space"""
+    spaces_n = (baffle_n_per_chan + 1) * channel_n
+    k_minor = baffle_k * spaces_n
+    vel = q / (baffle_s * channel_w)
+    return k_minor * vel**2 / (2 * GRAVITY)
+
+
+def G_theta(q, channel_l, design_water_height, channel_n, channel_w, hl, temp):
+    """Returns the collision potential G theta of a flocculator"""
+    theta = (channel_l * design_water_height * channel_n * channel_w) / q
+    return np.sqrt(GRAVITY * hl * theta / viscosity_kinematic_water(temp))
+
+
+def _flow_orifice_vert(diam, height):
+    # integrate the flow through horizontal slices of a vertical orifice
+    from scipy import integrate
+
+    if height <= -diam / 2:
+        return 0.0
+    flow_vert = integrate.quad(
+        lambda z: diam * np.sin(np.arccos(z / (diam / 2))) * np.sqrt(height - z),
+        -diam / 2,
+        min(diam / 2, height),
+    )
+    return flow_vert[0]
+
+
+_flow_orifice_vert_array = np.vectorize(_flow_orifice_vert, otypes=[float])
+
+
+def flow_orifice_vert(diam, height, ratio_vc=VC_ORIFICE_RATIO):
+    """Returns the flow (m^3 / s) through a vertical orifice of diameter diam
+    with water height (m) above its center"""
+    # same order of operations as aguaclara so results match to the last bit
+    flow = _flow_orifice_vert_array(diam, height) * ratio_vc * np.sqrt(2)
+    return flow * np.sqrt(GRAVITY)
+
+
+def _chebyshev_nodes(n):
+    # Gauss-Chebyshev quadrature of the second kind, exact for
+    # integral(sqrt(1 - x^2) * p(x), -1, 1) where p is a polynomial of degree < 2n
+    i = np.arange(1, n + 1)
+    nodes = np.cos(i * np.pi / (n + 1))
+    weights = np.pi / (n + 1) * np.sin(i * np.pi / (n + 1)) ** 2
+    return nodes, weights
+
+
+_CHEBYSHEV_NODES, _CHEBYSHEV_WEIGHTS = _chebyshev_nodes(32)
+
+
+def flow_orifice_vert_array(diam, height, ratio_vc=VC_ORIFICE_RATIO):
+    """Vectorized version of flow_orifice_vert for large arrays of heights.
+
+    Both square root singularities at the ends of the submerged part of the
+    orifice are factored into a Gauss-Chebyshev weight, which leaves a smooth
+    integrand. With 32 nodes the flow differs from flow_orifice_vert by less
+    than 1e-6 times the flow through the orifice when the water is one
+    diameter above its center.
+    """
+    diam, height = np.broadcast_arrays(
+        np.asarray(diam, dtype=float), np.asarray(height, dtype=float)
+    )
+    radius = diam / 2
+    half = (np.clip(height, -radius, radius) + radius) / 2
+    top = np.maximum(radius, height)
+    z = -radius[..., None] + half[..., None] * (1 + _CHEBYSHEV_NODES)
+    flow = (
+        2 * half**2 * np.sum(_CHEBYSHEV_WEIGHTS * np.sqrt(top[..., None] - z), axis=-1)
+    )
+    return flow * ratio_vc * np.sqrt(2 * GRAVITY)
+
+
+def flow_lfom_vert(height, d_ori, h_ori, n_oris):
+    """Returns the flow (m^3 / s) through an LFOM with water height (m), given
+    the orifice diameter and the height and number of orifices in each row"""
+    flow_rows = flow_orifice_vert(d_ori, np.asarray(height)[..., None] - h_ori)
+    flow_rows = flow_rows * n_oris
+    # add the rows in order, like the built-in sum
+    flow = 0
+    for row in range(flow_rows.shape[-1]):
+        flow = flow + flow_rows[..., row]
+    return flow
+
+
+def flow_lfom_rows(heights, d_ori, h_ori, n_oris):
+    """Returns a (heights x rows) array of the flow (m^3 / s) through each row of
+    an LFOM at each water height (m), using flow_orifice_vert_array"""
+    heights = np.asarray(heights, dtype=float)[..., None]
+    return flow_orifice_vert_array(d_ori, heights - h_ori) * n_oris
+
+
+def flow_inlet_manifold(diam, pi_flow_manifold, vel_diffuser):
+    """Returns the flow (m^3 / s) an inlet manifold can carry while keeping the
+    ratio of port flows at pi_flow_manifold"""
+    return (
+        np.pi
+        * (
+            vel_diffuser
+            * np.sqrt(2 * (1 - pi_flow_manifold**2) / (pi_flow_manifold**2 + 1))
+        )
+        * diam**2
+    ) / 4
+
+
+def flow_plate_settlers(
+    vel_capture, n_plate, l_plate, w_plate, space_plate, angle_plate
+):
+    """Returns the flow (m^3 / s) plate settlers can treat at the capture
+    velocity, with angle_plate in radians"""
+    return vel_capture * (
+        n_plate
+        * w_plate
+        * (l_plate * np.cos(angle_plate) + (space_plate / np.sin(angle_plate)))
+    )
+
+
+def flow_sed_tank(length, width, vel_up):
+    """Returns the flow (m^3 / s) through a sed tank at the upflow velocity"""
+    return length * width * vel_up
+
+
+def vel_diffuser(vel_up, w_sed, w_diffuser):
+    """Returns the velocity (m / s) out of a sed tank diffuser"""
+    return vel_up * w_sed / w_diffuser
+
+
+def vel_max_shear(vel_up, w_sed, temp, shear_floc_max, pi_plane_jet):
+    """Returns the maximum diffuser velocity (m / s) that doesn't break flocs
+    with a shear stress above shear_floc_max (Pa)"""
+    rho = density_water(temp)
+    nu = viscosity_kinematic_water(temp)
+    return (shear_floc_max / rho) ** (1 / 2) * (
+        vel_up * w_sed / (nu * pi_plane_jet)
+    ) ** (1 / 4)
+
+
+def headloss_diffuser(vel_diffuser):
+    """Returns the head loss (m) of the jet leaving a diffuser"""
+    return vel_diffuser**2 / (2 * GRAVITY)
+
+
+def flow_outlet_manifold(n_orifices, diam_orifice, hl_design):
+    """Returns the flow (m^3 / s) through n_orifices orifices at head hl_design"""
+    flow = (
+        VC_ORIFICE_RATIO
+        * (np.pi / 4 * diam_orifice**2)
+        * np.sqrt(2 * GRAVITY * np.maximum(hl_design, 0))
+    )
+    return np.where(hl_design > 0, flow, 0.0)[()] * n_orifices
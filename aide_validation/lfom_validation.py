@@ -4,9 +4,14 @@ Created on September 18, 2020
 @author: jcs528@cornell.edu
 """
 
-from aguaclara.core.units import u
-import aguaclara.core.physchem as pc
-import aguaclara.core.constants as con
+import numpy as np
+from aide_validation.units import u
+import aide_validation.kernels as k
+from aide_validation.report_writer import Display, ParsedUnit
+
+# allowable difference between the LFOM's design flow and the flow through its
+# orifices, as a fraction of the design flow
+LFOM_TOLERANCE = 0.05
 
 
 def flow_lfom_vert(height, d_ori, h_ori, n_oris):
@@ -24,8 +29,13 @@ def flow_lfom_vert(height, d_ori, h_ori, n_oris):
     Returns:
         flow: flow rate through the LFOM (u.L / u.s)
     """
-    flow = pc.flow_orifice_vert(d_ori, height - h_ori, con.VC_ORIFICE_RATIO) * n_oris
-    return (sum(flow)).to(u.L / u.s)
+    flow = k.flow_lfom_vert(
+        k.to_si(height, u.m),
+        k.to_si(d_ori, u.m),
+        k.to_si(h_ori, u.m),
+        k.to_si(n_oris, u.dimensionless),
+    )
+    return k.from_si(flow, u.m**3 / u.s, u.L / u.s)
 
 
 def check_flow_lfom_vert(
@@ -47,23 +57,170 @@ def check_flow_lfom_vert(
         report_writer: ReportWriter object to record validation results
 
     Returns:
-        flow: flow rate through the LFOM (u.L / u.s)
+        none
     """
+    inputs = {
+        "diameter": k.to_si(diameter, u.m),
+        "ori_heights": k.to_si(ori_heights, u.m),
+        "ori_numbers": k.to_si(ori_numbers, u.dimensionless),
+    }
+    q_input = k.to_si(q_input, u.m**3 / u.s)
+    limit = (q_input * (1 - cutoff), q_input * (1 + cutoff))
+
     try:
-        q_calc = flow_lfom_vert(
-            ori_heights[-1] + 0.5 * diameter, diameter, ori_heights, ori_numbers
+        q_calc = k.flow_lfom_vert(
+            inputs["ori_heights"][-1] + 0.5 * inputs["diameter"],
+            inputs["diameter"],
+            inputs["ori_heights"],
+            inputs["ori_numbers"],
+        )
+        args = (
+            Display(q_input, u.m**3 / u.s, ParsedUnit({"Flow": 1}, u.L / u.s)),
+            Display(q_calc, u.m**3 / u.s, u.L / u.s),
         )
         assert cutoff > (q_calc - q_input) / q_input
         assert -cutoff < (q_calc - q_input) / q_input
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_flow_lfom_vert",
             "The expected flow rate, {!s}, was very close "
             "to the one calculated by this validation "
-            "code, {!s}.\n".format(q_input, q_calc)
+            "code, {!s}.\n",
+            args,
+            inputs,
+            q_calc,
+            limit,
         )
     except AssertionError:
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_flow_lfom_vert",
             "INVALID: The expected flow rate, {!s}, is "
             "different from the one calculated by this "
-            "validation code, {!s}.\n".format(q_input, q_calc)
+            "validation code, {!s}.\n",
+            args,
+            inputs,
+            q_calc,
+            limit,
+            passed=False,
+        )
+        report_writer.set_result("Invalid: Check Validation Report")
+
+
+class _RowFlows(object):
+    # flows through each row (m^3 / s), listed in L/s only when formatted
+    def __init__(self, flows):
+        self.flows = flows
+
+    def __str__(self):
+        return ", ".join(
+            "{!s}".format(k.from_si(flow, u.m**3 / u.s, u.L / u.s))
+            for flow in self.flows
+        )
+
+
+def lfom_rating_curve(diameter, ori_heights, ori_numbers, q_input, n_heights=200):
+    """Evaluates the LFOM's flow at many water heights at once and compares it
+    to the ideal rating curve, which is linear from no flow when empty to
+    q_input when the water is half a diameter above the top row.
+
+    Args:
+        diameter: diameter of each orifice (u.m)
+
+        ori_heights: height of each row of the LFOM (list)
+
+        ori_numbers: number of orifices at each row of the LFOM (list of lists)
+
+        q_input: design flow rate (u.L / u.s)
+
+        n_heights: number of evenly spaced water heights to evaluate.
+        Default: 200
+
+    Returns:
+        heights: water heights (m)
+
+        flow_rows: (heights x rows) array of the flow through each row (m^3 / s)
+
+        deviation: difference between the total and ideal flow at each height,
+        as a fraction of q_input
+    """
+    diameter = k.to_si(diameter, u.m)
+    ori_heights = k.to_si(ori_heights, u.m)
+    q_input = k.to_si(q_input, u.m**3 / u.s)
+
+    height_max = ori_heights[-1] + 0.5 * diameter
+    heights = np.linspace(height_max / n_heights, height_max, n_heights)
+    flow_rows = k.flow_lfom_rows(
+        heights, diameter, ori_heights, k.to_si(ori_numbers, u.dimensionless)
+    )
+    deviation = (flow_rows.sum(axis=-1) - q_input * heights / height_max) / q_input
+    return heights, flow_rows, deviation
+
+
+def check_lfom_rating_curve(
+    diameter,
+    ori_heights,
+    ori_numbers,
+    cutoff,
+    q_input,
+    report_writer,
+    n_heights=200,
+):
+    """Evaluates whether the flow through the LFOM stays within cutoff of the
+    ideal linear rating curve at every water height and writes the result,
+    the worst height and the flow through each row at that height to a report.
+
+    Args:
+        diameter: diameter of each orifice (u.m)
+
+        ori_heights: height of each row of the LFOM (list)
+
+        ori_numbers: number of orifices at each row of the LFOM (list of lists)
+
+        cutoff: allowable deviation from the ideal flow as a fraction of q_input
+
+        q_input: design flow rate (u.L / u.s)
+
+        report_writer: ReportWriter object to record validation results
+
+        n_heights: number of evenly spaced water heights to evaluate.
+        Default: 200
+
+    Returns:
+        none
+    """
+    heights, flow_rows, deviation = lfom_rating_curve(
+        diameter, ori_heights, ori_numbers, q_input, n_heights
+    )
+    worst = np.argmax(np.abs(deviation))
+    inputs = {
+        "diameter": k.to_si(diameter, u.m),
+        "ori_heights": k.to_si(ori_heights, u.m),
+        "ori_numbers": k.to_si(ori_numbers, u.dimensionless),
+        "q_input": k.to_si(q_input, u.m**3 / u.s),
+    }
+    row_flows = _RowFlows(flow_rows[worst])
+
+    try:
+        assert np.abs(deviation[worst]) < cutoff
+        report_writer.write_check(
+            "check_lfom_rating_curve",
+            "The LFOM rating curve stayed within {:.1%} of linear. The largest "
+            "deviation, {:.2%}, was at a water height of {!s}, where the flow "
+            "through each row was: {!s}.\n",
+            (cutoff, deviation[worst], Display(heights[worst], u.m, u.cm), row_flows),
+            inputs,
+            deviation[worst],
+            (-cutoff, cutoff),
+        )
+    except AssertionError:
+        report_writer.write_check(
+            "check_lfom_rating_curve",
+            "INVALID: The LFOM rating curve deviated from linear by {:.2%}, "
+            "more than {:.1%}, at a water height of {!s}, where the flow "
+            "through each row was: {!s}.\n",
+            (deviation[worst], cutoff, Display(heights[worst], u.m, u.cm), row_flows),
+            inputs,
+            deviation[worst],
+            (-cutoff, cutoff),
+            passed=False,
         )
         report_writer.set_result("Invalid: Check Validation Report")
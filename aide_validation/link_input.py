@@ -4,13 +4,17 @@ Created on September 18, 2020
 @author: jcs528@cornell.edu
 """
 
-from tkinter import Tk, Button, Label, Entry
-from aide_validation.validator import Validator
-
 
 class ValidationGUI(object):
-    def __init__(self, root):
+    def __init__(self, root, client=None):
+        # tkinter and the Validator are only imported when the GUI is shown
+        from tkinter import Button, Entry
+        from aide_validation.validator import Validator
+
         self.root = root
+        # optional ValidationClient of a running ValidationServer, which
+        # validates instead of this process
+        self.client = client
         self.e = Entry(root, width=50)
         self.e.pack()
 
@@ -24,10 +28,15 @@ class ValidationGUI(object):
         self.urlLabel = None
 
     def urlClick(self):
+        from tkinter import Label
+
         url = self.e.get()
-        message = self.validator.validate(url)
+        if self.client is not None:
+            message = self.client.validate(url)["result"]
+        else:
+            message = self.validator.validate(url)
         if self.urlLabel is None:
-            self.urlLabel = Label(root, text=message)
+            self.urlLabel = Label(self.root, text=message)
             self.urlLabel.pack()
         else:
             self.urlLabel["text"] = message
@@ -36,7 +45,21 @@ class ValidationGUI(object):
         self.root.destroy()
 
 
-if __name__ == "__main__":
+def main():
+    """Opens the validation GUI
+
+    Args:
+        none
+
+    Returns:
+        none
+    """
+    from tkinter import Tk
+
     root = Tk()
-    gui = ValidationGUI(root)
+    ValidationGUI(root)
     root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
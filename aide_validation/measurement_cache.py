@@ -0,0 +1,233 @@
+"""Persistent on-disk cache of parsed Onshape measurements.
+Created on October 18, 2026
+
+Versions and microversions of an Onshape document are immutable, so the
+measurements parsed from them never change and only need to be fetched once.
+Workspaces can change at any time and always bypass the cache.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from aide_validation.units import u
+
+URL_PATTERN = re.compile(
+    r"/documents/(?P<did>\w+)/(?P<wvm>[wvm])/(?P<wvmid>\w+)/e/(?P<eid>\w+)"
+)
+# tag used to mark an encoded pint quantity in JSON
+QUANTITY_TAG = "__quantity__"
+
+
+def encode_measurement(value):
+    """Converts a parsed measurement into a JSON serializable object. Pint
+    quantities are stored as their magnitude and unit string.
+
+    Args:
+        value: parsed measurement (quantity, number, string, list or dict)
+
+    Returns:
+        encoded: JSON serializable representation of value
+    """
+    if isinstance(value, u.Quantity):
+        magnitude = value.magnitude
+        if hasattr(magnitude, "tolist"):
+            magnitude = magnitude.tolist()
+        return {QUANTITY_TAG: [magnitude, str(value.units)]}
+    elif isinstance(value, (list, tuple)):
+        return [encode_measurement(item) for item in value]
+    elif isinstance(value, dict):
+        return {key: encode_measurement(item) for key, item in value.items()}
+    elif hasattr(value, "tolist"):
+        return value.tolist()
+    return value
+
+
+def decode_measurement(value):
+    """Inverse of encode_measurement
+
+    Args:
+        value: JSON deserialized representation of a measurement
+
+    Returns:
+        measurement: parsed measurement with pint quantities restored
+    """
+    if isinstance(value, list):
+        return [decode_measurement(item) for item in value]
+    elif isinstance(value, dict):
+        if QUANTITY_TAG in value:
+            magnitude, units = value[QUANTITY_TAG]
+            return u.Quantity(magnitude, units)
+        return {key: decode_measurement(item) for key, item in value.items()}
+    return value
+
+
+def dumps_measurements(measurements, processes):
+    """Serializes parsed measurements and unit processes to a JSON string
+
+    Args:
+        measurements: dictionary of parsed variables
+
+        processes: list of unit processes in the Onshape model
+
+    Returns:
+        text: JSON string
+    """
+    return json.dumps(
+        {
+            "measurements": encode_measurement(measurements),
+            "processes": list(processes),
+        }
+    )
+
+
+def loads_measurements(text):
+    """Inverse of dumps_measurements
+
+    Args:
+        text: JSON string
+
+    Returns:
+        measurements: dictionary of parsed variables
+
+        processes: list of unit processes in the Onshape model
+    """
+    data = json.loads(text)
+    return decode_measurement(data["measurements"]), data["processes"]
+
+
+def cache_key(url, projection=None):
+    """Returns the cache key of an Onshape URL, or None if the URL points at a
+    mutable workspace (or isn't an Onshape element URL at all)
+
+    Args:
+        url: URL of Onshape model (string)
+
+        projection: keys of the measurements the cached measurements are
+            limited to (iterable of strings), so that measurements projected
+            differently are cached separately. Defaults to None for
+            measurements which aren't projected
+
+    Returns:
+        key: hex digest identifying the immutable element (string or None)
+    """
+    match = URL_PATTERN.search(url)
+    if match is None or match.group("wvm") == "w":
+        return None
+    identity = "/".join(match.group("did", "wvm", "wvmid", "eid"))
+    if projection is not None:
+        identity += "?" + ",".join(sorted(projection))
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+class MeasurementCache(object):
+    """Size-bounded on-disk LRU cache of parsed measurements, keyed by the
+    immutable version of an Onshape element"""
+
+    def __init__(self, cache_dir=".aide_validation_cache", max_bytes=64 * 2**20):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path(self, key):
+        """Returns the path of the cache entry with the given key
+
+        Args:
+            key: cache key from cache_key (string)
+
+        Returns:
+            path: path to the cache entry (string)
+        """
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def get(self, url, projection=None):
+        """Looks up the measurements of an Onshape URL
+
+        Args:
+            url: URL of Onshape model (string)
+
+            projection: keys the measurements were limited to when they were
+                stored, see cache_key. Defaults to None
+
+        Returns:
+            (measurements, processes) if the URL is cached, otherwise None.
+            Entries which can't be decoded are deleted and are a miss.
+        """
+        key = cache_key(url, projection)
+        if key is None:
+            return None
+        try:
+            with open(self.path(key), "r") as file:
+                text = file.read()
+            # mark as most recently used
+            os.utime(self.path(key))
+        except OSError:
+            return None
+        try:
+            return loads_measurements(text)
+        except (ValueError, KeyError, TypeError):
+            # a truncated or corrupt entry is fetched again
+            try:
+                os.remove(self.path(key))
+            except OSError:
+                pass
+            return None
+
+    def put(self, url, measurements, processes, projection=None):
+        """Stores the measurements of an Onshape URL, then evicts the least
+        recently used entries if the cache is larger than max_bytes.
+        Workspace URLs are not stored.
+
+        Args:
+            url: URL of Onshape model (string)
+
+            measurements: dictionary of parsed variables
+
+            processes: list of unit processes in the Onshape model
+
+            projection: keys measurements are limited to, see cache_key.
+                Defaults to None
+
+        Returns:
+            none
+        """
+        key = cache_key(url, projection)
+        if key is None:
+            return
+        # write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as file:
+            file.write(dumps_measurements(measurements, processes))
+        os.replace(tmp_path, self.path(key))
+        self.evict()
+
+    def evict(self):
+        """Deletes least recently used entries until the cache fits in max_bytes
+
+        Args:
+            none
+
+        Returns:
+            none
+        """
+        with self.lock:
+            entries = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".json"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                total -= size
@@ -0,0 +1,186 @@
+"""Units of the measurements parsed from Onshape.
+Created on October 18, 2026
+
+The Onshape Documenter parses each measurement under a key such as
+"S.FlocBaffle". MEASUREMENTS declares the SI unit each one is converted to
+before it reaches a check, and PROCESS_MEASUREMENTS lists the measurements
+each unit process reads, in the order it reads them.
+"""
+
+import aide_validation.kernels as k
+from aide_validation.units import u
+
+
+# Onshape predicates can't handle flow, velocity and temperature units, so
+# flows are parsed as volumes, velocities as lengths and temperatures as
+# plain numbers in degrees Celsius
+def _per_second(value):
+    return value / u.s
+
+
+def _celsius(value):
+    return value * u.degC
+
+
+# (SI unit, function which gives the parsed value its real units or None) of
+# each measurement. Counts and ratios are used as parsed.
+MEASUREMENTS = {
+    "Flow": ("m**3 / s", _per_second),
+    "TempCelsius": ("K", _celsius),
+    # LFOM
+    "D.LfomOrifices": ("m", None),
+    "N.LfomOrifices": ("dimensionless", None),
+    "H.LfomOrifices": ("m", None),
+    # flocculator
+    "N.FlocChannels": ("dimensionless", None),
+    "N.FlocChannelBaffles": ("dimensionless", None),
+    "S.FlocBaffle": ("m", None),
+    "W.FlocChannel": ("m", None),
+    "L.FlocChannel": ("m", None),
+    "H.FlocChannel": ("m", None),
+    "FB": ("m", None),
+    # sedimentation tank
+    "V.SedUp": ("m / s", _per_second),
+    "V.SedC": ("m / s", _per_second),
+    "ID.SedManifold": ("m", None),
+    "HL.Diffuser": ("m", None),
+    "Pi.QLaunderOrifices": ("dimensionless", None),
+    "W.Sed": ("m", None),
+    "L.Sed": ("m", None),
+    "N.SedPlates": ("dimensionless", None),
+    "L.SedPlate": ("m", None),
+    "W.SedPlate": ("m", None),
+    "T.SedPlate": ("m", None),
+    "AN.SedPlate": ("rad", None),
+    "S.SedPlate": ("m", None),
+    "W.SedDiffuserInner": ("m", None),
+    "HL.SedLaunderBod": ("m", None),
+    "D.SedLaunderOrifice": ("m", None),
+    "N.SedLaunderOrifices": ("dimensionless", None),
+}
+
+# measurements read by each Onshape Documenter unit process
+PROCESS_MEASUREMENTS = {
+    "ET": ["Flow", "D.LfomOrifices", "N.LfomOrifices", "H.LfomOrifices"],
+    "Floc": [
+        "Flow",
+        "TempCelsius",
+        "N.FlocChannels",
+        "N.FlocChannelBaffles",
+        "S.FlocBaffle",
+        "W.FlocChannel",
+        "L.FlocChannel",
+        "H.FlocChannel",
+        "FB",
+    ],
+    "Sed": [
+        "Flow",
+        "V.SedUp",
+        "V.SedC",
+        "TempCelsius",
+        "ID.SedManifold",
+        "HL.Diffuser",
+        "Pi.QLaunderOrifices",
+        "W.Sed",
+        "L.Sed",
+        "N.SedPlates",
+        "L.SedPlate",
+        "W.SedPlate",
+        "T.SedPlate",
+        "AN.SedPlate",
+        "S.SedPlate",
+        "W.SedDiffuserInner",
+        "HL.SedLaunderBod",
+        "D.SedLaunderOrifice",
+        "N.SedLaunderOrifices",
+    ],
+}
+
+
+def available_processes(measurements):
+    """Returns the unit processes whose measurements are all present
+
+    Args:
+        measurements: dictionary of parsed variables
+
+    Returns:
+        processes: list of Onshape Documenter unit processes
+    """
+    return [
+        process
+        for process, keys in PROCESS_MEASUREMENTS.items()
+        if all(key in measurements for key in keys)
+    ]
+
+
+def required_measurements(processes):
+    """Returns the measurements the given unit processes read, so that only
+    those need to be parsed
+
+    Args:
+        processes: list of Onshape Documenter unit processes
+
+    Returns:
+        keys: measurement keys in the order the processes read them (list of
+        strings)
+    """
+    keys = []
+    for process in processes:
+        keys.extend(
+            key for key in PROCESS_MEASUREMENTS.get(process, []) if key not in keys
+        )
+    return keys
+
+
+def missing_measurements(measurements, process):
+    """Returns the measurements of a unit process which are missing
+
+    Args:
+        measurements: dictionary of parsed variables
+
+        process: Onshape Documenter unit process (e.g. "Floc")
+
+    Returns:
+        keys: missing measurement keys in the order the process reads them
+        (list of strings)
+    """
+    return [key for key in PROCESS_MEASUREMENTS[process] if key not in measurements]
+
+
+def si_unit(key):
+    """Returns the SI unit a measurement is converted to
+
+    Args:
+        key: name of the measurement (e.g. "S.FlocBaffle")
+
+    Returns:
+        unit: pint unit
+    """
+    return u.Unit(MEASUREMENTS[key][0])
+
+
+def to_si_measurements(measurements, keys, units=None):
+    """Converts parsed measurements to SI magnitudes, in the order of keys, so
+    that a missing measurement raises the KeyError of the first one read
+
+    Args:
+        measurements: dictionary of parsed variables
+
+        keys: names of the measurements to convert (list of strings)
+
+        units: dictionary to add the unit each quantity was parsed in to, by
+            key, so reports can show it in the model's units. Defaults to None
+
+    Returns:
+        magnitudes: dictionary of SI magnitudes by key
+    """
+    magnitudes = {}
+    for key in keys:
+        unit, prepare = MEASUREMENTS[key]
+        value = measurements[key]
+        if prepare is not None:
+            value = prepare(value)
+        if units is not None and isinstance(value, u.Quantity):
+            units[key] = value.units
+        magnitudes[key] = k.to_si(value, unit)
+    return magnitudes
@@ -0,0 +1,242 @@
+"""Monte Carlo tolerance analysis of a plant's measurements.
+Created on October 18, 2026
+
+A plant is built with fabrication tolerances, so each dimension varies about
+the value in its Onshape model. monte_carlo draws samples of the measurements
+from given distributions and runs the vectorized sweeps of every check over
+all samples at once:
+
+    results = monte_carlo(
+        measurements,
+        {"S.FlocBaffle": Normal(2 * u.mm), "D.LfomOrifices": Uniform(0.1 * u.mm)},
+        n_samples=100000,
+    )
+    results["check_baffle_spacing"].pass_probability
+
+Distributions are about the nominal measurement and their spreads are in the
+units the checks use: flows are L/s or m^3/s rather than volumes, and
+temperature spreads are differences in kelvin. Plain numbers are SI.
+Measurements which are lists, such as the height of each LFOM row, vary
+independently in each element.
+"""
+
+from collections import namedtuple
+import numpy as np
+import aide_validation.kernels as k
+import aide_validation.sweep as sw
+from aide_validation.graph import CHECK_GRAPH, Evaluation
+from aide_validation.measurements import (
+    PROCESS_MEASUREMENTS,
+    available_processes,
+    si_unit,
+    to_si_measurements,
+)
+from aide_validation.lfom_validation import LFOM_TOLERANCE
+from aide_validation.validator import UNIT_PROCESSES
+
+# pass_probability is the fraction of samples which pass. margin_percentiles
+# maps each percentile to the margin at that percentile, among the samples
+# whose margin isn't nan, and margin and passed are the per-sample arrays of
+# the check's SweepResult.
+MonteCarloResult = namedtuple(
+    "MonteCarloResult", ["pass_probability", "margin_percentiles", "margin", "passed"]
+)
+
+
+class Normal(namedtuple("Normal", ["sd"])):
+    """Normal distribution about the nominal value with standard deviation sd"""
+
+    def sample(self, nominal, unit, size, rng):
+        return nominal + k.to_si(self.sd, unit) * rng.standard_normal(size)
+
+
+class Uniform(namedtuple("Uniform", ["tolerance"])):
+    """Uniform distribution within tolerance either side of the nominal value"""
+
+    def sample(self, nominal, unit, size, rng):
+        tolerance = k.to_si(self.tolerance, unit)
+        return nominal + rng.uniform(-tolerance, tolerance, size)
+
+
+def sample_measurements(measurements, distributions, keys, n_samples, rng):
+    """Converts measurements to SI magnitudes and replaces those with a
+    distribution by n_samples samples
+
+    Args:
+        measurements: dictionary of parsed variables
+
+        distributions: dictionary of Normal or Uniform by measurement key
+
+        keys: measurements to convert (list of strings)
+
+        n_samples: number of samples to draw
+
+        rng: NumPy Generator to draw from
+
+    Returns:
+        samples: dictionary of SI magnitudes by key. Sampled measurements
+        are arrays with a first axis of n_samples.
+
+    Raises:
+        KeyError: if a distribution isn't of one of keys
+    """
+    samples = to_si_measurements(measurements, keys)
+    for key, distribution in distributions.items():
+        if key not in samples:
+            raise KeyError(
+                "{} isn't a measurement of the checked processes".format(key)
+            )
+        nominal = np.asarray(samples[key], dtype=float)
+        samples[key] = distribution.sample(
+            nominal, si_unit(key), (n_samples,) + nominal.shape, rng
+        )
+    return samples
+
+
+def _sweep_lfom(m):
+    return {
+        "check_flow_lfom_vert": sw.sweep_flow_lfom_vert(
+            m["D.LfomOrifices"],
+            m["H.LfomOrifices"],
+            m["N.LfomOrifices"],
+            LFOM_TOLERANCE,
+            m["Flow"],
+        )
+    }
+
+
+def _sweep_floc(m):
+    # derived quantities come from the same graph nodes the Validator uses
+    evaluation = Evaluation(CHECK_GRAPH, m)
+    return {
+        "check_G_theta": sw.sweep_G_theta(
+            m["Flow"],
+            m["L.FlocChannel"],
+            evaluation.get("floc.design_water_height"),
+            m["N.FlocChannels"],
+            m["W.FlocChannel"],
+            evaluation.get("floc.headloss"),
+            m["TempCelsius"],
+        ),
+        "check_baffle_spacing": sw.sweep_baffle_spacing(
+            m["L.FlocChannel"], m["S.FlocBaffle"]
+        ),
+    }
+
+
+def _sweep_sed(m):
+    diffuser = sw.sweep_diffuser(
+        m["W.Sed"],
+        m["W.SedDiffuserInner"],
+        m["V.SedUp"],
+        m["HL.Diffuser"],
+        m["TempCelsius"],
+    )
+    return {
+        "check_diffuser": diffuser,
+        "check_inlet_manifold": sw.sweep_inlet_manifold(
+            m["ID.SedManifold"], m["Pi.QLaunderOrifices"], diffuser.value, m["Flow"]
+        ),
+        "check_plate_settlers": sw.sweep_plate_settlers(
+            m["V.SedC"],
+            m["N.SedPlates"],
+            m["L.SedPlate"],
+            m["W.SedPlate"],
+            m["S.SedPlate"],
+            m["AN.SedPlate"],
+            m["T.SedPlate"],
+            m["Flow"],
+        ),
+        "check_sed_tank": sw.sweep_sed_tank(
+            m["L.Sed"], m["W.Sed"], m["V.SedUp"], m["Flow"]
+        ),
+        "check_outlet_manifold": sw.sweep_outlet_manifold(
+            m["N.SedLaunderOrifices"],
+            m["D.SedLaunderOrifice"],
+            m["HL.SedLaunderBod"],
+            m["Flow"],
+        ),
+    }
+
+
+# vectorized checks of each Onshape Documenter unit process, as functions of
+# a dictionary of SI measurements. They return a SweepResult by check name.
+PROCESS_SWEEPS = {"ET": _sweep_lfom, "Floc": _sweep_floc, "Sed": _sweep_sed}
+
+
+def monte_carlo(
+    measurements,
+    distributions,
+    n_samples=10000,
+    processes=None,
+    seed=None,
+    percentiles=(1, 5, 50, 95, 99),
+):
+    """Estimates the probability that each check passes when measurements
+    vary with the given distributions
+
+    Args:
+        measurements: dictionary of parsed variables
+
+        distributions: dictionary of Normal or Uniform by measurement key
+        (e.g. "S.FlocBaffle"). Other measurements keep their nominal value.
+
+        n_samples: number of samples to draw. Default: 10000
+
+        processes: unit processes to check. Defaults to None which checks
+        every unit process whose measurements are all present
+
+        seed: seed of the random number generator. Defaults to None which
+        draws different samples each call
+
+        percentiles: percentiles of the margin to report.
+        Default: (1, 5, 50, 95, 99)
+
+    Returns:
+        results: dictionary of MonteCarloResult by check name, in report order
+
+    Raises:
+        KeyError: if a distribution isn't of a measurement of processes
+    """
+    if processes is None:
+        processes = available_processes(measurements)
+    keys = []
+    for process, _, _ in UNIT_PROCESSES:
+        if process in processes:
+            keys.extend(key for key in PROCESS_MEASUREMENTS[process] if key not in keys)
+
+    rng = np.random.default_rng(seed)
+    samples = sample_measurements(measurements, distributions, keys, n_samples, rng)
+
+    results = {}
+    # samples outside the valid range of a kernel, like negative lengths,
+    # give nan margins and fail. They are left out of the percentiles.
+    with np.errstate(invalid="ignore"):
+        for process, _, _ in UNIT_PROCESSES:
+            if process not in processes:
+                continue
+            for check, result in PROCESS_SWEEPS[process](samples).items():
+                margin = np.broadcast_to(result.margin, (n_samples,))
+                passed = np.broadcast_to(result.passed, (n_samples,))
+                results[check] = MonteCarloResult(
+                    float(np.mean(passed)),
+                    dict(zip(percentiles, np.nanpercentile(margin, percentiles))),
+                    margin,
+                    passed,
+                )
+    return results
+
+
+def pass_probability(results):
+    """Returns the probability that every check passes
+
+    Args:
+        results: dictionary of MonteCarloResult returned by monte_carlo
+
+    Returns:
+        probability: fraction of samples in which every check passes (float)
+    """
+    if not results:
+        return 1.0
+    passed = np.logical_and.reduce([result.passed for result in results.values()])
+    return float(np.mean(passed))
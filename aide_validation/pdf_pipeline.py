@@ -0,0 +1,110 @@
+"""Background PDF rendering for validation reports.
+Created on October 18, 2026
+
+Laying out a report with FPDF takes longer than the validation itself, so a
+Validator given a PdfPipeline hands its PDF to a pool of worker threads or
+processes and returns its result straight away:
+
+    with PdfPipeline(max_workers=2) as pipeline:
+        validator = Validator(pdf_pipeline=pipeline)
+        result = validator.validate(url)  # returns before the PDF is written
+        result.pdf.result()  # waits for the PDF and returns its path
+    # leaving the block waits for every PDF
+"""
+
+import threading
+from concurrent.futures import (
+    FIRST_EXCEPTION,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from aide_validation.report_writer import write_pdf
+
+
+class PdfPipeline(object):
+    """Writes report PDFs on a background pool of threads or processes"""
+
+    def __init__(self, max_workers=1, processes=False):
+        """
+        Args:
+            max_workers: number of PDFs written at once. Defaults to 1
+
+            processes: write PDFs in worker processes instead of threads.
+                Processes don't compete with validation for the GIL but cost
+                more to start. Defaults to False
+        """
+        executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        self.executor = executor_class(max_workers=max_workers)
+        self.pending = set()
+        self.lock = threading.Lock()
+
+    def submit(self, report_writer):
+        """Queues the PDF of a report. The report text is rendered now, so the
+        report can change afterwards without changing the PDF.
+
+        Args:
+            report_writer: ReportWriter of the report
+
+        Returns:
+            future: Future which completes with the path of the PDF
+        """
+        lines = report_writer.to_text().splitlines(True)
+        future = self.executor.submit(write_pdf, lines, report_writer.pdf_name)
+        with self.lock:
+            self.pending.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future):
+        # failed PDFs stay pending until flush raises their error
+        if future.cancelled() or future.exception() is None:
+            with self.lock:
+                self.pending.discard(future)
+
+    def flush(self, timeout=None):
+        """Waits for every queued PDF to be written
+
+        Args:
+            timeout: maximum number of seconds to wait. Defaults to None
+                which waits as long as it takes
+
+        Returns:
+            none
+
+        Raises:
+            the error of a PDF which failed since the last flush, or
+            TimeoutError
+        """
+        with self.lock:
+            pending = list(self.pending)
+        done, not_done = wait(pending, timeout=timeout, return_when=FIRST_EXCEPTION)
+        for future in done:
+            if not future.cancelled() and future.exception() is not None:
+                # raise the error of a PDF which failed, once
+                with self.lock:
+                    self.pending.discard(future)
+                future.result()
+        if not_done:
+            raise TimeoutError(
+                "{} PDFs were not written within {} seconds".format(
+                    len(not_done), timeout
+                )
+            )
+
+    def shutdown(self, wait=True):
+        """Stops the workers
+
+        Args:
+            wait: wait for queued PDFs to be written first. Defaults to True
+
+        Returns:
+            none
+        """
+        self.executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown(wait=True)
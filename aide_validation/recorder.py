@@ -0,0 +1,186 @@
+"""Record and replay the Onshape API responses behind measurement parsing.
+Created on October 18, 2026
+
+A fetcher is any callable that takes an Onshape URL and returns the raw
+response of the Documenter FeatureScript that onshape_parser evaluates.
+RecordingFetcher calls the Onshape API and saves each response to a fixture
+file, and ReplayFetcher serves those files without a network connection:
+
+    validator = Validator(fetcher=RecordingFetcher("fixtures"))  # online
+    validator = Validator(fetcher=ReplayFetcher("fixtures"))  # offline
+"""
+
+import json
+import os
+import tempfile
+from aide_validation.measurement_cache import URL_PATTERN
+
+# the same script onshape_parser.get_parsed_measurements evaluates
+DOCUMENTER_SCRIPT = r"""
+    function (context is Context, queries is map)
+    {
+        return getAttributes(context, {
+            "entities" : qEverything(),
+        });
+    }
+    """
+# Documenter fields parsed for validation
+FIELDS = ["variables", "template", "index", "process"]
+
+
+def eval_documenter(client, url):
+    """Evaluates the Documenter FeatureScript in the Onshape element at url
+
+    Args:
+        client: onshape_client Client, or any object with the same
+            part_studios_api.eval_feature_script method
+
+        url: URL of Onshape model (string)
+
+    Returns:
+        data: raw JSON response (bytes)
+    """
+    from onshape_client.oas import BTFeatureScriptEvalCall2377
+    from onshape_client.onshape_url import OnshapeElement
+
+    element = OnshapeElement(url)
+    response = client.part_studios_api.eval_feature_script(
+        element.did,
+        element.wvm,
+        element.wvmid,
+        element.eid,
+        bt_feature_script_eval_call_2377=BTFeatureScriptEvalCall2377(
+            script=DOCUMENTER_SCRIPT
+        ),
+        _preload_content=False,
+    )
+    return response.data
+
+
+def _entry_key(entry):
+    # key of a BTFSValueMapEntry, or None for any other value
+    if entry.get("typeName") != "BTFSValueMapEntry":
+        return None
+    return entry["message"]["key"]["message"]["value"]
+
+
+def _select_variables(attributes, keys):
+    # removes the Documenter variables which aren't in keys, in place
+    for attribute in attributes:
+        if attribute.get("typeName") != "BTFSValueMap":
+            continue
+        if attribute["message"]["typeTag"] != "Documenter":
+            continue
+        for documenter in attribute["message"]["value"]:
+            for doc in documenter["message"]["value"]["message"]["value"]:
+                for field in doc["message"]["value"]:
+                    if _entry_key(field) != "variables":
+                        continue
+                    variables = field["message"]["value"]["message"]
+                    variables["value"] = [
+                        variable
+                        for variable in variables["value"]
+                        if _entry_key(variable) in keys
+                    ]
+
+
+def parse_documenter(data, projection=None):
+    """Parses a raw Documenter response the same way as
+    onshape_parser.get_parsed_measurements(link, for_docs=False)
+
+    Args:
+        data: raw JSON response (bytes or string)
+
+        projection: function of the list of unit processes in the model
+            returning the keys of the measurements to parse, such as
+            required_measurements. Other variables are never converted to
+            quantities. Defaults to None which parses every variable
+
+    Returns:
+        measurements: dictionary of parsed variables
+
+        processes: list of unit processes in the Onshape model
+    """
+    import aguaclara.core.onshape_parser as par
+
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    attributes = json.loads(data)["result"][par.msg_str][par.val_str]
+    if projection is not None:
+        # the processes are parsed first, to know which variables they need
+        _, _, processes = par.parse_attributes(attributes, ["process"], for_docs=False)
+        _select_variables(attributes, set(projection(processes)))
+    measurements, _, processes = par.parse_attributes(
+        attributes, FIELDS, for_docs=False
+    )
+    return measurements, processes
+
+
+def fixture_name(url):
+    """Returns the fixture file name for an Onshape URL
+
+    Args:
+        url: URL of Onshape model (string)
+
+    Returns:
+        name: file name made of the document, workspace/version/microversion
+            and element IDs (string)
+    """
+    match = URL_PATTERN.search(url)
+    if match is None:
+        raise ValueError("Not an Onshape element URL: " + url)
+    return "_".join(match.group("did", "wvm", "wvmid", "eid")) + ".json"
+
+
+class RecordingFetcher(object):
+    """Fetcher which calls the Onshape API and records every response"""
+
+    def __init__(self, fixture_dir, client=None):
+        """
+        Args:
+            fixture_dir: directory to save responses in
+
+            client: onshape_client Client to use. Defaults to None which
+                uses the client the Validator fetches with by default,
+                fetch.default_client. It is configured from the
+                ONSHAPE_API_ACCESS_KEY and ONSHAPE_API_SECRET_KEY environment
+                variables or ~/.onshape_client_config.yaml, or else with the
+                keys of onshape_parser.
+        """
+        self.fixture_dir = fixture_dir
+        self.client = client
+        os.makedirs(fixture_dir, exist_ok=True)
+
+    def __call__(self, url):
+        if self.client is None:
+            # the fetch module imports this one
+            from aide_validation.fetch import default_client
+
+            self.client = default_client()
+        data = eval_documenter(self.client, url)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.fixture_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, os.path.join(self.fixture_dir, fixture_name(url)))
+
+        return data
+
+
+class ReplayFetcher(object):
+    """Fetcher which serves responses recorded by RecordingFetcher"""
+
+    def __init__(self, fixture_dir):
+        """
+        Args:
+            fixture_dir: directory the responses were recorded in
+        """
+        self.fixture_dir = fixture_dir
+
+    def __call__(self, url):
+        path = os.path.join(self.fixture_dir, fixture_name(url))
+        try:
+            with open(path, "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            raise FileNotFoundError("No recorded Onshape response for " + url)
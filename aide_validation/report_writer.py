@@ -4,23 +4,111 @@ Created on January 6, 2021
 @author: fchapin@aguaclarareach.org
 """
 
+import functools
+import itertools
+import json
+import operator
 import os
+from collections import namedtuple
 from datetime import datetime
-from fpdf import FPDF
+import numpy as np
+import aide_validation.kernels as k
 
+# one entry of a report. check is the name of the check function that wrote
+# it (None for plain messages) and inputs, value and limit are SI magnitudes.
+# The text of the entry is only formatted from template and args when the
+# report is rendered.
+CheckRecord = namedtuple(
+    "CheckRecord", ["check", "inputs", "value", "limit", "passed", "template", "args"]
+)
+# an SI magnitude to show in unit display_unit when a message is rendered
+Display = namedtuple("Display", ["value", "unit", "display_unit"])
+Display.__new__.__defaults__ = (None,)
+# display unit made of the units the model's measurements were parsed in: the
+# product of the unit of each measurement key in exponents raised to its
+# exponent, so that values read from the model are shown in the model's units.
+# fallback is shown instead when the report doesn't have those units.
+ParsedUnit = namedtuple("ParsedUnit", ["exponents", "fallback"])
+ParsedUnit.__new__.__defaults__ = (None,)
 
-class ReportWriter(object):
-    """Class to write validation results to a report file"""
+# default directory reports are written to
+REPORT_DIR = "Reports"
+# numbers the reports of this process, so that report IDs are unique even
+# when many reports are created in the same second
+_report_counter = itertools.count()
 
-    def __init__(self):
-        if not os.path.exists("Reports"):
-            os.mkdir("Reports")
-        now = datetime.now()
-        str_now = now.strftime("%Y.%m.%d.%H.%M.%S")
-        self.report_name = "Reports/Validation_Report_" + str_now + ".txt"
-        self.report_file = open(self.report_name, "x+")
-        self.report_file.write("AIDE Validation Report\n")
+
+def new_report_id():
+    """Returns a new report ID, made of the current time, the process ID and a
+    counter. IDs are unique across the threads and processes of a machine and
+    sort by time.
+
+    Args:
+        none
+
+    Returns:
+        report_id: the ID (string)
+    """
+    str_now = datetime.now().strftime("%Y.%m.%d.%H.%M.%S")
+    # next() on itertools.count is atomic, so threads never share a number
+    return "{}_{}_{}".format(str_now, os.getpid(), next(_report_counter))
+
+
+def _json_value(value):
+    # NumPy values and arrays become plain numbers and lists
+    if isinstance(value, dict):
+        return {key: _json_value(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [_json_value(item) for item in value]
+    elif isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return value
+
+
+def write_pdf(lines, output_path):
+    """Lays out lines of text in a PDF. This is a module-level function of plain
+    arguments so that it can also run in another process.
+
+    Args:
+        lines: lines of text, including line endings (list of strings)
+
+        output_path: path to output file
+
+    Returns:
+        output_path: path to output file
+    """
+    # fpdf is only imported when a PDF is produced
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    # add a page and set font
+    pdf.add_page()
+    pdf.set_font("Arial", size=15)
+
+    # insert the lines in pdf then save
+    for x in lines:
+        pdf.multi_cell(0, 5, txt=x, align="L")
+    pdf.output(output_path)
+    return output_path
+
+
+class ReportSection(object):
+    """Class to collect the validation results of one part of a report, such
+    as one unit process, in memory"""
+
+    def __init__(self, title=None):
+        """
+        Args:
+            title: heading of the section. Defaults to None
+        """
+        self.title = title
+        self.records = []
         self.result = "Valid"
+        # sensitivity of each check to its measurements, by check name, when
+        # the Validator computes them
+        self.sensitivities = {}
+        # unit each measurement was parsed in, by key, to fix ParsedUnits with
+        self.units = {}
 
     def set_result(self, msg):
         """Write the given text to the report file
@@ -45,22 +133,196 @@ class ReportWriter(object):
         return self.result
 
     def write_message(self, msg):
-        """Write the given text to the report file
+        """Add the given text to the report
+
+        Args:
+            msg: string of text to add to the report
+
+        Returns:
+            none
+        """
+        self.records.append(CheckRecord(None, {}, None, None, None, msg, ()))
+
+    def write_check(
+        self, check, template, args=(), inputs=None, value=None, limit=None, passed=True
+    ):
+        """Add the result of a check to the report. The message is only
+        formatted when the report is rendered.
+
+        Args:
+            check: name of the check function (string)
+
+            template: str.format template of the message
+
+            args: arguments of template. Display arguments are shown in their
+                display unit. Defaults to ()
+
+            inputs: dictionary of the SI magnitudes the check was given.
+                Defaults to None
+
+            value: SI magnitude the check computed. Defaults to None
+
+            limit: SI magnitude, or (lower, upper) range, value was compared
+                to. Defaults to None
+
+            passed: whether the check passed. Defaults to True
+
+        Returns:
+            none
+        """
+        self.records.append(
+            CheckRecord(
+                check,
+                {} if inputs is None else inputs,
+                value,
+                limit,
+                bool(passed),
+                template,
+                tuple(self._parsed_display(arg) for arg in args),
+            )
+        )
+
+    def _parsed_display(self, arg):
+        # replaces a ParsedUnit with the unit it stands for in this report, so
+        # the record renders the same in any report
+        if not isinstance(arg, Display) or not isinstance(arg.display_unit, ParsedUnit):
+            return arg
+        exponents = arg.display_unit.exponents
+        if not all(key in self.units for key in exponents):
+            return arg._replace(display_unit=arg.display_unit.fallback)
+        display_unit = functools.reduce(
+            operator.mul, (self.units[key] ** n for key, n in exponents.items())
+        )
+        return arg._replace(display_unit=display_unit)
+
+    def format_record(self, record):
+        """Formats the message of a record
+
+        Args:
+            record: CheckRecord to format
+
+        Returns:
+            message: text of the record (string)
+        """
+        if not record.args:
+            return record.template
+        args = [
+            k.from_si(*arg) if isinstance(arg, Display) else arg for arg in record.args
+        ]
+        return record.template.format(*args)
+
+    def records_json(self):
+        """Returns the records of this section as JSON-compatible dictionaries.
+        Numbers are SI magnitudes.
+
+        Args:
+            none
+
+        Returns:
+            records: list of dictionaries. Records of checks with
+            sensitivities also have "sensitivity".
+        """
+        records = []
+        for record in self.records:
+            entry = {
+                "check": record.check,
+                "inputs": _json_value(record.inputs),
+                "value": _json_value(record.value),
+                "limit": _json_value(record.limit),
+                "passed": record.passed,
+                "message": self.format_record(record),
+            }
+            if record.check in self.sensitivities:
+                entry["sensitivity"] = self.sensitivities[record.check]
+            records.append(entry)
+        return records
+
+
+class ReportWriter(ReportSection):
+    """Class to collect validation results in memory and render them as a
+    report in text, PDF or JSON"""
+
+    def __init__(self, suffix="", output_dir=REPORT_DIR):
+        """
+        Args:
+            suffix: text added to the end of the report name. Defaults to ""
+
+            output_dir: directory to write reports to, created if it doesn't
+                exist. Defaults to REPORT_DIR
+        """
+        super().__init__()
+        # exist_ok so that many workers can create the directory at once
+        os.makedirs(output_dir, exist_ok=True)
+        self.report_id = new_report_id()
+        self.report_name = os.path.join(
+            output_dir, "Validation_Report_" + self.report_id + suffix + ".txt"
+        )
+        self.pdf_name = ".".join(self.report_name.split(".")[:-1] + ["pdf"])
+        self.sections = []
+        self.closed = False
+
+    def add_section(self, section):
+        """Adds a ReportSection after the records and sections already in the
+        report. Its result doesn't change the result of the report.
 
         Args:
-            msg: string of text to add to the report file
+            section: ReportSection to add
 
         Returns:
             none
         """
-        self.report_file.write(msg)
+        self.sections.append(section)
+
+    def to_text(self):
+        """Render the report as text
+
+        Args:
+            none
+
+        Returns:
+            text: the report (string)
+        """
+        lines = ["AIDE Validation Report\n"]
+        lines.extend(self.format_record(record) for record in self.records)
+        for section in self.sections:
+            lines.append("\n{}: {}\n".format(section.title, section.result))
+            lines.extend(section.format_record(record) for record in section.records)
+        return "".join(lines)
+
+    def to_json(self):
+        """Render the result and every record of the report as JSON. Numbers
+        are SI magnitudes.
+
+        Args:
+            none
+
+        Returns:
+            text: JSON object with the report name, result, records and
+            sections (string)
+        """
+        sections = [
+            {
+                "title": section.title,
+                "result": section.result,
+                "records": section.records_json(),
+            }
+            for section in self.sections
+        ]
+        return json.dumps(
+            {
+                "report": self.report_name,
+                "result": self.result,
+                "records": self.records_json(),
+                "sections": sections,
+            }
+        )
 
     def to_pdf(self, file_name=None, output_path=None):
-        """Convert report file to PDF
+        """Render the report as a PDF
 
         Args:
-            file_name: path to file to be converted. Defaults to None
-                which uses report_name associated with this ReportWriter object
+            file_name: path to a text file to convert instead of this report.
+                Defaults to None which renders the records of this ReportWriter
 
             output_path: path to output file. Defaults to None which replaces .txt
                 in report_name associated with this ReportWriter object with .pdf
@@ -70,25 +332,18 @@ class ReportWriter(object):
 
         """
         if file_name is None:
-            file_name = self.report_name
-
-        file = open(file_name, "r")
+            lines = self.to_text().splitlines(True)
+        else:
+            with open(file_name, "r") as file:
+                lines = file.readlines()
 
         if output_path is None:
-            output_path = ".".join(self.report_name.split(".")[:-1] + ["pdf"])
-
-        pdf = FPDF()
-        # add a page and set font
-        pdf.add_page()
-        pdf.set_font("Arial", size=15)
+            output_path = self.pdf_name
 
-        # insert the lines in pdf then save
-        for x in file:
-            pdf.multi_cell(0, 5, txt=x, align="L")
-        pdf.output(output_path)
+        write_pdf(lines, output_path)
 
     def close(self):
-        """Closes the report file associated with this ReportWriter
+        """Writes the text report to report_name. Only the first call writes.
 
         Args:
             none
@@ -96,4 +351,8 @@ class ReportWriter(object):
         Returns:
             none
         """
-        self.report_file.close()
+        if self.closed:
+            return
+        with open(self.report_name, "x") as report_file:
+            report_file.write(self.to_text())
+        self.closed = True
@@ -1,7 +1,16 @@
-from aguaclara.core.units import u
-from aguaclara.core import physchem as pc
-from aguaclara.core import constants as con
-import numpy as np
+from aide_validation.units import u
+import aide_validation.kernels as k
+from aide_validation.report_writer import Display, ParsedUnit
+
+
+def _flow(q):
+    # calculated flow rates are reported in L/s
+    return Display(q, u.m**3 / u.s, u.L / u.s)
+
+
+def _design_flow(q):
+    # the design flow rate is reported in the units of the model
+    return Display(q, u.m**3 / u.s, ParsedUnit({"Flow": 1}, u.L / u.s))
 
 
 def check_inlet_manifold(diam, pi_flow_manifold, vel_diffuser, q_input, report_writer):
@@ -24,29 +33,38 @@ def check_inlet_manifold(diam, pi_flow_manifold, vel_diffuser, q_input, report_w
     Returns:
         none
     """
+    q_input = k.to_si(q_input, u.m**3 / u.s)
+    inputs = {
+        "diam": k.to_si(diam, u.m),
+        "pi_flow_manifold": pi_flow_manifold,
+        "vel_diffuser": k.to_si(vel_diffuser, u.m / u.s),
+    }
+
     try:
-        q_calc = (
-            np.pi
-            * (
-                vel_diffuser
-                * np.sqrt(2 * (1 - pi_flow_manifold ** 2) / (pi_flow_manifold ** 2 + 1))
-            )
-            * diam ** 2
-        ) / 4
-        q_calc = q_calc.to(u.L / u.s)
+        q_calc = k.flow_inlet_manifold(**inputs)
 
         assert q_calc > q_input
 
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_inlet_manifold",
             "The inlet manifold design flow rate, {!s}, is less than "
-            "the one calculated by this validation "
-            "code, {!s}.\n".format(q_input, q_calc)
+            "the one calculated by this validation code, {!s}.\n",
+            (_design_flow(q_input), _flow(q_calc)),
+            inputs,
+            q_calc,
+            q_input,
         )
     except AssertionError:
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_inlet_manifold",
             "INVALID: The inlet manifold design flow rate, {!s}, is "
             "greater than the one calculated by this "
-            "validation code, {!s}.\n".format(q_input, q_calc)
+            "validation code, {!s}.\n",
+            (_design_flow(q_input), _flow(q_calc)),
+            inputs,
+            q_calc,
+            q_input,
+            passed=False,
         )
         report_writer.set_result("Invalid: Check Validation Report")
 
@@ -88,26 +106,41 @@ def check_plate_settlers(
     Returns:
         none
     """
+    q_input = k.to_si(q_input, u.m**3 / u.s)
+    inputs = {
+        "vel_capture": k.to_si(vel_capture, u.m / u.s),
+        "n_plate": n_plate,
+        "l_plate": k.to_si(l_plate, u.m),
+        "w_plate": k.to_si(w_plate, u.m),
+        "space_plate": k.to_si(space_plate, u.m),
+        "angle_plate": k.to_si(angle_plate, u.rad),
+    }
+
     try:
-        q_calc = vel_capture * (
-            n_plate
-            * w_plate
-            * (l_plate * np.cos(angle_plate) + (space_plate / np.sin(angle_plate)))
-        )
-        q_calc = q_calc.to(u.L / u.s)
+        q_calc = k.flow_plate_settlers(**inputs)
 
         assert q_calc > q_input
 
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_plate_settlers",
             "The plate settlers' design flow rate, {!s}, is less than "
-            "the one calculated by this validation "
-            "code, {!s}.\n".format(q_input, q_calc)
+            "the one calculated by this validation code, {!s}.\n",
+            (_design_flow(q_input), _flow(q_calc)),
+            inputs,
+            q_calc,
+            q_input,
         )
     except AssertionError:
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_plate_settlers",
             "INVALID: The plate settlers' design flow rate, {!s}, is "
             "greater than the one calculated by this "
-            "validation code, {!s}.\n".format(q_input, q_calc)
+            "validation code, {!s}.\n",
+            (_design_flow(q_input), _flow(q_calc)),
+            inputs,
+            q_calc,
+            q_input,
+            passed=False,
         )
         report_writer.set_result("Invalid: Check Validation Report")
 
@@ -130,22 +163,38 @@ def check_sed_tank(length, width, vel_up, q_input, report_writer):
     Returns:
         none
     """
+    q_input = k.to_si(q_input, u.m**3 / u.s)
+    inputs = {
+        "length": k.to_si(length, u.m),
+        "width": k.to_si(width, u.m),
+        "vel_up": k.to_si(vel_up, u.m / u.s),
+    }
+
     try:
-        q_calc = length * width * vel_up
-        q_calc = q_calc.to(u.L / u.s)
+        q_calc = k.flow_sed_tank(**inputs)
 
         assert q_calc > q_input
 
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_sed_tank",
             "The sed tank's design flow rate, {!s}, is less than "
-            "the one calculated by this validation "
-            "code, {!s}.\n".format(q_input, q_calc)
+            "the one calculated by this validation code, {!s}.\n",
+            (_design_flow(q_input), _flow(q_calc)),
+            inputs,
+            q_calc,
+            q_input,
         )
     except AssertionError:
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_sed_tank",
             "INVALID: The sed tank's design flow rate, {!s}, is "
             "greater than the one calculated by this "
-            "validation code, {!s}.\n".format(q_input, q_calc)
+            "validation code, {!s}.\n",
+            (_design_flow(q_input), _flow(q_calc)),
+            inputs,
+            q_calc,
+            q_input,
+            passed=False,
         )
         report_writer.set_result("Invalid: Check Validation Report")
 
@@ -157,7 +206,7 @@ def check_diffuser(
     max_hl,
     temp,
     report_writer,
-    shear_floc_max=0.5 * u.Pa,
+    shear_floc_max=0.5,
     pi_plane_jet=0.0124,
 ):
     """Check that the diffuser's are designed appropriately by first checking
@@ -188,50 +237,100 @@ def check_diffuser(
         Defaults to 0.0124
 
     Returns:
-        none
+        vel_diffuser: velocity through the diffuser (u.m / u.s)
     """
-    rho = pc.density_water(temp)
-    nu = pc.viscosity_kinematic_water(temp)
-    vel_diffuser = vel_up * w_sed / w_diffuser
+    inputs = {
+        "w_sed": k.to_si(w_sed, u.m),
+        "w_diffuser": k.to_si(w_diffuser, u.m),
+        "vel_up": k.to_si(vel_up, u.m / u.s),
+        "max_hl": k.to_si(max_hl, u.m),
+        "temp": k.to_si(temp, u.K),
+        "shear_floc_max": k.to_si(shear_floc_max, u.Pa),
+        "pi_plane_jet": pi_plane_jet,
+    }
+    w_sed = inputs["w_sed"]
+    vel_up = inputs["vel_up"]
+    max_hl = inputs["max_hl"]
+    vel_diffuser = k.vel_diffuser(vel_up, w_sed, inputs["w_diffuser"])
 
     try:
-        vel_max_shear = (
-            (shear_floc_max / rho) ** (1 / 2)
-            * (vel_up * w_sed / (nu * pi_plane_jet)) ** (1 / 4)
-        ).to(u.mm / u.s)
+        vel_max_shear = k.vel_max_shear(
+            vel_up,
+            w_sed,
+            inputs["temp"],
+            inputs["shear_floc_max"],
+            pi_plane_jet,
+        )
+        args = (
+            Display(vel_max_shear, u.m / u.s, u.mm / u.s),
+            Display(
+                vel_diffuser,
+                u.m / u.s,
+                ParsedUnit(
+                    {"V.SedUp": 1, "W.Sed": 1, "W.SedDiffuserInner": -1},
+                    u.mm / u.s,
+                ),
+            ),
+        )
         assert vel_diffuser < vel_max_shear
 
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_diffuser",
             "The max diffuser velocity based on floc shear, {!s}, "
             "is greater than the one calculated by this validation "
-            "code, {!s}.\n".format(vel_max_shear, vel_diffuser)
+            "code, {!s}.\n",
+            args,
+            inputs,
+            vel_diffuser,
+            vel_max_shear,
         )
     except AssertionError:
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_diffuser",
             "INVALID: The max diffuser velocity based on floc shear, {!s}, "
             "is less than the one calculated by this validation "
-            "code, {!s}.\n".format(vel_max_shear, vel_diffuser)
+            "code, {!s}.\n",
+            args,
+            inputs,
+            vel_diffuser,
+            vel_max_shear,
+            passed=False,
         )
         report_writer.set_result("Invalid: Check Validation Report")
 
     try:
-        head_loss = (vel_diffuser ** 2 / (2 * u.g_0)).to(u.cm)
+        head_loss = k.headloss_diffuser(vel_diffuser)
+        args = (
+            Display(max_hl, u.m, ParsedUnit({"HL.Diffuser": 1}, u.cm)),
+            Display(head_loss, u.m, u.cm),
+        )
         assert head_loss < max_hl
 
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_diffuser",
             "The max head loss, {!s}, is greater than "
             "the one calculated by this validation "
-            "code, {!s}.\n".format(max_hl, head_loss)
+            "code, {!s}.\n",
+            args,
+            inputs,
+            head_loss,
+            max_hl,
         )
     except AssertionError:
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_diffuser",
             "INVALID: The max head loss, {!s}, "
             "is less than the one calculated by this validation "
-            "code, {!s}.\n".format(max_hl, head_loss)
+            "code, {!s}.\n",
+            args,
+            inputs,
+            head_loss,
+            max_hl,
+            passed=False,
         )
         report_writer.set_result("Invalid: Check Validation Report")
 
-    return vel_diffuser
+    return k.from_si(vel_diffuser, u.m / u.s)
 
 
 def check_outlet_manifold(n_orifices, diam_orifice, hl_design, q_input, report_writer):
@@ -252,21 +351,36 @@ def check_outlet_manifold(n_orifices, diam_orifice, hl_design, q_input, report_w
     Returns:
         none
     """
+    q_input = k.to_si(q_input, u.m**3 / u.s)
+    inputs = {
+        "n_orifices": n_orifices,
+        "diam_orifice": k.to_si(diam_orifice, u.m),
+        "hl_design": k.to_si(hl_design, u.m),
+    }
+
     try:
-        q_calc = (
-            pc.flow_orifice(diam_orifice, hl_design, con.VC_ORIFICE_RATIO) * n_orifices
-        ).to(u.L / u.s)
+        q_calc = k.flow_outlet_manifold(**inputs)
         assert q_calc > q_input
 
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_outlet_manifold",
             "The outlet manifold design flow rate, {!s}, is less than "
-            "the one calculated by this validation "
-            "code, {!s}.\n".format(q_input, q_calc)
+            "the one calculated by this validation code, {!s}.\n",
+            (_design_flow(q_input), _flow(q_calc)),
+            inputs,
+            q_calc,
+            q_input,
         )
     except AssertionError:
-        report_writer.write_message(
+        report_writer.write_check(
+            "check_outlet_manifold",
             "INVALID: The outlet manifold design flow rate, {!s}, is "
             "greater than the one calculated by this "
-            "validation code, {!s}.\n".format(q_input, q_calc)
+            "validation code, {!s}.\n",
+            (_design_flow(q_input), _flow(q_calc)),
+            inputs,
+            q_calc,
+            q_input,
+            passed=False,
         )
         report_writer.set_result("Invalid: Check Validation Report")
@@ -0,0 +1,113 @@
+"""Sensitivity of the check margins to each measurement.
+Created on October 18, 2026
+
+The sensitivity of a check to a measurement is how much the check's margin
+changes for a relative change of the measurement, x * d(margin) / dx. A
+sensitivity of -2 means that making the measurement 1% larger lowers the
+margin by 0.02. Margins are those of the sweeps, relative to each check's
+limit, so sensitivities of different checks can be compared.
+
+Derivatives are central differences. Every measurement of a unit process is
+stepped up and down by STEP of its value in its own row of a perturbation
+matrix, and the vectorized sweeps of the process evaluate all rows in one
+call:
+
+    sensitivities(measurements)["check_G_theta"]["S.FlocBaffle"]
+
+Measurements which are lists, such as the height of each LFOM row, are
+scaled as a whole. Sensitivities through derived quantities, like the
+flocculator head loss, are included.
+"""
+
+import numpy as np
+from aide_validation.graph import CHECK_MEASUREMENTS
+from aide_validation.measurements import (
+    PROCESS_MEASUREMENTS,
+    available_processes,
+    to_si_measurements,
+)
+from aide_validation.monte_carlo import PROCESS_SWEEPS
+
+# relative step of the central differences
+STEP = 1e-6
+
+
+def perturbation_matrix(n_inputs, step=STEP):
+    """Returns the factor each input is scaled by in each row of a central
+    difference: row i scales input i by 1 + step and row n_inputs + i scales
+    it by 1 - step
+
+    Args:
+        n_inputs: number of inputs
+
+        step: relative step. Default: STEP
+
+    Returns:
+        factors: array of shape (2 * n_inputs, n_inputs)
+    """
+    identity = np.eye(n_inputs)
+    return 1 + step * np.vstack([identity, -identity])
+
+
+def si_sensitivities(si_measurements, process, step=STEP):
+    """Computes the sensitivity of every check of a unit process to each of
+    its measurements
+
+    Args:
+        si_measurements: dictionary of SI magnitudes, as returned by
+            to_si_measurements, with the measurements of process
+
+        process: Onshape Documenter unit process (e.g. "Floc")
+
+        step: relative step of the central differences. Default: STEP
+
+    Returns:
+        sensitivities: dictionary by check name of dictionaries of the
+        sensitivity to each measurement the check depends on, in the order of
+        CHECK_MEASUREMENTS
+    """
+    keys = PROCESS_MEASUREMENTS[process]
+    n = len(keys)
+    factors = perturbation_matrix(n, step)
+    rows = {}
+    for j, key in enumerate(keys):
+        value = np.asarray(si_measurements[key], dtype=float)
+        rows[key] = value * factors[:, j].reshape((-1,) + (1,) * value.ndim)
+
+    sensitivities = {}
+    # a step past a kernel's valid range gives a nan sensitivity
+    with np.errstate(invalid="ignore"):
+        for check, result in PROCESS_SWEEPS[process](rows).items():
+            margin = np.broadcast_to(result.margin, (2 * n,))
+            derivatives = dict(zip(keys, (margin[:n] - margin[n:]) / (2 * step)))
+            sensitivities[check] = {
+                key: float(derivatives[key]) for key in CHECK_MEASUREMENTS[check]
+            }
+    return sensitivities
+
+
+def sensitivities(measurements, processes=None, step=STEP):
+    """Computes the sensitivity of every check to each measurement it depends
+    on
+
+    Args:
+        measurements: dictionary of parsed variables
+
+        processes: unit processes to check. Defaults to None which checks
+        every unit process whose measurements are all present
+
+        step: relative step of the central differences. Default: STEP
+
+    Returns:
+        sensitivities: dictionary by check name of dictionaries of the
+        sensitivity to each measurement
+    """
+    if processes is None:
+        processes = available_processes(measurements)
+    results = {}
+    for process in processes:
+        si_measurements = to_si_measurements(
+            measurements, PROCESS_MEASUREMENTS[process]
+        )
+        results.update(si_sensitivities(si_measurements, process, step))
+    return results
@@ -0,0 +1,388 @@
+"""Long-running validation server with a JSON API.
+Created on October 18, 2026
+
+Starting Python, importing aguaclara and building its unit registry takes
+seconds, which every run of a script pays again. A ValidationServer pays it
+once and then validates requests on a pool of workers:
+
+    python -m aide_validation.server --port 8470
+
+Clients POST a JSON object to /validate with either the URL of an Onshape
+model, or measurements encoded like the MeasurementCache encodes them:
+
+    {"url": "https://cad.onshape.com/documents/..."}
+    {"measurements": {"Flow": {"__quantity__": [30, "liter"]}, ...},
+     "processes": ["Floc"]}
+
+and get back the result and the structured report of the validation, with
+the path of its PDF unless the server was started with --no-pdf. At most
+max_workers requests are validated at once and max_queue more wait for a
+worker. Requests beyond that are refused with 503 and a Retry-After header,
+so that a busy server pushes back instead of queueing without bound.
+GET /health reports how many requests are in flight.
+
+ValidationClient sends requests to a server over TCP or a Unix socket.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+from aide_validation.measurement_cache import MeasurementCache, decode_measurement
+from aide_validation.measurements import available_processes
+from aide_validation.report_writer import REPORT_DIR
+from aide_validation.validator import ValidationResult, Validator
+
+DEFAULT_PORT = 8470
+
+
+class ServerBusy(Exception):
+    """Raised when a ValidationServer's queue is full"""
+
+
+class ValidationServer(object):
+    """Validates requests on a bounded pool of warm workers"""
+
+    def __init__(self, max_workers=4, max_queue=16, **validator_kwargs):
+        """
+        Args:
+            max_workers: number of requests validated at once. Defaults to 4
+
+            max_queue: number of requests which may wait for a worker before
+                more are refused. Defaults to 16
+
+            validator_kwargs: passed to the Validator of each request, such as
+                cache, fetcher, report_dir, pdf_pipeline or pdf
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self.in_flight = 0
+        self.lock = threading.Lock()
+        self.validator_kwargs = validator_kwargs
+
+    def warm(self):
+        """Imports aguaclara and builds everything a validation loads lazily,
+        so that the first request is as fast as the rest. Without a fetcher,
+        the default fetcher and its Onshape client are created here and
+        every request fetches with them.
+
+        Args:
+            none
+
+        Returns:
+            none
+        """
+        import aguaclara.design.floc  # noqa: F401
+        import aide_validation.water as water
+        from aide_validation.units import u
+
+        u.m
+        water.viscosity_kinematic_water(np.array([water.TABLE_TEMP_MIN]))
+
+        if self.validator_kwargs.get("fetcher") is None:
+            import aguaclara.core.onshape_parser  # noqa: F401
+            from aide_validation.fetch import default_fetcher
+
+            fetcher = default_fetcher()
+            fetcher.get_client()
+            self.validator_kwargs["fetcher"] = fetcher
+
+    def submit(self, request):
+        """Queues a request for validation
+
+        Args:
+            request: dictionary with a "url", or "measurements" encoded with
+                encode_measurement and optionally "processes" and "url"
+
+        Returns:
+            response: Future which completes with the response dictionary
+
+        Raises:
+            ServerBusy: if max_workers + max_queue requests are in flight
+        """
+        if not self.slots.acquire(blocking=False):
+            raise ServerBusy("Validation queue is full")
+        with self.lock:
+            self.in_flight += 1
+        future = self.executor.submit(self.validate, request)
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future):
+        with self.lock:
+            self.in_flight -= 1
+        self.slots.release()
+
+    def validate(self, request):
+        """Validates a request now, in the calling thread
+
+        Args:
+            request: see submit
+
+        Returns:
+            response: dictionary with the result, URL, report name and the
+            report as JSON-compatible dictionaries. It has the path of the
+            report PDF under "pdf" unless the server was created with
+            pdf=False. The PDF has been written by the time the response is
+            returned, unless the server has a pdf_pipeline which writes it
+            in the background.
+        """
+        validator = Validator(**self.validator_kwargs)
+        url = request.get("url")
+        try:
+            if "measurements" in request:
+                measurements = decode_measurement(request["measurements"])
+                processes = request.get("processes")
+                if processes is None:
+                    processes = available_processes(measurements)
+                result = validator.validate_measurements(measurements, processes, url)
+            else:
+                result = validator.validate(url)
+        except Exception as e:
+            validator.report_writer.set_result("Error: {}".format(e))
+            validator.save_pdf()
+            result = ValidationResult(validator.report_writer.get_result(), url)
+
+        response = json.loads(validator.report_writer.to_json())
+        response.update({"result": str(result), "url": url})
+        if validator.pdf:
+            response["pdf"] = validator.report_writer.pdf_name
+        return response
+
+    def serve(self, host="127.0.0.1", port=DEFAULT_PORT, socket_path=None):
+        """Returns an HTTP server for this ValidationServer. Call its
+        serve_forever method to handle requests.
+
+        Args:
+            host: address to listen on. Defaults to "127.0.0.1"
+
+            port: TCP port to listen on, 0 for any free port.
+                Defaults to DEFAULT_PORT
+
+            socket_path: path of a Unix socket to listen on instead of a TCP
+                port. Defaults to None
+
+        Returns:
+            server: socketserver server
+        """
+        if socket_path is not None:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            server = _UnixHTTPServer(socket_path, _Handler)
+        else:
+            server = ThreadingHTTPServer((host, port), _Handler)
+        server.validation_server = self
+        return server
+
+    def close(self):
+        """Waits for the requests in flight and stops the workers
+
+        Args:
+            none
+
+        Returns:
+            none
+        """
+        self.executor.shutdown(wait=True)
+
+
+# Unix sockets aren't available on Windows
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # handles the JSON API of server.validation_server
+
+    def _send(self, status, body, headers=()):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for header in headers:
+            self.send_header(*header)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._send(404, {"error": "Not found"})
+            return
+        validation_server = self.server.validation_server
+        self._send(200, {"status": "ok", "in_flight": validation_server.in_flight})
+
+    def do_POST(self):
+        if self.path != "/validate":
+            self._send(404, {"error": "Not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            if not isinstance(request, dict) or not (
+                "url" in request or "measurements" in request
+            ):
+                raise ValueError("Request needs a url or measurements")
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+            return
+
+        try:
+            future = self.server.validation_server.submit(request)
+        except ServerBusy as e:
+            self._send(503, {"error": str(e)}, [("Retry-After", "1")])
+            return
+        self._send(200, future.result())
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return str(self.client_address or "unix")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class ValidationClient(object):
+    """Sends validation requests to a ValidationServer"""
+
+    def __init__(
+        self, host="127.0.0.1", port=DEFAULT_PORT, socket_path=None, timeout=None
+    ):
+        """
+        Args:
+            host: address of the server. Defaults to "127.0.0.1"
+
+            port: TCP port of the server. Defaults to DEFAULT_PORT
+
+            socket_path: path of the server's Unix socket, used instead of
+                host and port. Defaults to None
+
+            timeout: seconds to wait for a response. Defaults to None which
+                waits as long as the validation takes
+        """
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def _request(self, method, path, body=None):
+        if self.socket_path is not None:
+            connection = _UnixHTTPConnection(self.socket_path, self.timeout)
+        else:
+            connection = http.client.HTTPConnection(
+                self.host, self.port, timeout=self.timeout
+            )
+        try:
+            headers = {"Content-Type": "application/json"}
+            data = None if body is None else json.dumps(body)
+            connection.request(method, path, data, headers)
+            response = connection.getresponse()
+            content = json.loads(response.read())
+        finally:
+            connection.close()
+        if response.status == 503:
+            raise ServerBusy(content["error"])
+        elif response.status != 200:
+            raise ValueError(content["error"])
+        return content
+
+    def validate(self, url=None, measurements=None, processes=None):
+        """Validates an Onshape model, or measurements, on the server
+
+        Args:
+            url: URL of Onshape model to validate. Defaults to None
+
+            measurements: dictionary of variables encoded with
+                encode_measurement, validated instead of fetching url.
+                Defaults to None
+
+            processes: unit processes in measurements. Defaults to None which
+                validates every unit process whose measurements are present
+
+        Returns:
+            response: dictionary with the result and report
+
+        Raises:
+            ServerBusy: if the server's queue is full
+        """
+        request = {"url": url}
+        if measurements is not None:
+            request["measurements"] = measurements
+            if processes is not None:
+                request["processes"] = processes
+        return self._request("POST", "/validate", request)
+
+    def health(self):
+        """Returns the status of the server
+
+        Args:
+            none
+
+        Returns:
+            status: dictionary with "status" and "in_flight"
+        """
+        return self._request("GET", "/health")
+
+
+def main(args=None):
+    """Runs a ValidationServer until interrupted
+
+    Args:
+        args: command line arguments. Defaults to None which uses sys.argv
+
+    Returns:
+        none
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--socket", help="listen on this Unix socket instead")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue", type=int, default=16)
+    parser.add_argument("--cache-dir", help="cache Onshape versions here")
+    parser.add_argument("--report-dir", default=REPORT_DIR)
+    parser.add_argument("--no-pdf", action="store_true", help="don't write PDF reports")
+    options = parser.parse_args(args)
+
+    validation_server = ValidationServer(
+        max_workers=options.workers,
+        max_queue=options.queue,
+        cache=(
+            None if options.cache_dir is None else MeasurementCache(options.cache_dir)
+        ),
+        report_dir=options.report_dir,
+        pdf=not options.no_pdf,
+    )
+    validation_server.warm()
+    server = validation_server.serve(options.host, options.port, options.socket)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        validation_server.close()
+        if options.socket is not None:
+            os.remove(options.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+"""Compact binary snapshots of parsed measurements.
+Created on October 18, 2026
+
+A snapshot corpus stores many measurement dictionaries, like those the
+Validator checks, in a directory of flat binary arrays. Every magnitude goes
+into one float64 array, and lists such as H.LfomOrifices are stored as a
+contiguous run of it. Keys, unit strings and processes are interned in one
+string table, so each entry only stores their index:
+
+    with SnapshotWriter("corpus") as writer:
+        for measurements, processes in batch:
+            writer.add(measurements, processes)
+
+    corpus = SnapshotCorpus("corpus")
+    measurements, processes = corpus[12]
+    flows = corpus.column("Flow", "L")
+
+The writer appends each snapshot's entries and values to the array files as
+it is added, so a corpus can be larger than memory. Only the index, the
+string table and the length of each array, is written when the writer
+closes, and a corpus without one is incomplete. The arrays are
+memory-mapped when a corpus is opened. A snapshot is only turned back into
+pint quantities when it is read, and column reads one measurement of every
+snapshot without reading the rest. Values which aren't numbers, quantities,
+lists of them or strings are stored as the JSON of encode_measurement, and
+so are lists which mix ints and floats, to keep the type of each item.
+"""
+
+import json
+import os
+import numpy as np
+from aide_validation.measurement_cache import decode_measurement, encode_measurement
+from aide_validation.units import u
+
+SNAPSHOT_VERSION = 2
+
+# kinds of entries. A scalar is a number or a quantity with a number
+# magnitude, an array a quantity with a 1D NumPy array magnitude, a list a
+# Python list of numbers or of quantities in the same unit. Strings and JSON
+# are stored in the string table.
+SCALAR = 0
+ARRAY = 1
+LIST = 2
+STRING = 3
+JSON = 4
+
+# one entry of a snapshot. unit is -1 for values without units. Numeric
+# entries are values[start:start + length], and integer says whether they
+# were ints. String and JSON entries are strings[start].
+ENTRY_DTYPE = np.dtype(
+    [
+        ("key", "<i4"),
+        ("kind", "u1"),
+        ("integer", "?"),
+        ("unit", "<i4"),
+        ("start", "<i8"),
+        ("length", "<i8"),
+    ]
+)
+
+# dtype of each array of a corpus directory. Arrays are stored little-endian
+# in name + ".bin".
+_ARRAYS = {
+    "offsets": np.dtype("<i8"),
+    "entries": ENTRY_DTYPE,
+    "values": np.dtype("<f8"),
+    "process_offsets": np.dtype("<i8"),
+    "processes": np.dtype("<i4"),
+}
+_INDEX = "index.json"
+
+
+def _is_number(value):
+    return isinstance(value, (int, float, np.number)) and not isinstance(
+        value, (bool, np.bool_)
+    )
+
+
+def _numeric(value):
+    # (kind, unit string or None, list or array of magnitudes) of a numeric
+    # value, or None if it isn't one
+    units = None
+    magnitude = value
+    if isinstance(value, u.Quantity):
+        units = str(value.units)
+        magnitude = value.magnitude
+    if _is_number(magnitude):
+        return SCALAR, units, [magnitude]
+    elif isinstance(magnitude, np.ndarray):
+        if magnitude.ndim == 1 and magnitude.dtype.kind in "iuf":
+            return ARRAY, units, magnitude
+        return None
+    elif units is None and isinstance(value, list):
+        quantities = [isinstance(item, u.Quantity) for item in value]
+        magnitudes = value
+        if any(quantities):
+            unit_set = {
+                str(item.units) for item in value if isinstance(item, u.Quantity)
+            }
+            if not all(quantities) or len(unit_set) != 1:
+                return None
+            units = unit_set.pop()
+            magnitudes = [item.magnitude for item in value]
+        if not all(_is_number(item) for item in magnitudes):
+            return None
+        integers = {isinstance(item, (int, np.integer)) for item in magnitudes}
+        if len(integers) > 1:
+            # ints and floats can't share one integer flag
+            return None
+        return LIST, units, magnitudes
+    return None
+
+
+class SnapshotWriter(object):
+    """Writes measurement dictionaries to a snapshot corpus directory"""
+
+    def __init__(self, path):
+        """
+        Args:
+            path: directory to write the corpus to, created if it doesn't
+                exist
+        """
+        self.path = path
+        self.strings = []
+        self.string_ids = {}
+        # number of items written to each array
+        self.lengths = dict.fromkeys(_ARRAYS, 0)
+        os.makedirs(path, exist_ok=True)
+        self.files = {
+            name: open(os.path.join(path, name + ".bin"), "wb") for name in _ARRAYS
+        }
+        self._write("offsets", [0])
+        self._write("process_offsets", [0])
+
+    def _write(self, name, items):
+        # appends items to the array file called name
+        array = np.asarray(items, dtype=_ARRAYS[name])
+        self.files[name].write(array.tobytes())
+        self.lengths[name] += len(array)
+
+    def intern(self, text):
+        """Returns the index of text in the string table, adding it if needed
+
+        Args:
+            text: string
+
+        Returns:
+            index: int
+        """
+        index = self.string_ids.get(text)
+        if index is None:
+            index = self.string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return index
+
+    def add(self, measurements, processes=()):
+        """Adds a snapshot
+
+        Args:
+            measurements: dictionary of parsed variables
+
+            processes: list of unit processes in the Onshape model.
+                Defaults to ()
+
+        Returns:
+            index: index of the snapshot in the corpus
+        """
+        entries = []
+        values = []
+        n_values = self.lengths["values"]
+        for key, value in measurements.items():
+            numeric = _numeric(value)
+            if numeric is not None:
+                kind, units, magnitudes = numeric
+                magnitudes = np.asarray(magnitudes)
+                entry = (
+                    kind,
+                    magnitudes.dtype.kind in "iu",
+                    -1 if units is None else self.intern(units),
+                    n_values,
+                    len(magnitudes),
+                )
+                values.append(magnitudes)
+                n_values += len(magnitudes)
+            elif isinstance(value, str):
+                entry = (STRING, False, -1, self.intern(value), 0)
+            else:
+                text = json.dumps(encode_measurement(value))
+                entry = (JSON, False, -1, self.intern(text), 0)
+            entries.append((self.intern(key),) + entry)
+
+        self._write("entries", entries)
+        if values:
+            self._write("values", np.concatenate(values))
+        self._write("offsets", [self.lengths["entries"]])
+        self._write("processes", [self.intern(process) for process in processes])
+        self._write("process_offsets", [self.lengths["processes"]])
+        return self.lengths["offsets"] - 2
+
+    def close(self):
+        """Finishes the array files and writes the index of the corpus
+
+        Args:
+            none
+
+        Returns:
+            none
+        """
+        self._close_files()
+        index = {
+            "version": SNAPSHOT_VERSION,
+            "lengths": self.lengths,
+            "strings": self.strings,
+        }
+        with open(os.path.join(self.path, _INDEX), "w") as file:
+            json.dump(index, file)
+
+    def _close_files(self):
+        for file in self.files.values():
+            file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # without an index the corpus can't be opened
+            self._close_files()
+
+
+def save_snapshots(path, snapshots):
+    """Writes a snapshot corpus
+
+    Args:
+        path: directory to write the corpus to
+
+        snapshots: iterable of (measurements, processes)
+
+    Returns:
+        none
+    """
+    with SnapshotWriter(path) as writer:
+        for measurements, processes in snapshots:
+            writer.add(measurements, processes)
+
+
+def _load(path, dtype, length, mmap_mode):
+    # reads the first length items of an array file, or maps them
+    if mmap_mode is None:
+        return np.fromfile(path, dtype=dtype, count=length)
+    elif length == 0:
+        # an empty file can't be mapped
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mmap_mode, shape=(length,))
+
+
+class SnapshotCorpus(object):
+    """Snapshots read from a corpus directory written by SnapshotWriter"""
+
+    def __init__(self, path, mmap_mode="r"):
+        """
+        Args:
+            path: directory of the corpus
+
+            mmap_mode: mode of numpy.memmap. Defaults to "r" which maps
+                the arrays instead of reading them. None reads them.
+        """
+        with open(os.path.join(path, _INDEX)) as file:
+            index = json.load(file)
+        if index["version"] != SNAPSHOT_VERSION:
+            raise ValueError("Unsupported snapshot version {}".format(index["version"]))
+        self.strings = index["strings"]
+        self.string_ids = {text: i for i, text in enumerate(self.strings)}
+        for name, dtype in _ARRAYS.items():
+            array = _load(
+                os.path.join(path, name + ".bin"),
+                dtype,
+                index["lengths"][name],
+                mmap_mode,
+            )
+            setattr(self, name, array)
+        # pint units of each unit string, built when first needed
+        self.units = {}
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        """Returns the measurements and processes of a snapshot"""
+        if not -len(self) <= index < len(self):
+            raise IndexError("Snapshot index out of range")
+        index %= len(self)
+        entries = self.entries[self.offsets[index] : self.offsets[index + 1]]
+        measurements = {
+            self.strings[entry["key"]]: self._value(entry) for entry in entries
+        }
+        processes = self.processes[
+            self.process_offsets[index] : self.process_offsets[index + 1]
+        ]
+        return measurements, [self.strings[process] for process in processes]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def _unit(self, unit):
+        if unit not in self.units:
+            self.units[unit] = u.Unit(self.strings[unit])
+        return self.units[unit]
+
+    def _value(self, entry):
+        kind = entry["kind"]
+        if kind == STRING:
+            return self.strings[entry["start"]]
+        elif kind == JSON:
+            return decode_measurement(json.loads(self.strings[entry["start"]]))
+
+        start = entry["start"]
+        values = np.array(self.values[start : start + entry["length"]])
+        if entry["integer"]:
+            values = values.astype(np.int64)
+        if kind == ARRAY:
+            value = values
+        else:
+            value = values.tolist()
+            if kind == SCALAR:
+                value = value[0]
+        if entry["unit"] < 0:
+            return value
+        unit = self._unit(entry["unit"])
+        if kind == LIST:
+            return [u.Quantity(item, unit) for item in value]
+        return u.Quantity(value, unit)
+
+    def column(self, key, unit=None):
+        """Returns one scalar measurement of every snapshot, without reading
+        the others
+
+        Args:
+            key: name of the measurement (e.g. "Flow")
+
+            unit: unit to convert the magnitudes to. Defaults to None which
+                returns the magnitudes as stored
+
+        Returns:
+            magnitudes: float array with one element per snapshot, nan where
+            the measurement is missing or isn't a scalar
+        """
+        column = np.full(len(self), np.nan)
+        key_id = self.string_ids.get(key)
+        if key_id is None:
+            return column
+        (rows,) = np.nonzero(
+            (self.entries["key"] == key_id) & (self.entries["kind"] == SCALAR)
+        )
+        entries = self.entries[rows]
+        snapshots = np.searchsorted(self.offsets, rows, side="right") - 1
+        magnitudes = self.values[entries["start"]]
+        if unit is not None:
+            # each unit string is converted at once, so offset units like
+            # degrees Celsius convert correctly
+            for unit_id in np.unique(entries["unit"]):
+                if unit_id < 0:
+                    continue
+                same = entries["unit"] == unit_id
+                magnitudes[same] = u.Quantity(
+                    magnitudes[same], self._unit(unit_id)
+                ).m_as(unit)
+        column[snapshots] = magnitudes
+        return column
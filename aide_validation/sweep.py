@@ -0,0 +1,385 @@
+"""Vectorized parameter sweeps over the validation checks.
+Created on October 18, 2026
+
+Every argument of a sweep may be a number, a NumPy array or a pint quantity
+(array). Plain numbers are taken to be in SI units, so temperatures without
+units are in kelvin. Arguments are broadcast against each other, so a full
+factorial sweep can be built with grid. Each sweep evaluates all points at
+once and returns a SweepResult of arrays:
+
+    value: the quantity the check computes, in SI units
+
+    margin: how far value is from failing, relative to the limit. Positive
+    margins pass, negative margins fail.
+
+    passed: whether the check passes at each point
+"""
+
+from collections import namedtuple
+import numpy as np
+from aide_validation.units import u
+import aide_validation.kernels as k
+
+SweepResult = namedtuple("SweepResult", ["value", "margin", "passed"])
+
+
+def grid(**axes):
+    """Reshapes 1D sweep axes so that they broadcast to a full grid, with one
+    dimension per axis in the order given. No memory is used for the grid.
+
+    Args:
+        axes: 1D array of values for each swept argument
+
+    Returns:
+        axes: dictionary of the reshaped axes, to be passed to a sweep
+    """
+    ndim = len(axes)
+    reshaped = {}
+    for i, (name, values) in enumerate(axes.items()):
+        shape = [1] * ndim
+        shape[i] = -1
+        reshaped[name] = np.reshape(values, shape)
+    return reshaped
+
+
+def _broadcast(*args):
+    # convert (value, unit) pairs to SI and broadcast them to a common shape
+    return np.broadcast_arrays(
+        *[np.asarray(k.to_si(value, unit), dtype=float) for value, unit in args]
+    )
+
+
+def sweep_baffle_spacing(channel_l, baffle_s):
+    """Sweeps check_baffle_spacing. value is the ratio of channel length to
+    baffle spacing, which must be between 3 and 6.
+
+    Args:
+        channel_l: length of channel (u.m)
+
+        baffle_s: space (edge-to-edge) between two baffles (u.m)
+
+    Returns:
+        result: SweepResult of arrays
+    """
+    channel_l, baffle_s = _broadcast((channel_l, u.m), (baffle_s, u.m))
+    ratio = k.baffle_ratio(channel_l, baffle_s)
+    margin = np.minimum((ratio - 3) / 3, (6 - ratio) / 6)
+    return SweepResult(ratio, margin, (3 <= ratio) & (ratio <= 6))
+
+
+def sweep_G_theta(
+    q,
+    channel_l,
+    design_water_height,
+    channel_n,
+    channel_w,
+    hl,
+    temp,
+    min_G_theta=30000,
+):
+    """Sweeps check_G_theta. value is G theta, which must be above min_G_theta.
+
+    Args:
+        q: design flow rate (u.L / u.s)
+
+        channel_l: length of one channel (u.m)
+
+        design_water_height: intended height of water in the flocculator (u.m)
+
+        channel_n: number of flocculator channels
+
+        channel_w: width of one channel (u.m)
+
+        hl: headloss throught the flocculator (u.m)
+
+        temp: design temperature (u.degC). Plain numbers are in kelvin,
+            not degrees Celsius.
+
+        min_G_theta: minimum allowable G theta. Default: 30000
+
+    Returns:
+        result: SweepResult of arrays
+    """
+    args = _broadcast(
+        (q, u.m**3 / u.s),
+        (channel_l, u.m),
+        (design_water_height, u.m),
+        (channel_n, u.dimensionless),
+        (channel_w, u.m),
+        (hl, u.m),
+        (temp, u.K),
+        (min_G_theta, u.dimensionless),
+    )
+    G_theta = k.G_theta(*args[:-1])
+    min_G_theta = args[-1]
+    return SweepResult(
+        G_theta, (G_theta - min_G_theta) / min_G_theta, G_theta > min_G_theta
+    )
+
+
+def sweep_diffuser(
+    w_sed,
+    w_diffuser,
+    vel_up,
+    max_hl,
+    temp,
+    shear_floc_max=0.5,
+    pi_plane_jet=0.0124,
+):
+    """Sweeps check_diffuser. value is the diffuser velocity (m / s), which must
+    be below the velocity that breaks flocs while the diffuser head loss stays
+    below max_hl. margin is the smaller margin of the two.
+
+    Args:
+        w_sed: width of the sed tank (u.m)
+
+        w_diffuser: width of a diffuser (u.m)
+
+        vel_up: design upflow velocity through the sed tank (u.m / u.s)
+
+        max_hl: maximum allowable head loss over a diffuser (u.m)
+
+        temp: design temperature (u.degC). Plain numbers are in kelvin,
+            not degrees Celsius.
+
+        shear_floc_max: maximum shear allowed without disrupting flocculation.
+        Defaults to 0.5 Pascals
+
+        pi_plane_jet: the amount of energy lost in the time that it takes for
+        the jet to travel it's width normalized by the total kinetic energy.
+        Defaults to 0.0124
+
+    Returns:
+        result: SweepResult of arrays
+    """
+    w_sed, w_diffuser, vel_up, max_hl, temp, shear_floc_max, pi_plane_jet = _broadcast(
+        (w_sed, u.m),
+        (w_diffuser, u.m),
+        (vel_up, u.m / u.s),
+        (max_hl, u.m),
+        (temp, u.K),
+        (shear_floc_max, u.Pa),
+        (pi_plane_jet, u.dimensionless),
+    )
+    vel_diffuser = k.vel_diffuser(vel_up, w_sed, w_diffuser)
+    vel_max_shear = k.vel_max_shear(vel_up, w_sed, temp, shear_floc_max, pi_plane_jet)
+    head_loss = k.headloss_diffuser(vel_diffuser)
+    margin = np.minimum(
+        (vel_max_shear - vel_diffuser) / vel_max_shear, (max_hl - head_loss) / max_hl
+    )
+    passed = (vel_diffuser < vel_max_shear) & (head_loss < max_hl)
+    return SweepResult(vel_diffuser, margin, passed)
+
+
+def sweep_sed_tank(length, width, vel_up, q_input):
+    """Sweeps check_sed_tank. value is the flow (m^3 / s) the tank can treat,
+    which must be above q_input.
+
+    Args:
+        length: length of the tank (u.m)
+
+        width: width of the tank (u.m)
+
+        vel_up: design upflow velocity through the sed tank (u.m / u.s)
+
+        q_input: design flow rate (u.L / u.s)
+
+    Returns:
+        result: SweepResult of arrays
+    """
+    length, width, vel_up, q_input = _broadcast(
+        (length, u.m), (width, u.m), (vel_up, u.m / u.s), (q_input, u.m**3 / u.s)
+    )
+    q_calc = k.flow_sed_tank(length, width, vel_up)
+    return SweepResult(q_calc, (q_calc - q_input) / q_input, q_calc > q_input)
+
+
+def sweep_plate_settlers(
+    vel_capture,
+    n_plate,
+    l_plate,
+    w_plate,
+    space_plate,
+    angle_plate,
+    plate_thickness,
+    q_input,
+):
+    """Sweeps check_plate_settlers. value is the flow (m^3 / s) the plate
+    settlers can treat, which must be above q_input.
+
+    Args:
+        vel_capture: design capture velocity (u.m / u.s)
+
+        n_plate: number of plates
+
+        l_plate: length of one plate (u.m)
+
+        w_plate: width of one plate (u.m)
+
+        space_plate: edge-to-edge spacing between plates (u.m)
+
+        angle_plate: the angle of each plate from horizontal (u.deg)
+
+        plate_thickness: thickness of one plate (u.m)
+
+        q_input: design flow rate (u.L / u.s)
+
+    Returns:
+        result: SweepResult of arrays
+    """
+    args = _broadcast(
+        (vel_capture, u.m / u.s),
+        (n_plate, u.dimensionless),
+        (l_plate, u.m),
+        (w_plate, u.m),
+        (space_plate, u.m),
+        (angle_plate, u.rad),
+        (plate_thickness, u.m),
+        (q_input, u.m**3 / u.s),
+    )
+    q_input = args[-1]
+    q_calc = k.flow_plate_settlers(*args[:6])
+    return SweepResult(q_calc, (q_calc - q_input) / q_input, q_calc > q_input)
+
+
+def sweep_inlet_manifold(diam, pi_flow_manifold, vel_diffuser, q_input):
+    """Sweeps check_inlet_manifold. value is the flow (m^3 / s) the manifold can
+    carry, which must be above q_input.
+
+    Args:
+        diam: inner diameter of the inlet manifold (u.m)
+
+        pi_flow_manifold: ratio of the minimum to maximum port flows
+
+        vel_diffuser: velocity out of the diffusers (u.m / u.s)
+
+        q_input: design flow rate (u.L / u.s)
+
+    Returns:
+        result: SweepResult of arrays
+    """
+    diam, pi_flow_manifold, vel_diffuser, q_input = _broadcast(
+        (diam, u.m),
+        (pi_flow_manifold, u.dimensionless),
+        (vel_diffuser, u.m / u.s),
+        (q_input, u.m**3 / u.s),
+    )
+    q_calc = k.flow_inlet_manifold(diam, pi_flow_manifold, vel_diffuser)
+    return SweepResult(q_calc, (q_calc - q_input) / q_input, q_calc > q_input)
+
+
+def sweep_outlet_manifold(n_orifices, diam_orifice, hl_design, q_input):
+    """Sweeps check_outlet_manifold. value is the flow (m^3 / s) through the
+    outlet manifold's orifices, which must be above q_input.
+
+    Args:
+        n_orifices: number of orifices in the outlet manifold
+
+        diam_orifice: diameter of one orifice (u.m)
+
+        hl_design: design head loss over the orifices (u.m)
+
+        q_input: design flow rate (u.L / u.s)
+
+    Returns:
+        result: SweepResult of arrays
+    """
+    n_orifices, diam_orifice, hl_design, q_input = _broadcast(
+        (n_orifices, u.dimensionless),
+        (diam_orifice, u.m),
+        (hl_design, u.m),
+        (q_input, u.m**3 / u.s),
+    )
+    q_calc = k.flow_outlet_manifold(n_orifices, diam_orifice, hl_design)
+    return SweepResult(q_calc, (q_calc - q_input) / q_input, q_calc > q_input)
+
+
+def sweep_flow_lfom_vert(
+    diameter, ori_heights, ori_numbers, cutoff, q_input, chunk_size=4096
+):
+    """Sweeps check_flow_lfom_vert. value is the flow (m^3 / s) through the LFOM
+    when the water is half a diameter above the top row, which must be within
+    cutoff of q_input. margin is how much of cutoff is left.
+
+    The rows of the LFOM are the last axis of ori_heights and ori_numbers, and
+    the other arguments broadcast against their remaining axes. The flow is
+    integrated with flow_orifice_vert_array rather than the exact quadrature
+    of the check, so points within 1e-6 of the cutoff may disagree with it.
+
+    Args:
+        diameter: diameter of each orifice (u.m)
+
+        ori_heights: height of each row of the LFOM (u.m)
+
+        ori_numbers: number of orifices at each row of the LFOM
+
+        cutoff: allowable tolerance between design and expected flow as a
+        fraction
+
+        q_input: design flow rate (u.L / u.s)
+
+        chunk_size: number of points integrated at once, which bounds the
+        memory used. Default: 4096
+
+    Returns:
+        result: SweepResult of arrays
+    """
+    diameter, cutoff, q_input = _broadcast(
+        (diameter, u.m), (cutoff, u.dimensionless), (q_input, u.m**3 / u.s)
+    )
+    ori_heights = np.asarray(k.to_si(ori_heights, u.m), dtype=float)
+    ori_numbers = np.asarray(k.to_si(ori_numbers, u.dimensionless), dtype=float)
+    n_rows = ori_heights.shape[-1]
+    shape = np.broadcast_shapes(
+        diameter.shape, ori_heights.shape[:-1], ori_numbers.shape[:-1]
+    )
+
+    # flatten the points so that they can be integrated a chunk at a time
+    diameters = np.broadcast_to(diameter, shape).reshape(-1)
+    heights = np.broadcast_to(ori_heights, shape + (n_rows,)).reshape(-1, n_rows)
+    numbers = np.broadcast_to(ori_numbers, shape + (n_rows,)).reshape(-1, n_rows)
+    q_calc = np.empty(diameters.shape)
+    for start in range(0, len(q_calc), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        diam = diameters[chunk, None]
+        height = heights[chunk, -1:] + 0.5 * diam
+        flow_rows = k.flow_orifice_vert_array(diam, height - heights[chunk])
+        q_calc[chunk] = np.sum(flow_rows * numbers[chunk], axis=-1)
+
+    q_calc, cutoff, q_input = np.broadcast_arrays(
+        q_calc.reshape(shape), cutoff, q_input
+    )
+    deviation = (q_calc - q_input) / q_input
+    passed = (cutoff > deviation) & (-cutoff < deviation)
+    return SweepResult(q_calc, (cutoff - np.abs(deviation)) / cutoff, passed)
+
+
+SWEEPS = {
+    "check_baffle_spacing": sweep_baffle_spacing,
+    "check_G_theta": sweep_G_theta,
+    "check_diffuser": sweep_diffuser,
+    "check_sed_tank": sweep_sed_tank,
+    "check_plate_settlers": sweep_plate_settlers,
+    "check_inlet_manifold": sweep_inlet_manifold,
+    "check_outlet_manifold": sweep_outlet_manifold,
+    "check_flow_lfom_vert": sweep_flow_lfom_vert,
+}
+
+
+def sweep(check, **inputs):
+    """Evaluates a check over arrays of its arguments in one vectorized call
+
+    Args:
+        check: check function, or its name (e.g. "check_G_theta")
+
+        inputs: the check's arguments, except report_writer
+
+    Returns:
+        result: SweepResult of arrays
+    """
+    name = check if isinstance(check, str) else check.__name__
+    try:
+        sweep_check = SWEEPS[name]
+    except KeyError:
+        raise ValueError("No sweep is available for {}".format(name))
+    return sweep_check(**inputs)
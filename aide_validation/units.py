@@ -0,0 +1,28 @@
+"""Lazily loaded unit registry.
+Created on October 18, 2026
+
+Importing any part of aguaclara imports all of its core, design and research
+modules, which takes seconds. Modules in this package use the u defined here
+instead, which only loads aguaclara's unit registry the first time a unit is
+used.
+"""
+
+
+class LazyUnitRegistry(object):
+    """Stands in for aguaclara.core.units.u until a unit is first used"""
+
+    def __getattr__(self, name):
+        from aguaclara.core.units import u
+
+        value = getattr(u, name)
+        # cache the attribute so later lookups skip __getattr__
+        setattr(self, name, value)
+        return value
+
+    def __call__(self, *args, **kwargs):
+        from aguaclara.core.units import u
+
+        return u(*args, **kwargs)
+
+
+u = LazyUnitRegistry()
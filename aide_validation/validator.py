@@ -1,24 +1,124 @@
-from aguaclara.core.units import u
-import aguaclara.core.physchem as pc
-import aguaclara.core.onshape_parser as par
-from aguaclara.design.floc import Flocculator
-from aide_validation.report_writer import ReportWriter
-from aide_validation.floc_validation import check_baffle_spacing, check_G_theta
-from aide_validation.lfom_validation import check_flow_lfom_vert
-from aide_validation.sed_validation import (
-    check_inlet_manifold,
-    check_outlet_manifold,
-    check_diffuser,
-    check_sed_tank,
-    check_plate_settlers,
+from concurrent.futures import Future, ThreadPoolExecutor
+from aide_validation.graph import CHECK_GRAPH, PROCESS_CHECKS, Evaluation
+from aide_validation.instrumentation import NULL_TIMINGS
+from aide_validation.measurements import (
+    PROCESS_MEASUREMENTS,
+    missing_measurements,
+    required_measurements,
+    to_si_measurements,
 )
+from aide_validation.report_writer import REPORT_DIR, ReportSection, ReportWriter
+
+# unit processes in the order their sections appear in a report, as
+# (Onshape Documenter process, section title, Validator method name)
+UNIT_PROCESSES = [
+    ("ET", "LFOM", "validate_lfom"),
+    ("Floc", "Flocculator", "validate_floc"),
+    ("Sed", "Sedimentation Tank", "validate_sed"),
+]
+
+# measurements any unit process reads. Cached measurements are projected to
+# these, so they are part of the cache key.
+CACHED_MEASUREMENTS = required_measurements(PROCESS_MEASUREMENTS)
+
+
+def combine_results(results):
+    """Combines the results of several unit processes into one verdict. Errors
+    outrank invalid results, which outrank valid ones, and ties go to the
+    first result, so the verdict doesn't depend on which process finished
+    first.
+
+    Args:
+        results: result of each unit process, in UNIT_PROCESSES order
+        (list of strings)
+
+    Returns:
+        result: combined result (string)
+    """
+    for prefix in ["Error", "Invalid"]:
+        for result in results:
+            if result.startswith(prefix):
+                return result
+    return "Valid"
+
+
+def _report_missing(report_writer, measurements, process):
+    # lists the measurements of process which are missing in report_writer,
+    # with an Error result naming the first one like the KeyError reading it
+    # would. Returns whether any were missing.
+    missing = missing_measurements(measurements, process)
+    if missing:
+        report_writer.write_message(
+            "Missing measurements: {}\n".format(", ".join(missing))
+        )
+        report_writer.set_result("Error: {!r}".format(missing[0]))
+    return bool(missing)
+
+
+def _reuse(report_writer, reuse, check):
+    # copies the records of check from an earlier validation into
+    # report_writer, if they are still valid. Returns whether it did.
+    if reuse is None or check not in reuse:
+        return False
+    for record in reuse[check]:
+        report_writer.records.append(record)
+        if not record.passed:
+            report_writer.set_result("Invalid: Check Validation Report")
+    return True
+
+
+class ValidationResult(str):
+    """Text which represents a validation result, along with the URL and report
+    it belongs to. Compares equal to the plain result text. pdf is a Future
+    which completes with the path of the report PDF once it is written, and
+    timings are the Timings of the validation, if it was instrumented."""
+
+    def __new__(cls, result, url=None, report_name=None, pdf=None, timings=None):
+        obj = super().__new__(cls, result)
+        obj.url = url
+        obj.report_name = report_name
+        obj.pdf = pdf
+        obj.timings = timings
+        return obj
 
 
 class Validator(object):
     """Class to orchestrate validation of an AguaClara plant"""
 
-    def __init__(self):
-        self.report_writer = ReportWriter()
+    def __init__(
+        self,
+        report_suffix="",
+        cache=None,
+        lfom_rating_curve=False,
+        fetcher=None,
+        report_dir=REPORT_DIR,
+        pdf_pipeline=None,
+        timings=None,
+        revalidation=None,
+        pdf=True,
+        sensitivity=False,
+    ):
+        self.report_writer = ReportWriter(suffix=report_suffix, output_dir=report_dir)
+        self.report_dir = report_dir
+        # optional MeasurementCache for immutable Onshape versions
+        self.cache = cache
+        # optional callable returning the raw Onshape response for a URL,
+        # e.g. a RecordingFetcher or ReplayFetcher. Defaults to the fetcher
+        # shared by every Validator, returned by fetch.default_fetcher
+        self.fetcher = fetcher
+        # also check the LFOM's flow over its whole range of water heights
+        self.lfom_rating_curve = lfom_rating_curve
+        # optional PdfPipeline to write PDFs in the background
+        self.pdf_pipeline = pdf_pipeline
+        # optional Timings to record how long each phase takes
+        self.timings = NULL_TIMINGS if timings is None else timings
+        # optional RevalidationCache to only rerun the checks whose
+        # measurements changed since a URL was last validated
+        self.revalidation = revalidation
+        # write a PDF of each report as well as the text report
+        self.pdf = pdf
+        # add the sensitivity of each check to its measurements to the report
+        self.sensitivity = sensitivity
 
     def close_report(self):
         """Closes the report file associated with this Validator
@@ -33,16 +133,64 @@ class Validator(object):
 
     def save_pdf(self):
         """Closes the report file associated with this Validator
-        then converts it to a PDF.
+        then converts it to a PDF. If this Validator has a PdfPipeline the PDF
+        is written in the background.
 
         Args:
             none
 
         Returns:
-            none
+            pdf: Future which completes with the path of the PDF, or None if
+            this Validator doesn't write PDFs
         """
         self.close_report()
+        pdf = Future()
+        if not self.pdf:
+            pdf.set_result(None)
+            return pdf
+        if self.pdf_pipeline is not None:
+            return self.pdf_pipeline.submit(self.report_writer)
+
         self.report_writer.to_pdf()
+        pdf.set_result(self.report_writer.pdf_name)
+        return pdf
+
+    def fetch(self, url):
+        """Fetches and parses the measurements of the Onshape model at the given URL.
+        If this Validator has a cache, immutable versions are only fetched once.
+
+        Args:
+            url: URL of Onshape model to validate (string)
+
+        Returns:
+            measurements: dictionary of parsed variables
+
+            processes: list of unit processes in the given Onshape model
+        """
+        if self.cache is not None:
+            with self.timings.span("cache.get"):
+                cached = self.cache.get(url, CACHED_MEASUREMENTS)
+            if cached is not None:
+                return cached
+
+        # the fetch and recorder modules import onshape_client and the onshape
+        # parser when they are used, so they are only imported to fetch a URL
+        from aide_validation.fetch import default_fetcher
+        from aide_validation.recorder import parse_documenter
+
+        fetcher = default_fetcher() if self.fetcher is None else self.fetcher
+        with self.timings.span("fetch"):
+            data = fetcher(url)
+        with self.timings.span("parse"):
+            # only the measurements of the model's unit processes are
+            # converted to quantities
+            measurements, processes = parse_documenter(data, required_measurements)
+
+        if self.cache is not None:
+            with self.timings.span("cache.put"):
+                self.cache.put(url, measurements, processes, CACHED_MEASUREMENTS)
+
+        return measurements, processes
 
     def validate(self, url):
         """Validates the if the AguaClara component or plant model
@@ -52,163 +200,260 @@ class Validator(object):
             url: URL of Onshape model to validate (string)
 
         Returns:
-            result: text which represents validation result (string)
+            result: text which represents validation result (ValidationResult)
+
+        Raises:
+            RuntimeError: if this Validator has already saved its report
         """
-        measurements, _, processes = par.get_parsed_measurements(
-            link=url, for_docs=False
-        )
-        result = "Invalid: No Unit Process Selected by Onshape Documenter"
+        self._check_unused()
+        with self.timings.profiled():
+            measurements, processes = self.fetch(url)
+            return self.validate_measurements(measurements, processes, url=url)
+
+    def validate_measurements(self, measurements, processes, url=None):
+        """Validates each unit process present in already parsed measurements,
+        in parallel and each in its own report section, then saves the report
+        as a PDF
+
+        Args:
+            measurements: dictionary of parsed variables
 
-        if "ET" in processes:
-            result = self.validate_lfom(measurements)
+            processes: list of unit processes in the model
 
-        if "Floc" in processes:
-            result = self.validate_floc(measurements)
+            url: URL the measurements were parsed from. Defaults to None
 
-        if "Sed" in processes:
-            result = self.validate_sed(measurements)
+        Returns:
+            result: text which represents validation result (ValidationResult)
 
-        self.save_pdf()
+        Raises:
+            RuntimeError: if this Validator has already saved its report
+        """
+        self._check_unused()
+        with self.timings.profiled():
+            return self._validate_measurements(measurements, processes, url)
+
+    def _check_unused(self):
+        # a Validator has one report, which is closed once it is saved
+        if self.report_writer.closed:
+            raise RuntimeError(
+                "This Validator's report has been saved, create a new "
+                "Validator for each validation"
+            )
+
+    def _validate_section(self, title, validate, measurements, section, reuse):
+        with self.timings.span("validate." + title):
+            return validate(measurements, section, reuse)
+
+    def _validate_measurements(self, measurements, processes, url):
+        selected = [
+            (process, title, getattr(self, method))
+            for process, title, method in UNIT_PROCESSES
+            if process in processes
+        ]
+        sections = [ReportSection(title) for _, title, _ in selected]
+        reuse = None
+        if self.revalidation is not None and url is not None:
+            with self.timings.span("revalidation.diff"):
+                reuse = self.revalidation.reusable(url, measurements)
+        # unit processes with missing measurements are reported before any
+        # checks run, and aren't validated
+        args = []
+        for (process, title, validate), section in zip(selected, sections):
+            if not _report_missing(section, measurements, process):
+                args.append((title, validate, measurements, section, reuse))
+
+        # cProfile only sees the thread it runs in
+        if len(args) > 1 and not self.timings.profiling:
+            # each unit process writes to its own section, so they can run
+            # at the same time
+            with ThreadPoolExecutor(max_workers=len(args)) as executor:
+                futures = [
+                    executor.submit(self._validate_section, *arg) for arg in args
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for arg in args:
+                self._validate_section(*arg)
+        results = [section.get_result() for section in sections]
+
+        for section in sections:
+            self.report_writer.add_section(section)
+        if reuse is not None:
+            self.revalidation.put(url, measurements, sections)
+        if selected:
+            result = combine_results(results)
+        else:
+            result = "Invalid: No Unit Process Selected by Onshape Documenter"
+        self.report_writer.set_result(result)
+
+        with self.timings.span("report"):
+            pdf = self.save_pdf()
+
+        return ValidationResult(
+            result,
+            url,
+            self.report_writer.report_name,
+            pdf,
+            self.timings if self.timings.enabled else None,
+        )
 
-        return result
+    def validate_many(self, urls, max_workers=8):
+        """Validates many Onshape models. Measurements are fetched and parsed
+        concurrently on a bounded thread pool, then each model is validated
+        with its own report.
 
-    def validate_lfom(self, measurements):
+        Args:
+            urls: URLs of Onshape models to validate (iterable of strings)
+
+            max_workers: maximum number of concurrent fetches. Default: 8
+
+        Returns:
+            results: validation result of each URL, in input order
+            (list of ValidationResult)
+        """
+        urls = list(urls)
+        validators = [
+            Validator(
+                report_suffix="_{}".format(i),
+                cache=self.cache,
+                lfom_rating_curve=self.lfom_rating_curve,
+                fetcher=self.fetcher,
+                report_dir=self.report_dir,
+                pdf_pipeline=self.pdf_pipeline,
+                timings=self.timings.copy(),
+                revalidation=self.revalidation,
+                pdf=self.pdf,
+                sensitivity=self.sensitivity,
+            )
+            for i in range(len(urls))
+        ]
+        results = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetches = [
+                executor.submit(validator.fetch, url)
+                for validator, url in zip(validators, urls)
+            ]
+            for url, validator, fetch in zip(urls, validators, fetches):
+                try:
+                    measurements, processes = fetch.result()
+                except Exception as e:
+                    validator.report_writer.set_result("Error: {}".format(e))
+                    pdf = validator.save_pdf()
+                    results.append(
+                        ValidationResult(
+                            validator.report_writer.get_result(),
+                            url,
+                            validator.report_writer.report_name,
+                            pdf,
+                            validator.timings if validator.timings.enabled else None,
+                        )
+                    )
+                    continue
+                results.append(
+                    validator.validate_measurements(measurements, processes, url=url)
+                )
+
+        return results
+
+    def validate_lfom(self, measurements, report_writer=None, reuse=None):
         """Validates the LFOM model at the given URL is correct
 
         Args:
             measurements: dictionary of parsed variables
 
+            report_writer: ReportSection to record validation results in.
+                Defaults to None which uses the report of this Validator
+
+            reuse: dictionary of the CheckRecords of an earlier validation by
+                the name of each check which doesn't need to run again.
+                Defaults to None which runs every check
+
         Returns:
             result: text which represents validation result (string)
         """
-        try:
-            # Onshape predicates can't handle flow and temp units
-            q = measurements["Flow"] / u.s
-            d_orifices = measurements["D.LfomOrifices"]
-            n_orifices = measurements["N.LfomOrifices"]
-            h_orifices = measurements["H.LfomOrifices"]
-            # Due to some odd behavior of Pint lists, we need to do this conversion
-            h_orifices = [
-                measure.to_base_units().magnitude for measure in h_orifices
-            ] * u.m
-
-            # Acceptable tolerance
-            tol = 0.05
-            # TODO: make ReportWriter and measurments attributes of validation
-            # orchestrator instead of passing them between functions
-            check_flow_lfom_vert(
-                d_orifices, h_orifices, n_orifices, tol, q, self.report_writer
-            )
-        except Exception as e:
-            self.report_writer.set_result("Error: {}".format(e))
-
-        return self.report_writer.get_result()
+        checks = PROCESS_CHECKS["ET"]
+        if not self.lfom_rating_curve:
+            checks = [check for check in checks if check != "check_lfom_rating_curve"]
+        return self._run_checks(
+            "lfom", "ET", checks, measurements, report_writer, reuse
+        )
 
-    def validate_floc(self, measurements):
+    def validate_floc(self, measurements, report_writer=None, reuse=None):
         """Validates the flocculator model at the given URL is correct
 
         Args:
             measurements: dictionary of parsed variables
 
+            report_writer: ReportSection to record validation results in.
+                Defaults to None which uses the report of this Validator
+
+            reuse: dictionary of the CheckRecords of an earlier validation by
+                the name of each check which doesn't need to run again.
+                Defaults to None which runs every check
+
         Returns:
             result: text which represents validation result (string)
         """
-        try:
-            # Onshape predicates can't handle flow and temp units
-            q = measurements["Flow"] / u.s
-            temp = measurements["TempCelsius"] * u.degC
-            channel_n = measurements["N.FlocChannels"]
-            baffle_n_per_chan = measurements["N.FlocChannelBaffles"]
-            baffle_s = measurements["S.FlocBaffle"]
-            channel_w = measurements["W.FlocChannel"]
-            channel_l = measurements["L.FlocChannel"]
-            channel_h = measurements["H.FlocChannel"]
-            design_water_height = channel_h - measurements["FB"]
-
-            # estimate head loss with minor loss equation and coefficient for baffles
-            spaces_n = (baffle_n_per_chan + 1) * channel_n
-            k_minor = Flocculator().BAFFLE_K * spaces_n
-            vel = q / (baffle_s * channel_w)
-            hl = pc.headloss_minor_channel(vel, k_minor)
-
-            check_G_theta(
-                q,
-                channel_l,
-                design_water_height,
-                channel_n,
-                channel_w,
-                hl,
-                temp,
-                self.report_writer,
-            )
-            check_baffle_spacing(channel_l, baffle_s, self.report_writer)
-        except Exception as e:
-            self.report_writer.set_result("Error: {}".format(e))
-
-        return self.report_writer.get_result()
+        return self._run_checks(
+            "floc", "Floc", PROCESS_CHECKS["Floc"], measurements, report_writer, reuse
+        )
 
-    def validate_sed(self, measurements):
+    def validate_sed(self, measurements, report_writer=None, reuse=None):
         """Validates the sedimentor model at the given URL is correct
 
         Args:
             measurements: dictionary of parsed variables
 
+            report_writer: ReportSection to record validation results in.
+                Defaults to None which uses the report of this Validator
+
+            reuse: dictionary of the CheckRecords of an earlier validation by
+                the name of each check which doesn't need to run again.
+                Defaults to None which runs every check
+
         Returns:
             result: text which represents validation result (string)
         """
+        return self._run_checks(
+            "sed", "Sed", PROCESS_CHECKS["Sed"], measurements, report_writer, reuse
+        )
+
+    def _run_checks(self, name, process, checks, measurements, report_writer, reuse):
+        # evaluates checks on CHECK_GRAPH and writes their records in order
+        if report_writer is None:
+            report_writer = self.report_writer
+        if _report_missing(report_writer, measurements, process):
+            return report_writer.get_result()
         try:
-            # Onshape predicates can't handle flow, velocity, and temp units
-            q = measurements["Flow"] / u.s
-            vel_up = measurements["V.SedUp"] / u.s
-            vel_capture = measurements["V.SedC"] / u.s
-            temp = measurements["TempCelsius"] * u.degC
-
-            # TODO: Create these new variables with Documenter feature
-            # Only nominal diameter is included in design specs.
-            diam_inlet_manifold = measurements["ID.SedManifold"]
-            # Diffuser head loss was also not included in design specs
-            max_hl_diffuser = measurements["HL.Diffuser"]
-
-            pi_flow_mainfold = measurements["Pi.QLaunderOrifices"]
-            w_tank = measurements["W.Sed"]
-            l_tank = measurements["L.Sed"]
-            n_plate = measurements["N.SedPlates"]
-            l_plate = measurements["L.SedPlate"]
-            w_plate = measurements["W.SedPlate"]
-            plate_thickness = measurements["T.SedPlate"]
-            angle_plate = measurements["AN.SedPlate"]
-            space_plate = measurements["S.SedPlate"]
-            w_diffuser = measurements["W.SedDiffuserInner"]
-            hl_outlet_manifold = measurements["HL.SedLaunderBod"]
-            diam_orifice = measurements["D.SedLaunderOrifice"]
-            n_orifices = measurements["N.SedLaunderOrifices"]
-
-            vel_diffuser = check_diffuser(
-                w_tank, w_diffuser, vel_up, max_hl_diffuser, temp, self.report_writer
-            )
-            check_inlet_manifold(
-                diam_inlet_manifold,
-                pi_flow_mainfold,
-                vel_diffuser,
-                q,
-                self.report_writer,
-            )
-            check_plate_settlers(
-                vel_capture,
-                n_plate,
-                l_plate,
-                w_plate,
-                space_plate,
-                angle_plate,
-                plate_thickness,
-                q,
-                self.report_writer,
-            )
-            check_sed_tank(l_tank, w_tank, vel_up, q, self.report_writer)
-            check_outlet_manifold(
-                n_orifices, diam_orifice, hl_outlet_manifold, q, self.report_writer
-            )
+            with self.timings.span(name + ".convert"):
+                # measurements are converted to SI magnitudes once, here
+                units = {}
+                m = to_si_measurements(
+                    measurements, PROCESS_MEASUREMENTS[process], units
+                )
+
+            evaluation = Evaluation(CHECK_GRAPH, m, timings=self.timings, units=units)
+            for check in checks:
+                if _reuse(report_writer, reuse, check):
+                    continue
+                section = evaluation.get(check)
+                report_writer.records.extend(section.records)
+                if section.get_result() != "Valid":
+                    report_writer.set_result(section.get_result())
+
+            if self.sensitivity:
+                # imported here since monte_carlo imports this module
+                from aide_validation.sensitivity import si_sensitivities
+
+                with self.timings.span(name + ".sensitivity"):
+                    sensitivities = si_sensitivities(m, process)
+                report_writer.sensitivities.update(
+                    (check, sensitivities[check])
+                    for check in checks
+                    if check in sensitivities
+                )
         except Exception as e:
-            self.report_writer.set_result("Error: {}".format(e))
+            report_writer.set_result("Error: {}".format(e))
 
-        return self.report_writer.get_result()
+        return report_writer.get_result()
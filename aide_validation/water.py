@@ -0,0 +1,108 @@
+"""Properties of water at the design temperature.
+Created on October 18, 2026
+
+density_water and viscosity_kinematic_water take temperatures in K, like the
+kernels. A single temperature is computed with the same formulas as
+aguaclara.core.physchem and remembered, since a plant is validated at the
+same few temperatures over and over. Arrays of temperatures, as in sweeps
+and Monte Carlo runs, are linearly interpolated in tables precomputed every
+TABLE_STEP from TABLE_TEMP_MIN to TABLE_TEMP_MAX. Within the tables the
+interpolated density differs from aguaclara's by less than DENSITY_ERROR
+and the kinematic viscosity by less than VISCOSITY_ERROR, relative to the
+exact value. Temperatures outside the tables use the formulas.
+"""
+
+import functools
+import numpy as np
+
+# range and spacing of the tables (K), from freezing to boiling
+TABLE_TEMP_MIN = 273.15
+TABLE_TEMP_MAX = 373.15
+TABLE_STEP = 0.05
+# largest relative error of the interpolated properties within the tables.
+# Linear interpolation is off by at most TABLE_STEP^2 / 8 times the second
+# derivative, which is largest for viscosity near freezing.
+DENSITY_ERROR = 1e-8
+VISCOSITY_ERROR = 5e-7
+
+
+@functools.lru_cache(maxsize=None)
+def _density_water_spline():
+    # same spline aguaclara uses for the density of water, temperatures in K
+    from scipy import interpolate
+    import aguaclara.core.physchem as pc
+
+    return interpolate.CubicSpline(pc.WATER_DENSITY_TABLE[0], pc.WATER_DENSITY_TABLE[1])
+
+
+def density_water_exact(temp):
+    """Returns the density of water (kg / m^3) at temperature temp (K), from
+    the same spline as aguaclara"""
+    return _density_water_spline()(temp)[()]
+
+
+def viscosity_kinematic_water_exact(temp):
+    """Returns the kinematic viscosity of water (m^2 / s) at temperature temp
+    (K), from the same formula as aguaclara"""
+    viscosity_dynamic = 2.414 * (10**-5) * 10 ** (247.8 / (temp - 140))
+    return viscosity_dynamic / density_water_exact(temp)
+
+
+@functools.lru_cache(maxsize=None)
+def _tables():
+    # value and slope of each property at every table temperature
+    n = int(round((TABLE_TEMP_MAX - TABLE_TEMP_MIN) / TABLE_STEP)) + 1
+    temps = TABLE_TEMP_MIN + TABLE_STEP * np.arange(n)
+    tables = []
+    for exact in (density_water_exact, viscosity_kinematic_water_exact):
+        values = exact(temps)
+        tables.append((values, np.diff(values)))
+    return tables
+
+
+def _interpolate(table, exact, temp):
+    values, slopes = _tables()[table]
+    temp = np.asarray(temp, dtype=float)
+    position = (temp - TABLE_TEMP_MIN) / TABLE_STEP
+    # the table index of each temperature, found without a search since the
+    # temperatures are evenly spaced. fmax and fmin also send nan to 0.
+    i = np.fmin(np.fmax(position, 0), len(slopes) - 1).astype(np.intp)
+    result = values[i] + slopes[i] * (position - i)
+    inside = (position >= 0) & (position <= len(slopes))
+    if not inside.all():
+        result[~inside] = exact(temp[~inside])
+    return result
+
+
+@functools.lru_cache(maxsize=1024)
+def _properties(temp):
+    return density_water_exact(temp), viscosity_kinematic_water_exact(temp)
+
+
+def density_water(temp):
+    """Returns the density of water (kg / m^3) at temperature temp (K)
+
+    Args:
+        temp: temperature (K), a number or array
+
+    Returns:
+        density: float, or array interpolated within DENSITY_ERROR
+    """
+    if np.ndim(temp) == 0:
+        return _properties(float(temp))[0]
+    return _interpolate(0, density_water_exact, temp)
+
+
+def viscosity_kinematic_water(temp):
+    """Returns the kinematic viscosity of water (m^2 / s) at temperature
+    temp (K)
+
+    Args:
+        temp: temperature (K), a number or array
+
+    Returns:
+        viscosity: float, or array interpolated within VISCOSITY_ERROR
+    """
+    if np.ndim(temp) == 0:
+        return _properties(float(temp))[1]
+    return _interpolate(1, viscosity_kinematic_water_exact, temp)
@@ -65,7 +65,12 @@ setup(
         "Programming Language :: Python :: 3.9",
     ],
     description="Validation tool for AIDE (AguaClara Infrastructure Design Engine).",
-    entry_points={},
+    entry_points={
+        "console_scripts": [
+            "aide-validate=aide_validation.cli:main",
+            "aide-validate-server=aide_validation.server:main",
+        ]
+    },
     install_requires=requirements,
     license="MIT License",
     long_description=readme,
@@ -0,0 +1,41 @@
+import functools
+import socket
+import pytest
+import aide_validation.benchmark as benchmark
+
+ONSHAPE_HOST = "cad.onshape.com"
+
+
+@functools.lru_cache(maxsize=None)
+def onshape_reachable():
+    # tests marked network call the Onshape API
+    try:
+        socket.create_connection((ONSHAPE_HOST, 443), timeout=5).close()
+    except OSError:
+        return False
+    return True
+
+
+def pytest_runtest_setup(item):
+    if item.get_closest_marker("network") and not onshape_reachable():
+        pytest.skip("{} can't be reached".format(ONSHAPE_HOST))
+
+
+# the measurements the benchmarks run on, so that tests and benchmarks share
+# one copy
+@pytest.fixture
+def lfom_measurements():
+    # parsed measurements of a valid LFOM
+    return benchmark.lfom_measurements()
+
+
+@pytest.fixture
+def floc_measurements():
+    # parsed measurements of a valid flocculator
+    return benchmark.floc_measurements()
+
+
+@pytest.fixture
+def sed_measurements():
+    # parsed measurements of a valid sedimentation tank
+    return benchmark.sed_measurements()
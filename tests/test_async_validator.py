@@ -0,0 +1,92 @@
+import asyncio
+import os
+import threading
+import time
+import pytest
+from aide_validation.async_validator import AsyncValidator
+from aide_validation.validator import Validator
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+
+class SlowFetch(object):
+    """Stands in for Validator.fetch, recording how many fetches overlap"""
+
+    def __init__(self, measurements, delay):
+        self.measurements = measurements
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def fetch(self, url):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if url == "missing":
+            raise KeyError(url)
+        return dict(self.measurements), ["ET"]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validate_many(tmp_path, monkeypatch, lfom_measurements):
+    fetch = SlowFetch(lfom_measurements, 0.05)
+    monkeypatch.setattr(Validator, "fetch", fetch.fetch)
+    validator = AsyncValidator(max_fetches=3, report_dir=str(tmp_path))
+
+    urls = ["a", "missing", "b", "c", "d", "e", "f"]
+    results = asyncio.run(validator.validate_many(urls))
+    validator.close()
+
+    assert results == ["Valid", "Error: 'missing'"] + ["Valid"] * 5
+    assert [result.url for result in results] == urls
+    assert fetch.max_active == 3
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_reuse_across_event_loops(tmp_path, monkeypatch, lfom_measurements):
+    fetch = SlowFetch(lfom_measurements, 0.01)
+    monkeypatch.setattr(Validator, "fetch", fetch.fetch)
+    # Validator options are passed through
+    validator = AsyncValidator(max_fetches=2, report_dir=str(tmp_path), pdf=False)
+
+    for _ in range(2):
+        results = asyncio.run(validator.validate_many(["a", "b", "c"]))
+        assert results == ["Valid"] * 3
+        assert all(result.pdf.result() is None for result in results)
+    validator.close()
+
+    assert fetch.max_active <= 2
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_timeout(tmp_path, monkeypatch, lfom_measurements):
+    monkeypatch.setattr(Validator, "fetch", SlowFetch(lfom_measurements, 0.5).fetch)
+    validator = AsyncValidator(timeout=0.05, report_dir=str(tmp_path))
+
+    result = asyncio.run(validator.validate("a"))
+    validator.close()
+
+    assert result == "Error: Validation timed out after 0.05 seconds"
+    assert os.path.exists(result.report_name)
+    assert os.path.exists(result.pdf.result())
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_cancel(tmp_path, monkeypatch, lfom_measurements):
+    monkeypatch.setattr(Validator, "fetch", SlowFetch(lfom_measurements, 0.5).fetch)
+    validator = AsyncValidator(report_dir=str(tmp_path))
+
+    async def cancel():
+        task = asyncio.ensure_future(validator.validate("a"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel())
+    validator.close()
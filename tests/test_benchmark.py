@@ -0,0 +1,62 @@
+import pytest
+from aide_validation.benchmark import (
+    BenchmarkResult,
+    compare,
+    load_baseline,
+    main,
+    run_benchmark,
+    run_benchmarks,
+    save_baseline,
+)
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+
+def result(name, ops_per_sec):
+    return BenchmarkResult(name, 10, ops_per_sec, 0.1, 0.1, 0.1, 0.1, 1024)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_run_benchmark():
+    calls = []
+    benchmark = run_benchmark("append", lambda: calls.append(1), max_iterations=50)
+
+    assert benchmark.iterations == 50
+    # one warm up call and one call measuring memory
+    assert len(calls) == 52
+    assert benchmark.ops_per_sec > 0
+    assert benchmark.p50 <= benchmark.p90 <= benchmark.p99
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_run_benchmarks(tmp_path):
+    results = run_benchmarks("floc.*", min_time=0.01, output_dir=str(tmp_path))
+
+    assert [benchmark.name for benchmark in results] == [
+        "floc.check_baffle_spacing",
+        "floc.check_G_theta",
+    ]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_baseline(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    save_baseline([result("a", 100), result("b", 100)], path)
+    baseline = load_baseline(path)
+
+    assert baseline["a"] == result("a", 100)
+    assert compare([result("a", 95), result("b", 50), result("c", 1)], baseline) == [
+        ("a", -0.05, False),
+        ("b", -0.5, True),
+    ]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_main(tmp_path, capsys):
+    path = str(tmp_path / "baseline.json")
+    args = ["-k", "sed.check_sed_tank", "--min-time", "0.01"]
+
+    assert main(args + ["--save", path]) == 0
+    assert main(args + ["--compare", path, "--tolerance", "10"]) == 0
+    assert "sed.check_sed_tank" in capsys.readouterr().out
@@ -0,0 +1,95 @@
+import io
+import json
+import os
+import pytest
+from aide_validation import cli
+from aide_validation.validator import Validator
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+
+@pytest.fixture
+def models(floc_measurements, sed_measurements):
+    return {
+        "https://example.com/floc": (floc_measurements, ["Floc"]),
+        "https://example.com/sed": (sed_measurements, ["Sed"]),
+    }
+
+
+@pytest.fixture
+def fetch(monkeypatch, models):
+    # serve the test models instead of fetching from Onshape
+    def fetch(self, url):
+        if url not in models:
+            raise ValueError("Unknown model")
+        measurements, processes = models[url]
+        return dict(measurements), processes
+
+    monkeypatch.setattr(Validator, "fetch", fetch)
+
+
+def run(args, stdin=""):
+    stdout = io.StringIO()
+    status = cli.main(args, stdin=io.StringIO(stdin), stdout=stdout)
+    return status, [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_stream_from_stdin(fetch, models, tmp_path):
+    urls = "# models\nhttps://example.com/floc\n\nhttps://example.com/sed\n"
+    status, lines = run(
+        ["--report-dir", str(tmp_path), "--no-pdf", "--format", "json", "-j", "2"],
+        urls,
+    )
+
+    assert status == 0
+    lines.sort(key=lambda line: line["index"])
+    assert [line["url"] for line in lines] == list(models)
+    for line in lines:
+        assert line["result"] == "Valid"
+        assert line["pdf"] is None
+        assert os.path.exists(line["report"])
+        with open(line["json"]) as json_file:
+            assert json.load(json_file)["result"] == "Valid"
+    assert not list(tmp_path.glob("*.pdf"))
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_errors_and_pdfs(fetch, tmp_path):
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text("https://example.com/unknown\n")
+    status, lines = run(
+        ["https://example.com/floc", "--file", str(url_file)]
+        + ["--report-dir", str(tmp_path)]
+    )
+
+    assert status == 1
+    results = {line["url"]: line for line in lines}
+    assert results["https://example.com/floc"]["result"] == "Valid"
+    assert results["https://example.com/unknown"]["result"] == "Error: Unknown model"
+    for line in lines:
+        assert os.path.exists(line["pdf"])
+        assert line["json"] is None
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validate_stream_is_bounded(monkeypatch):
+    taken = []
+
+    def urls():
+        for i in range(20):
+            taken.append(i)
+            yield "https://example.com/{}".format(i)
+
+    def validate_url(url, **kwargs):
+        return {"url": url, "result": "Valid"}
+
+    monkeypatch.setattr(cli, "validate_url", validate_url)
+    stream = cli.validate_stream(urls(), concurrency=2)
+
+    first = next(stream)
+    # the rest of the URLs haven't been read yet
+    assert len(taken) == 2 * cli.PENDING_PER_WORKER
+    lines = [first] + list(stream)
+    assert sorted(line["index"] for line in lines) == list(range(20))
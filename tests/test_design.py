@@ -0,0 +1,76 @@
+import math
+import numpy as np
+import pytest
+from aide_validation.design import Interval, bracket, solve_floc
+from aide_validation.units import u
+from aide_validation.validator import Validator
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+
+def floc_result(tmp_path, measurements, **changes):
+    measurements = dict(measurements, **changes)
+    validator = Validator(report_dir=tmp_path)
+    return validator.validate_floc(measurements)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_bracket():
+    low, high = bracket(lambda x: x < np.pi, 1.0, 1e6)
+
+    assert low < np.pi <= high
+    assert high / low - 1 <= 1e-9
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_solve_floc_bounds_pass(tmp_path, floc_measurements):
+    intervals = solve_floc(floc_measurements)
+
+    spacing = intervals["S.FlocBaffle"]
+    assert spacing.low == pytest.approx(1.851 / 6)
+    assert (
+        floc_result(tmp_path, floc_measurements, **{"S.FlocBaffle": spacing.high * u.m})
+        == "Valid"
+    )
+    assert floc_result(
+        tmp_path, floc_measurements, **{"S.FlocBaffle": spacing.high * 1.001 * u.m}
+    ).startswith("Invalid")
+
+    width = intervals["W.FlocChannel"]
+    assert width.low == 0
+    assert (
+        floc_result(tmp_path, floc_measurements, **{"W.FlocChannel": width.high * u.m})
+        == "Valid"
+    )
+    assert floc_result(
+        tmp_path, floc_measurements, **{"W.FlocChannel": width.high * 1.001 * u.m}
+    ).startswith("Invalid")
+
+    baffles = intervals["N.FlocChannelBaffles"]
+    assert baffles == Interval(2, math.inf)
+    assert (
+        floc_result(tmp_path, floc_measurements, **{"N.FlocChannelBaffles": 2})
+        == "Valid"
+    )
+    assert floc_result(
+        tmp_path, floc_measurements, **{"N.FlocChannelBaffles": 1}
+    ).startswith("Invalid")
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_solve_floc_infeasible(floc_measurements):
+    # the baffle spacing is too small for the channel length, so only the
+    # baffle spacing can be changed to pass
+    measurements = dict(floc_measurements)
+    measurements["L.FlocChannel"] = 0.3 * u.m
+    intervals = solve_floc(measurements)
+
+    assert intervals["S.FlocBaffle"] == pytest.approx(Interval(0.05, 0.1))
+    assert intervals["W.FlocChannel"] is None
+    assert intervals["N.FlocChannelBaffles"] is None
+
+    # no spacing allowed by the channel length gives enough G theta
+    measurements = dict(floc_measurements)
+    measurements["N.FlocChannelBaffles"] = 0
+    assert solve_floc(measurements)["S.FlocBaffle"] is None
@@ -0,0 +1,163 @@
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+import aide_validation.fetch as fetch
+from aide_validation.fetch import (
+    OnshapeFetcher,
+    RateLimiter,
+    has_api_keys,
+    request_key,
+)
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+version_url = "https://cad.onshape.com/documents/c3a8ce032e33ebe875b9aab4/v/4c90f8401c6635b9b12d0d87/e/e09d11406e7a9143537efe3a"  # noqa
+workspace_url = "https://cad.onshape.com/documents/c3a8ce032e33ebe875b9aab4/w/4c90f8401c6635b9b12d0d87/e/e09d11406e7a9143537efe3a"  # noqa
+
+
+class StatusError(Exception):
+    # stands in for onshape_client's ApiException
+    def __init__(self, status, headers=None):
+        super().__init__(status)
+        self.status = status
+        self.headers = headers
+
+
+def unlimited():
+    return RateLimiter(rate=1e9, burst=1e9)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_request_key():
+    assert request_key(version_url + "?configuration=default") == request_key(
+        version_url
+    )
+    assert request_key(version_url) != request_key(workspace_url)
+    assert request_key("https://example.com") == "https://example.com"
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_coalesce_identical_requests():
+    calls = []
+    release = threading.Event()
+
+    def request(client, url):
+        calls.append(url)
+        release.wait(5)
+        return url.encode()
+
+    fetcher = OnshapeFetcher(client=object(), rate_limiter=unlimited(), request=request)
+    urls = [version_url] * 4 + [workspace_url]
+    started = threading.Semaphore(0)
+
+    def fetch(url):
+        started.release()
+        return fetcher(url)
+
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        futures = [executor.submit(fetch, url) for url in urls]
+        for _ in urls:
+            started.acquire()
+        # give every caller time to join the request in flight
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert sorted(calls) == sorted([version_url, workspace_url])
+    assert results == [url.encode() for url in urls]
+    assert fetcher.in_flight == {}
+
+    # finished requests aren't cached
+    fetcher(version_url)
+    assert len(calls) == 3
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_retry_with_backoff():
+    errors = [StatusError(503), StatusError(429, {"Retry-After": "7"})]
+    sleeps = []
+
+    def request(client, url):
+        if errors:
+            raise errors.pop(0)
+        return b"data"
+
+    fetcher = OnshapeFetcher(
+        client=object(),
+        rate_limiter=unlimited(),
+        backoff=0.5,
+        request=request,
+        sleep=sleeps.append,
+    )
+
+    assert fetcher(version_url) == b"data"
+    assert sleeps == [0.5, 7.0]
+
+    errors = [StatusError(500)] * 3
+    fetcher.max_retries = 2
+    with pytest.raises(StatusError):
+        fetcher(version_url)
+    assert sleeps[2:] == [0.5, 1.0]
+
+    # other errors aren't retried
+    errors = [StatusError(404)]
+    with pytest.raises(StatusError):
+        fetcher(version_url)
+    assert len(sleeps) == 4
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_rate_limiter():
+    sleeps = []
+    limiter = RateLimiter(rate=10, burst=2, sleep=sleeps.append)
+
+    waits = [limiter.acquire() for _ in range(4)]
+
+    assert waits[:2] == [0, 0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+    assert sleeps == waits[2:]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_has_api_keys(tmp_path, monkeypatch):
+    from onshape_client import Client
+
+    for name in ["ONSHAPE_API_ACCESS_KEY", "ONSHAPE_API_SECRET_KEY"]:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(Client, "singleton_instance", None)
+    keys_file = tmp_path / "keys.yaml"
+
+    assert not has_api_keys(str(keys_file))
+    monkeypatch.setenv("ONSHAPE_API_ACCESS_KEY", "access")
+    assert not has_api_keys(str(keys_file))
+    keys_file.write_text(
+        "default_stack: prod\nprod:\n  access_key: a\n  secret_key: b\n"
+    )
+    assert has_api_keys(str(keys_file))
+    # no client is created to find out
+    assert Client.singleton_instance is None
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_default_fetcher_without_keys(monkeypatch):
+    from onshape_client import Client
+
+    monkeypatch.setattr(fetch, "has_api_keys", lambda: False)
+    monkeypatch.setattr(Client, "singleton_instance", None)
+    fetch.default_fetcher.cache_clear()
+    try:
+        fetcher = fetch.default_fetcher()
+        client = fetch.default_client()
+
+        # one client with the parser's keys is shared by every fetch
+        assert fetch.default_fetcher() is fetcher
+        assert fetcher.get_client() is client
+        assert client.get_authentication_method() == "api_keys"
+        assert client.configuration.api_key["ACCESS_KEY"] == (
+            fetch.parser_configuration()["access_key"]
+        )
+    finally:
+        fetch.default_fetcher.cache_clear()
@@ -0,0 +1,58 @@
+import json
+import subprocess
+import sys
+import pytest
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+# seconds allowed for a fresh interpreter to import the validator. Importing
+# aguaclara alone takes several seconds, so this fails if it is imported eagerly
+IMPORT_TIME_BUDGET = 1.0
+
+# modules which should only be imported when they're first needed
+DEFERRED_MODULES = [
+    "aguaclara",
+    "pint",
+    "fpdf",
+    "onshape_client",
+    "scipy",
+    "tkinter",
+]
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def import_in_subprocess(module):
+    output = subprocess.check_output(
+        [sys.executable, "-c", SCRIPT.format(module=module)]
+    )
+    return json.loads(output)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "module",
+    ["aide_validation.validator", "aide_validation.link_input"],
+)
+def test_deferred_imports(module):
+    imported = import_in_subprocess(module)["modules"]
+
+    for deferred in DEFERRED_MODULES:
+        assert deferred not in imported
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_import_time_budget():
+    # take the best of a few runs so a busy machine doesn't fail the test
+    elapsed = min(
+        import_in_subprocess("aide_validation.validator")["elapsed"] for _ in range(3)
+    )
+
+    assert elapsed < IMPORT_TIME_BUDGET
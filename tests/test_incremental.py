@@ -0,0 +1,102 @@
+import pytest
+from aguaclara.core.units import u
+from aide_validation.graph import CHECK_GRAPH
+from aide_validation.incremental import (
+    RevalidationCache,
+    changed_measurements,
+    element_key,
+)
+from aide_validation.validator import Validator
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+WORKSPACE = "https://cad.onshape.com/documents/c3a8ce032e33ebe875b9aab4/w/2990aab7c08553622d0c1402/e/e09d11406e7a9143537efe3a"  # noqa
+VERSION = "https://cad.onshape.com/documents/c3a8ce032e33ebe875b9aab4/v/4c90f8401c6635b9b12d0d87/e/e09d11406e7a9143537efe3a"  # noqa
+CHECKS = [
+    "check_G_theta",
+    "check_baffle_spacing",
+    "check_diffuser",
+    "check_inlet_manifold",
+    "check_plate_settlers",
+    "check_sed_tank",
+    "check_outlet_manifold",
+]
+
+
+@pytest.fixture
+def plant(floc_measurements, sed_measurements):
+    return {**sed_measurements, **floc_measurements}
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    # record every check the Validator runs
+    calls = []
+    for name in CHECKS:
+        node = CHECK_GRAPH.nodes[name]
+
+        def counted(*args, name=name, check=node.func):
+            calls.append(name)
+            return check(*args)
+
+        monkeypatch.setitem(CHECK_GRAPH.nodes, name, node._replace(func=counted))
+    return calls
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_element_key():
+    assert element_key(WORKSPACE) == element_key(VERSION)
+    assert element_key("plant.json") == "plant.json"
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_changed_measurements():
+    old = {"Flow": 30 * u.L, "FB": 10 * u.cm, "N.LfomOrifices": [17, 4]}
+    new = {"Flow": 30 * u.L, "FB": 0.1 * u.m, "N.LfomOrifices": [17, 5], "L": 1}
+
+    assert changed_measurements(old, new) == {"N.LfomOrifices", "L"}
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_revalidate_changed_baffle(tmp_path, calls, plant):
+    revalidation = RevalidationCache()
+    validator = Validator(report_dir=tmp_path, revalidation=revalidation)
+    validator.validate_measurements(plant, ["Floc", "Sed"], url=WORKSPACE)
+    assert sorted(calls) == sorted(CHECKS)
+
+    del calls[:]
+    measurements = dict(plant)
+    measurements["S.FlocBaffle"] = 0.25 * u.m
+    validator = Validator(report_dir=tmp_path, revalidation=revalidation)
+    result = validator.validate_measurements(measurements, ["Floc", "Sed"], url=VERSION)
+    assert sorted(calls) == ["check_G_theta", "check_baffle_spacing"]
+
+    # the reused results are the same as if every check ran again
+    full = Validator(report_dir=tmp_path)
+    assert result == full.validate_measurements(measurements, ["Floc", "Sed"])
+    assert result == "Invalid: Check Validation Report"
+    for reused, rerun in zip(
+        validator.report_writer.sections, full.report_writer.sections
+    ):
+        assert reused.result == rerun.result
+        assert reused.records == rerun.records
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_revalidate_unchanged(tmp_path, calls, plant, sed_measurements):
+    revalidation = RevalidationCache()
+    for _ in range(2):
+        validator = Validator(report_dir=tmp_path, revalidation=revalidation)
+        result = validator.validate_measurements(
+            sed_measurements, ["Sed"], url=WORKSPACE
+        )
+        assert result == "Valid"
+    assert calls == CHECKS[2:]
+
+    # a new unit process has no earlier results to reuse, and every sed check
+    # but the diffuser depends on the flow, which changed
+    validator = Validator(report_dir=tmp_path, revalidation=revalidation)
+    validator.validate_measurements(plant, ["Floc", "Sed"], url=WORKSPACE)
+    assert "check_diffuser" not in calls[5:]
+    assert sorted(calls[5:]) == sorted(CHECKS[:2] + CHECKS[3:])
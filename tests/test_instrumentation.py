@@ -0,0 +1,94 @@
+import json
+import pytest
+from aguaclara.core.units import u
+from aide_validation.instrumentation import NULL_TIMINGS, Timings
+from aide_validation.validator import Validator
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+floc = {
+    "Flow": 30 * u.L,
+    "TempCelsius": 20,
+    "N.FlocChannels": 8,
+    "N.FlocChannelBaffles": 5,
+    "S.FlocBaffle": 0.3085 * u.m,
+    "W.FlocChannel": 0.312 * u.m,
+    "L.FlocChannel": 1.851 * u.m,
+    "H.FlocChannel": 2.528 * u.m,
+    "FB": 0.1 * u.m,
+}
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_spans(tmp_path):
+    trace_path = str(tmp_path / "trace.jsonl")
+    timings = Timings(trace_path=trace_path)
+    for name in ["fetch", "parse", "fetch"]:
+        with timings.span(name):
+            pass
+
+    assert [span.name for span in timings.spans] == ["fetch", "parse", "fetch"]
+    assert list(timings.totals()) == ["fetch", "parse"]
+    assert timings.totals()["fetch"] == pytest.approx(
+        timings.spans[0].duration + timings.spans[2].duration
+    )
+    with open(trace_path) as trace:
+        lines = [json.loads(line) for line in trace]
+    assert lines == [span._asdict() for span in timings.spans]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_span_records_errors():
+    timings = Timings()
+    with pytest.raises(KeyError):
+        with timings.span("parse"):
+            raise KeyError("Flow")
+
+    assert [span.name for span in timings.spans] == ["parse"]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_null_timings():
+    assert NULL_TIMINGS.span("fetch") is NULL_TIMINGS.span("parse")
+    assert NULL_TIMINGS.copy() is NULL_TIMINGS
+    with NULL_TIMINGS.span("fetch"), NULL_TIMINGS.profiled():
+        pass
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validator_timings(tmp_path):
+    validator = Validator(report_dir=str(tmp_path), timings=Timings())
+    result = validator.validate_measurements(floc, ["Floc"])
+    totals = result.timings.totals()
+
+    assert result == "Valid"
+    for name in [
+        "floc.convert",
+        "floc.headloss",
+        "check_G_theta",
+        "check_baffle_spacing",
+        "validate.Flocculator",
+        "report",
+    ]:
+        assert name in totals
+    assert totals["validate.Flocculator"] >= totals["check_G_theta"]
+    assert json.dumps(result.timings.as_dict())
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validator_profile(tmp_path):
+    timings = Timings(profile=True, trace_memory=True)
+    validator = Validator(report_dir=str(tmp_path), timings=timings)
+    validator.validate_measurements(floc, ["Floc", "ET"])
+
+    assert "validate_floc" in timings.profile_report()
+    assert timings.memory_peak > 0
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validator_without_timings(tmp_path):
+    validator = Validator(report_dir=str(tmp_path))
+
+    assert validator.validate_measurements(floc, ["Floc"]).timings is None
+    assert Timings().profile_report() is None
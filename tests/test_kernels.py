@@ -0,0 +1,175 @@
+import math
+import pytest
+import numpy as np
+from aguaclara.core.units import u
+import aguaclara.core.physchem as pc
+import aguaclara.core.constants as con
+import aide_validation.kernels as k
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+# the kernels must reproduce the pint calculations they replaced
+rel = 1e-12
+
+h_ori = [
+    0.0079375,
+    0.02467613636363637,
+    0.04141477272727274,
+    0.0581534090909091,
+    0.07489204545454548,
+    0.09163068181818185,
+    0.1083693181818182,
+    0.1251079545454546,
+    0.14184659090909096,
+    0.15858522727272734,
+    0.1753238636363637,
+    0.19206250000000008,
+]
+n_ori = [17.0, 4.0, 6.0, 3.0, 4.0, 3.0, 3.0, 3.0, 3.0, 2.0, 3.0, 1.0]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_constants():
+    assert k.GRAVITY == con.GRAVITY.to(u.m / u.s**2).magnitude
+    assert k.VC_ORIFICE_RATIO == con.VC_ORIFICE_RATIO
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "value, unit, expected",
+    [
+        (30 * u.L / u.s, u.m**3 / u.s, 0.03),
+        (20 * u.degC, u.K, 293.15),
+        (60 * u.deg, u.rad, math.pi / 3),
+        ([1 * u.cm, 2 * u.mm], u.m, [0.01, 0.002]),
+        (8, u.dimensionless, 8),
+        ([17.0, 4.0], u.dimensionless, [17.0, 4.0]),
+    ],
+)
+def test_to_si(value, unit, expected):
+    assert np.allclose(k.to_si(value, unit), expected, rtol=rel)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize("temp", [0, 4.5, 20, 21, 35])
+def test_water_properties(temp):
+    temp_k = k.to_si(temp * u.degC, u.K)
+
+    assert k.density_water(temp_k) == pytest.approx(
+        pc.density_water(temp * u.degC).to(u.kg / u.m**3).magnitude, rel=rel
+    )
+    assert k.viscosity_kinematic_water(temp_k) == pytest.approx(
+        pc.viscosity_kinematic_water(temp * u.degC).to(u.m**2 / u.s).magnitude,
+        rel=rel,
+    )
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_headloss_floc_and_G_theta():
+    q = 30 * u.L / u.s
+    baffle_s = 0.3085 * u.m
+    channel_w = 0.312 * u.m
+    temp = 20 * u.degC
+    vel = q / (baffle_s * channel_w)
+    hl = pc.headloss_minor_channel(vel, 2.5 * (5 + 1) * 8)
+    theta = (1.851 * u.m * 2.428 * u.m * 8 * channel_w) / q
+    G_theta = math.sqrt(con.GRAVITY * hl * theta / pc.viscosity_kinematic_water(temp))
+
+    hl_si = k.headloss_floc(0.03, 0.3085, 0.312, 8, 5, 2.5)
+    assert hl_si == pytest.approx(hl.to(u.m).magnitude, rel=rel)
+    assert k.G_theta(0.03, 1.851, 2.428, 8, 0.312, hl_si, 293.15) == pytest.approx(
+        G_theta, rel=rel
+    )
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize("height", [0.005, 0.1, 0.2, 0.25])
+def test_flow_lfom_vert(height):
+    flow = pc.flow_orifice_vert(
+        0.0157875 * u.m, height * u.m - h_ori * u.m, con.VC_ORIFICE_RATIO
+    )
+    expected = sum(flow * n_ori).to(u.m**3 / u.s).magnitude
+
+    assert k.flow_lfom_vert(height, 0.0157875, np.array(h_ori), np.array(n_ori)) == (
+        expected
+    )
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_flow_lfom_vert_heights():
+    heights = np.array([0.05, 0.1, 0.2])
+    flow = k.flow_lfom_vert(heights, 0.0157875, np.array(h_ori), np.array(n_ori))
+
+    assert flow.shape == heights.shape
+    for height, flow_height in zip(heights, flow):
+        assert flow_height == k.flow_lfom_vert(
+            height, 0.0157875, np.array(h_ori), np.array(n_ori)
+        )
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_sed_kernels():
+    vel_up = 0.85 * u.mm / u.s
+    w_sed = 42 * u.inch
+    w_diffuser = 1 / 8 * u.inch
+    temp = 20 * u.degC
+    vel_diffuser = vel_up * w_sed / w_diffuser
+    rho = pc.density_water(temp)
+    nu = pc.viscosity_kinematic_water(temp)
+    vel_max_shear = (0.5 * u.Pa / rho) ** (1 / 2) * (
+        vel_up * w_sed / (nu * 0.0124)
+    ) ** (1 / 4)
+    head_loss = vel_diffuser**2 / (2 * u.g_0)
+    q_inlet = (
+        (np.pi * (vel_diffuser * np.sqrt(2 * (1 - 0.8**2) / (0.8**2 + 1))))
+        * (3 * u.inch) ** 2
+        / 4
+    )
+    q_plates = (0.12 * u.mm / u.s) * (
+        26
+        * (42 * u.inch)
+        * (60 * u.cm * np.cos(60 * u.deg) + (2.5 * u.cm / np.sin(60 * u.deg)))
+    )
+    q_outlet = pc.flow_orifice(0.015875 * u.m, 0.05 * u.m, con.VC_ORIFICE_RATIO) * 9
+
+    vel_up_si = k.to_si(vel_up, u.m / u.s)
+    w_sed_si = k.to_si(w_sed, u.m)
+    vel_diffuser_si = k.vel_diffuser(vel_up_si, w_sed_si, k.to_si(w_diffuser, u.m))
+    assert vel_diffuser_si == pytest.approx(
+        vel_diffuser.to(u.m / u.s).magnitude, rel=rel
+    )
+    assert k.vel_max_shear(vel_up_si, w_sed_si, 293.15, 0.5, 0.0124) == pytest.approx(
+        vel_max_shear.to(u.m / u.s).magnitude, rel=rel
+    )
+    assert k.headloss_diffuser(vel_diffuser_si) == pytest.approx(
+        head_loss.to(u.m).magnitude, rel=rel
+    )
+    assert k.flow_inlet_manifold(
+        k.to_si(3 * u.inch, u.m), 0.8, vel_diffuser_si
+    ) == pytest.approx(q_inlet.to(u.m**3 / u.s).magnitude, rel=rel)
+    assert k.flow_plate_settlers(
+        0.00012, 26, 0.6, k.to_si(42 * u.inch, u.m), 0.025, math.pi / 3
+    ) == pytest.approx(q_plates.to(u.m**3 / u.s).magnitude, rel=rel)
+    assert k.flow_sed_tank(1.1, w_sed_si, vel_up_si) == pytest.approx(
+        (1.1 * u.m * w_sed * vel_up).to(u.m**3 / u.s).magnitude, rel=rel
+    )
+    assert k.flow_outlet_manifold(9, 0.015875, 0.05) == pytest.approx(
+        q_outlet.to(u.m**3 / u.s).magnitude, rel=rel
+    )
+    assert k.flow_outlet_manifold(9, 0.015875, -0.05) == 0
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_flow_orifice_vert_array():
+    diam = 0.0157875
+    heights = np.linspace(-diam, 3 * diam, 401)
+    flow_submerged = k.flow_orifice_vert(diam, diam)
+
+    assert np.allclose(
+        k.flow_orifice_vert_array(diam, heights),
+        k.flow_orifice_vert(diam, heights),
+        rtol=0,
+        atol=1e-6 * flow_submerged,
+    )
+    assert np.all(k.flow_orifice_vert_array(diam, heights[heights <= -diam / 2]) == 0)
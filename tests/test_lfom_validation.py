@@ -1,21 +1,52 @@
 import pytest
-import time
+import numpy as np
 from aguaclara.core.units import u
 from aide_validation.report_writer import ReportWriter
-from aide_validation.lfom_validation import flow_lfom_vert, check_flow_lfom_vert
+from aide_validation.lfom_validation import (
+    flow_lfom_vert,
+    check_flow_lfom_vert,
+    lfom_rating_curve,
+    check_lfom_rating_curve,
+)
 
 # set skip_all_tests = True to focus on single test
 skip_all_tests = False
-# sleep one second so reports won't have the same name
-time.sleep(1)
-writer = ReportWriter()
+
+
+lfom_heights = [
+    0.0079375,
+    0.02467613636363637,
+    0.04141477272727274,
+    0.0581534090909091,
+    0.07489204545454548,
+    0.09163068181818185,
+    0.1083693181818182,
+    0.1251079545454546,
+    0.14184659090909096,
+    0.15858522727272734,
+    0.1753238636363637,
+    0.19206250000000008,
+] * u.m
+lfom_heights_short = [
+    0.00396875,
+    0.0125,
+    0.0207074,
+    0.02925,
+    0.0375,
+    0.045,
+    0.055,
+    0.0625,
+    0.072,
+    0.08,
+    0.087,
+    0.096,
+] * u.m
+lfom_numbers = [17.0, 4.0, 6.0, 3.0, 4.0, 3.0, 3.0, 3.0, 3.0, 2.0, 3.0, 1.0]
 
 
 @pytest.fixture
-def report_writer():
-    # reset result to its default between tests
-    writer.set_result("Valid")
-    return writer
+def report_writer(tmp_path):
+    return ReportWriter(output_dir=str(tmp_path))
 
 
 @pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
@@ -215,3 +246,38 @@ def test_check_flow_lfom_vert(
         diameter, ori_heights, ori_numbers, cutoff, q_input, report_writer
     )
     assert report_writer.get_result() == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "ori_heights, q_input, expected",
+    [
+        (lfom_heights, 10 * u.L / u.s, "Valid"),
+        (lfom_heights, 9.5 * u.L / u.s, "Invalid: Check Validation Report"),
+        (lfom_heights_short, 10 * u.L / u.s, "Invalid: Check Validation Report"),
+        (lfom_heights_short, 7.15 * u.L / u.s, "Valid"),
+    ],
+)
+def test_check_lfom_rating_curve(ori_heights, q_input, expected, report_writer):
+    check_lfom_rating_curve(
+        0.0157875 * u.m, ori_heights, lfom_numbers, 0.05, q_input, report_writer
+    )
+    assert report_writer.get_result() == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_lfom_rating_curve():
+    heights, flow_rows, deviation = lfom_rating_curve(
+        0.0157875 * u.m, lfom_heights, lfom_numbers, 10 * u.L / u.s, n_heights=50
+    )
+
+    assert heights.shape == deviation.shape == (50,)
+    assert flow_rows.shape == (50, len(lfom_numbers))
+    # rows above the water carry no flow
+    assert np.all(flow_rows[0, 1:] == 0)
+    assert flow_rows[-1].sum() == pytest.approx(
+        flow_lfom_vert(heights[-1] * u.m, 0.0157875 * u.m, lfom_heights, lfom_numbers)
+        .to(u.m**3 / u.s)
+        .magnitude,
+        rel=1e-6,
+    )
@@ -0,0 +1,154 @@
+import os
+import pytest
+from aguaclara.core.units import u
+import aide_validation.recorder as recorder
+from aide_validation.measurement_cache import (
+    MeasurementCache,
+    cache_key,
+    dumps_measurements,
+    loads_measurements,
+)
+from aide_validation.validator import CACHED_MEASUREMENTS, Validator
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+version_url = "https://cad.onshape.com/documents/c3a8ce032e33ebe875b9aab4/v/4c90f8401c6635b9b12d0d87/e/e09d11406e7a9143537efe3a"  # noqa
+workspace_url = "https://cad.onshape.com/documents/c3a8ce032e33ebe875b9aab4/w/4c90f8401c6635b9b12d0d87/e/e09d11406e7a9143537efe3a"  # noqa
+
+measurements = {
+    "Flow": 10 * u.L,
+    "TempCelsius": 21,
+    "D.LfomOrifices": 0.015875 * u.m,
+    "H.LfomOrifices": [0.0079375 * u.m, 0.02467613636363637 * u.m],
+    "N.LfomOrifices": [17.0, 4.0],
+    "V.SedUp": 0.85 * u.mm,
+    "AN.SedPlate": 60 * u.deg,
+    "Q.Plant": 0.1 * u.m**3 / u.s,
+    "Name": "Flocculator",
+}
+# the measurements the LFOM reads
+lfom_projection = {
+    key: measurements[key]
+    for key in ["Flow", "D.LfomOrifices", "H.LfomOrifices", "N.LfomOrifices"]
+}
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_round_trip():
+    loaded, processes = loads_measurements(dumps_measurements(measurements, ["ET"]))
+
+    assert processes == ["ET"]
+    assert loaded.keys() == measurements.keys()
+    for key, value in measurements.items():
+        assert loaded[key] == value
+        assert type(loaded[key]) is type(value)
+    assert loaded["Q.Plant"].units == u.m**3 / u.s
+    assert loaded["AN.SedPlate"].units == u.deg
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "url, cached",
+    [
+        (version_url, True),
+        (version_url.replace("/v/", "/m/"), True),
+        (workspace_url, False),
+        ("not an onshape url", False),
+    ],
+)
+def test_cache_key(url, cached):
+    assert (cache_key(url) is not None) == cached
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_cache_key_projection():
+    key = cache_key(version_url, ["Flow", "V.SedUp"])
+
+    assert key == cache_key(version_url, ["V.SedUp", "Flow"])
+    assert key != cache_key(version_url)
+    assert key != cache_key(version_url, ["Flow"])
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize("text", ['{"measurements": {"Flow"', '{"processes": []}'])
+def test_corrupt_entry_is_a_miss(tmp_path, text):
+    cache = MeasurementCache(str(tmp_path))
+    cache.put(version_url, measurements, ["ET"])
+    with open(cache.path(cache_key(version_url)), "w") as file:
+        file.write(text)
+
+    assert cache.get(version_url) is None
+    assert not os.listdir(str(tmp_path))
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_cache_get_put(tmp_path):
+    cache = MeasurementCache(str(tmp_path))
+    assert cache.get(version_url) is None
+
+    cache.put(version_url, measurements, ["ET"])
+    cache.put(workspace_url, measurements, ["ET"])
+
+    assert cache.get(version_url) == (measurements, ["ET"])
+    assert cache.get(workspace_url) is None
+    assert len(os.listdir(str(tmp_path))) == 1
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_cache_eviction(tmp_path):
+    entry_size = len(dumps_measurements(measurements, ["ET"]))
+    cache = MeasurementCache(str(tmp_path), max_bytes=2 * entry_size)
+    urls = [version_url.replace("4c90", str(i) * 4) for i in range(3)]
+
+    for i, url in enumerate(urls):
+        cache.put(url, measurements, ["ET"])
+        # make the access order unambiguous
+        os.utime(cache.path(cache_key(url)), (i, i))
+    cache.put(urls[0], measurements, ["ET"])
+
+    assert cache.get(urls[0]) is not None
+    assert cache.get(urls[1]) is None
+    assert cache.get(urls[2]) is not None
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validator_fetch_uses_cache(tmp_path, monkeypatch):
+    calls = []
+
+    def fetcher(url):
+        calls.append(url)
+        return b"{}"
+
+    def parse_documenter(data, projection=None):
+        return dict(lfom_projection), ["ET"]
+
+    monkeypatch.setattr(recorder, "parse_documenter", parse_documenter)
+    validator = Validator(
+        cache=MeasurementCache(str(tmp_path)),
+        fetcher=fetcher,
+        report_dir=str(tmp_path / "reports"),
+    )
+
+    for url in [version_url, version_url, workspace_url, workspace_url]:
+        assert validator.fetch(url) == (lfom_projection, ["ET"])
+
+    assert calls == [version_url, workspace_url, workspace_url]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validator_cache_projected(tmp_path, monkeypatch):
+    def parse_documenter(data, projection=None):
+        return dict(lfom_projection), ["ET"]
+
+    monkeypatch.setattr(recorder, "parse_documenter", parse_documenter)
+    cache = MeasurementCache(str(tmp_path))
+    validator = Validator(
+        cache=cache, fetcher=lambda url: b"{}", report_dir=str(tmp_path / "reports")
+    )
+
+    validator.fetch(version_url)
+
+    assert cache.get(version_url, CACHED_MEASUREMENTS) == (lfom_projection, ["ET"])
+    # projected measurements aren't served to callers which want them all
+    assert cache.get(version_url) is None
@@ -0,0 +1,98 @@
+import pytest
+import numpy as np
+from aguaclara.core.units import u
+from aide_validation.monte_carlo import (
+    Normal,
+    Uniform,
+    monte_carlo,
+    pass_probability,
+)
+from aide_validation.report_writer import ReportSection
+from aide_validation.validator import Validator
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "fixture, method",
+    [
+        ("lfom_measurements", "validate_lfom"),
+        ("floc_measurements", "validate_floc"),
+        ("sed_measurements", "validate_sed"),
+    ],
+)
+def test_nominal_matches_validator(tmp_path, request, fixture, method):
+    # without distributions every sample is the nominal design
+    measurements = request.getfixturevalue(fixture)
+    section = ReportSection()
+    getattr(Validator(report_dir=tmp_path), method)(measurements, section)
+    results = monte_carlo(measurements, {}, n_samples=4)
+
+    assert list(results) == list(dict.fromkeys(r.check for r in section.records))
+    for record in section.records:
+        assert results[record.check].pass_probability == float(record.passed)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_monte_carlo_floc(floc_measurements):
+    # the baffle spacing is at the upper limit of 6 spacings per channel, so
+    # about half of the samples fail
+    distributions = {"S.FlocBaffle": Normal(2 * u.mm), "TempCelsius": Uniform(5)}
+    results = monte_carlo(floc_measurements, distributions, n_samples=20000, seed=1)
+
+    spacing = results["check_baffle_spacing"]
+    assert spacing.margin.shape == (20000,)
+    assert 0.45 < spacing.pass_probability < 0.55
+    assert spacing.margin_percentiles[5] < 0 < spacing.margin_percentiles[95]
+    assert results["check_G_theta"].pass_probability == 1
+    assert pass_probability(results) == spacing.pass_probability
+
+    again = monte_carlo(floc_measurements, distributions, n_samples=20000, seed=1)
+    assert np.array_equal(again["check_baffle_spacing"].margin, spacing.margin)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_monte_carlo_plant(lfom_measurements, floc_measurements, sed_measurements):
+    measurements = {**lfom_measurements, **floc_measurements, **sed_measurements}
+    measurements["Flow"] = 1 * u.L
+    distributions = {
+        "D.LfomOrifices": Uniform(0.3 * u.mm),
+        "H.LfomOrifices": Normal(1 * u.mm),
+        "AN.SedPlate": Normal(1 * u.deg),
+        "L.Sed": Normal(10 * u.cm),
+    }
+    results = monte_carlo(
+        measurements, distributions, n_samples=100000, processes=["ET", "Sed"]
+    )
+
+    assert list(results)[0] == "check_flow_lfom_vert"
+    assert "check_G_theta" not in results
+    for result in results.values():
+        assert result.margin.shape == (100000,)
+        assert 0 <= result.pass_probability <= 1
+    assert 0 < results["check_sed_tank"].pass_probability < 1
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_nan_margins(floc_measurements):
+    # a wide spread gives some negative channel heights, whose G theta is nan
+    distributions = {"H.FlocChannel": Normal(3 * u.m)}
+    results = monte_carlo(floc_measurements, distributions, n_samples=1000, seed=1)
+
+    G_theta = results["check_G_theta"]
+    assert np.isnan(G_theta.margin).any()
+    assert not G_theta.passed[np.isnan(G_theta.margin)].any()
+    assert not np.isnan(list(G_theta.margin_percentiles.values())).any()
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_unknown_distribution(floc_measurements):
+    with pytest.raises(KeyError, match="S.FlocBafle"):
+        monte_carlo(floc_measurements, {"S.FlocBafle": Normal(2 * u.mm)})
+    # measurements of processes which aren't checked can't vary either
+    with pytest.raises(KeyError):
+        monte_carlo(
+            floc_measurements, {"D.LfomOrifices": Normal(1 * u.mm)}, processes=["Floc"]
+        )
@@ -0,0 +1,64 @@
+import os
+import pytest
+from aide_validation.pdf_pipeline import PdfPipeline
+from aide_validation.report_writer import ReportWriter
+from aide_validation.validator import Validator
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize("processes", [False, True])
+def test_pipeline(tmp_path, processes):
+    writers = [ReportWriter(output_dir=str(tmp_path)) for _ in range(4)]
+    with PdfPipeline(max_workers=2, processes=processes) as pipeline:
+        futures = []
+        for i, writer in enumerate(writers):
+            writer.write_message("Report {}\n".format(i))
+            futures.append(pipeline.submit(writer))
+        pipeline.flush()
+
+        assert [future.result() for future in futures] == [
+            writer.pdf_name for writer in writers
+        ]
+        assert all(os.path.exists(writer.pdf_name) for writer in writers)
+        assert not pipeline.pending
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_flush_raises(tmp_path):
+    writer = ReportWriter(output_dir=str(tmp_path))
+    writer.pdf_name = str(tmp_path / "missing" / "report.pdf")
+
+    with PdfPipeline() as pipeline:
+        future = pipeline.submit(writer)
+        # the PDF fails before flush is called
+        future.exception(timeout=60)
+        with pytest.raises(FileNotFoundError):
+            pipeline.flush()
+
+        # the error is raised once
+        pipeline.flush()
+        assert not pipeline.pending
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validate_in_background(tmp_path, lfom_measurements):
+    with PdfPipeline() as pipeline:
+        validator = Validator(report_dir=str(tmp_path), pdf_pipeline=pipeline)
+        result = validator.validate_measurements(lfom_measurements, ["ET"])
+
+        assert result == "Valid"
+        assert os.path.exists(result.report_name)
+        assert result.pdf.result(timeout=60) == validator.report_writer.pdf_name
+        assert os.path.exists(result.pdf.result())
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validate_without_pipeline(tmp_path, lfom_measurements):
+    validator = Validator(report_dir=str(tmp_path))
+    result = validator.validate_measurements(lfom_measurements, [])
+
+    assert result.pdf.done()
+    assert os.path.exists(result.pdf.result())
@@ -0,0 +1,234 @@
+import json
+import os
+from types import SimpleNamespace
+import pytest
+from aguaclara.core.units import u
+from aide_validation.measurements import required_measurements
+from aide_validation.recorder import (
+    RecordingFetcher,
+    ReplayFetcher,
+    fixture_name,
+    parse_documenter,
+)
+from aide_validation.validator import Validator
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+url = "https://cad.onshape.com/documents/c3a8ce032e33ebe875b9aab4/v/4c90f8401c6635b9b12d0d87/e/e09d11406e7a9143537efe3a"  # noqa
+
+
+def map_entry(key, value):
+    return {
+        "typeName": "BTFSValueMapEntry",
+        "message": {"key": {"message": {"value": key}}, "value": value},
+    }
+
+
+def with_units(value, meter_power):
+    return {
+        "typeName": "BTFSValueWithUnits",
+        "message": {
+            "typeTag": "",
+            "value": value,
+            "unitToPower": [{"key": "METER", "value": meter_power}],
+        },
+    }
+
+
+def number(value):
+    return {"typeName": "BTFSValueNumber", "message": {"value": value}}
+
+
+def documenter_response(variables, process):
+    """Builds the JSON Onshape returns for a Documenter feature"""
+    doc = {
+        "message": {
+            "value": [
+                map_entry(
+                    "variables",
+                    {
+                        "message": {
+                            "value": [
+                                map_entry(key, value)
+                                for key, value in variables.items()
+                            ]
+                        }
+                    },
+                ),
+                map_entry("process", {"message": {"value": process}}),
+            ]
+        }
+    }
+    attribute = {
+        "typeName": "BTFSValueMap",
+        "message": {
+            "typeTag": "Documenter",
+            "value": [{"message": {"value": {"message": {"value": [doc]}}}}],
+        },
+    }
+    return json.dumps({"result": {"message": {"value": [attribute]}}}).encode()
+
+
+lfom_response = documenter_response(
+    {
+        "Flow": with_units(0.01, 3),
+        "D.LfomOrifices": with_units(0.015875, 1),
+        "N.LfomOrifices": {
+            "typeName": "BTFSValueArray",
+            "message": {
+                "value": [number(n) for n in [17, 4, 6, 3, 4, 3, 3, 3, 3, 2, 3, 1]]
+            },
+        },
+        "H.LfomOrifices": {
+            "typeName": "BTFSValueArray",
+            "message": {
+                "value": [
+                    with_units(h, 1)
+                    for h in [
+                        0.0079375,
+                        0.02467613636363637,
+                        0.04141477272727274,
+                        0.0581534090909091,
+                        0.07489204545454548,
+                        0.09163068181818185,
+                        0.1083693181818182,
+                        0.1251079545454546,
+                        0.14184659090909096,
+                        0.15858522727272734,
+                        0.1753238636363637,
+                        0.19206250000000008,
+                    ]
+                ]
+            },
+        },
+    },
+    "ET",
+)
+
+
+class FakeClient(object):
+    """Stands in for onshape_client.Client"""
+
+    def __init__(self, data):
+        self.calls = []
+        self.part_studios_api = SimpleNamespace(eval_feature_script=self.eval)
+        self.data = data
+
+    def eval(self, did, wvm, wvmid, eid, **kwargs):
+        self.calls.append((did, wvm, wvmid, eid))
+        return SimpleNamespace(data=self.data)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_fixture_name():
+    assert fixture_name(url) == (
+        "c3a8ce032e33ebe875b9aab4_v_4c90f8401c6635b9b12d0d87_"
+        "e09d11406e7a9143537efe3a.json"
+    )
+    with pytest.raises(ValueError):
+        fixture_name("https://cad.onshape.com/")
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_parse_documenter():
+    measurements, processes = parse_documenter(lfom_response)
+
+    assert processes == ["ET"]
+    assert measurements["Flow"] == 0.01 * u.m**3
+    assert measurements["D.LfomOrifices"] == 0.015875 * u.m
+    assert measurements["N.LfomOrifices"][0] == 17
+    assert len(measurements["H.LfomOrifices"]) == 12
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_parse_documenter_projection():
+    response = documenter_response(
+        {"Flow": with_units(0.01, 3), "L.Unused": with_units(2, 1)}, "ET"
+    )
+    requested = []
+
+    def projection(processes):
+        requested.append(processes)
+        return required_measurements(processes)
+
+    measurements, processes = parse_documenter(response, projection)
+
+    assert requested == [["ET"]]
+    assert processes == ["ET"]
+    assert measurements == {"Flow": 0.01 * u.m**3}
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_record_and_replay(tmp_path):
+    client = FakeClient(lfom_response)
+    recorder = RecordingFetcher(str(tmp_path), client=client)
+
+    assert recorder(url) == lfom_response
+    assert client.calls == [
+        (
+            "c3a8ce032e33ebe875b9aab4",
+            "v",
+            "4c90f8401c6635b9b12d0d87",
+            "e09d11406e7a9143537efe3a",
+        )
+    ]
+    assert os.listdir(str(tmp_path)) == [fixture_name(url)]
+    assert ReplayFetcher(str(tmp_path))(url) == lfom_response
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_replay_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ReplayFetcher(str(tmp_path))(url)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validate_replay(tmp_path):
+    RecordingFetcher(str(tmp_path), client=FakeClient(lfom_response))(url)
+
+    validator = Validator(
+        fetcher=ReplayFetcher(str(tmp_path)), report_dir=str(tmp_path / "reports")
+    )
+    assert validator.validate(url) == "Valid"
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_default_fetch_parses_required(tmp_path, monkeypatch):
+    import aguaclara.core.onshape_parser as par
+    import aide_validation.fetch as fetch
+
+    response = documenter_response(
+        {"Flow": with_units(0.01, 3), "L.Unused": with_units(2, 1)}, "ET"
+    )
+    client = FakeClient(response)
+    fetcher = fetch.OnshapeFetcher(client=client)
+    monkeypatch.setattr(fetch, "default_fetcher", lambda: fetcher)
+    parsed = []
+    parse_quantity = par.parse_quantity
+
+    def record(q, for_docs=True):
+        parsed.append(q["value"])
+        return parse_quantity(q, for_docs)
+
+    monkeypatch.setattr(par, "parse_quantity", record)
+
+    validator = Validator(report_dir=str(tmp_path))
+    measurements, processes = validator.fetch(url)
+
+    assert len(client.calls) == 1
+    assert processes == ["ET"]
+    assert measurements == {"Flow": 0.01 * u.m**3}
+    # the unused variable is never converted to a quantity
+    assert parsed == [0.01]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_record_with_default_client(tmp_path, monkeypatch):
+    import aide_validation.fetch as fetch
+
+    client = FakeClient(lfom_response)
+    monkeypatch.setattr(fetch, "default_client", lambda: client)
+
+    assert RecordingFetcher(str(tmp_path))(url) == lfom_response
+    assert len(client.calls) == 1
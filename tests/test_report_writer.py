@@ -0,0 +1,130 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+import os
+import pytest
+from aguaclara.core.units import u
+from aide_validation.report_writer import Display, ReportSection, ReportWriter
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+
+class CountingArg(object):
+    """Message argument which counts how many times it is formatted"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "arg"
+
+
+@pytest.fixture
+def report_writer(tmp_path):
+    return ReportWriter(output_dir=str(tmp_path))
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_write_check(report_writer):
+    report_writer.write_message("Plain {message}.\n")
+    report_writer.write_check(
+        "check_length",
+        "The length, {!s}, was below {!s}.\n",
+        (Display(0.0125, u.m, u.mm), 2),
+        {"length": 0.0125},
+        0.0125,
+        2,
+    )
+
+    assert report_writer.to_text() == (
+        "AIDE Validation Report\n"
+        "Plain {message}.\n"
+        "The length, 12.5 millimeter, was below 2.\n"
+    )
+    assert not os.path.exists(report_writer.report_name)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_deferred_formatting(report_writer):
+    arg = CountingArg()
+    report_writer.write_check("check_arg", "{!s}\n", (arg,), passed=False)
+
+    assert arg.formatted == 0
+    assert report_writer.records[0].passed is False
+    report_writer.to_text()
+    assert arg.formatted == 1
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_to_json(report_writer):
+    report_writer.write_check(
+        "check_range",
+        "{!s}\n",
+        (0.5,),
+        {"x": [1, 2]},
+        0.5,
+        (0, 1),
+    )
+    report_writer.set_result("Invalid: Check Validation Report")
+    report = json.loads(report_writer.to_json())
+
+    assert report["result"] == "Invalid: Check Validation Report"
+    assert report["records"] == [
+        {
+            "check": "check_range",
+            "inputs": {"x": [1, 2]},
+            "value": 0.5,
+            "limit": [0, 1],
+            "passed": True,
+            "message": "0.5\n",
+        }
+    ]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_close_and_pdf(report_writer):
+    report_writer.write_message("Done.\n")
+    report_writer.close()
+    report_writer.close()
+    report_writer.to_pdf()
+
+    with open(report_writer.report_name) as file:
+        assert file.read() == report_writer.to_text()
+    assert os.path.exists(report_writer.report_name[: -len("txt")] + "pdf")
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_unique_report_names(tmp_path):
+    output_dir = str(tmp_path / "reports")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        writers = list(
+            executor.map(lambda _: ReportWriter(output_dir=output_dir), range(50))
+        )
+    for writer in writers:
+        writer.close()
+
+    assert len(os.listdir(output_dir)) == len(writers)
+    assert all(os.path.dirname(writer.report_name) == output_dir for writer in writers)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_sections(report_writer):
+    section = ReportSection("LFOM")
+    section.write_message("Checked.\n")
+    section.set_result("Invalid: Check Validation Report")
+    report_writer.add_section(section)
+
+    assert report_writer.to_text() == (
+        "AIDE Validation Report\n"
+        "\n"
+        "LFOM: Invalid: Check Validation Report\n"
+        "Checked.\n"
+    )
+    assert json.loads(report_writer.to_json())["sections"] == [
+        {
+            "title": "LFOM",
+            "result": "Invalid: Check Validation Report",
+            "records": section.records_json(),
+        }
+    ]
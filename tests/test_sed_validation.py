@@ -1,5 +1,4 @@
 import pytest
-import time
 from aguaclara.core.units import u
 import aguaclara.core.pipes as pipe
 from aide_validation.report_writer import ReportWriter
@@ -7,16 +6,11 @@ import aide_validation.sed_validation as sed
 
 # set skip_all_tests = True to focus on single test
 skip_all_tests = False
-# sleep one second so reports won't have the same name
-time.sleep(1)
-writer = ReportWriter()
 
 
 @pytest.fixture
-def report_writer():
-    # reset result to its default between tests
-    writer.set_result("Valid")
-    return writer
+def report_writer(tmp_path):
+    return ReportWriter(output_dir=str(tmp_path))
 
 
 @pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
@@ -155,8 +149,13 @@ def test_check_sed_tank(length, width, vel_up, q_input, expected, report_writer)
 def test_check_diffuser(
     w_sed, w_diffuser, vel_up, max_hl, temp, expected, report_writer
 ):
-    sed.check_diffuser(w_sed, w_diffuser, vel_up, max_hl, temp, report_writer)
+    vel_diffuser = sed.check_diffuser(
+        w_sed, w_diffuser, vel_up, max_hl, temp, report_writer
+    )
     assert report_writer.get_result() == expected
+    assert vel_diffuser.to(u.m / u.s).magnitude == pytest.approx(
+        (vel_up * w_sed / w_diffuser).to(u.m / u.s).magnitude
+    )
 
 
 @pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
@@ -0,0 +1,49 @@
+import json
+import numpy as np
+import pytest
+from aide_validation.graph import CHECK_MEASUREMENTS
+from aide_validation.sensitivity import perturbation_matrix, sensitivities
+from aide_validation.validator import Validator
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_perturbation_matrix():
+    factors = perturbation_matrix(2, step=0.1)
+
+    assert np.allclose(factors, [[1.1, 1], [1, 1.1], [0.9, 1], [1, 0.9]])
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_G_theta_sensitivity(tmp_path, floc_measurements):
+    validator = Validator(report_dir=tmp_path)
+    validator.validate_floc(dict(floc_measurements))
+    G_theta = validator.report_writer.records[0].value
+
+    results = sensitivities(floc_measurements)
+
+    # G theta is proportional to 1 / S and 1 / sqrt(W)
+    G_theta_sensitivity = results["check_G_theta"]
+    assert G_theta_sensitivity["S.FlocBaffle"] == pytest.approx(-G_theta / 30000)
+    assert G_theta_sensitivity["W.FlocChannel"] == pytest.approx(-G_theta / 60000)
+    assert list(results["check_baffle_spacing"]) == ["L.FlocChannel", "S.FlocBaffle"]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_sensitivity_in_report(tmp_path, sed_measurements):
+    validator = Validator(report_dir=tmp_path, pdf=False, sensitivity=True)
+    validator.validate_measurements(dict(sed_measurements), ["Sed"])
+    report = json.loads(validator.report_writer.to_json())
+
+    records = report["sections"][0]["records"]
+    for record in records:
+        assert set(record["sensitivity"]) <= set(CHECK_MEASUREMENTS[record["check"]])
+    inlet = [record for record in records if record["check"] == "check_inlet_manifold"]
+    assert inlet[0]["sensitivity"]["ID.SedManifold"] > 0
+
+    validator = Validator(report_dir=tmp_path, pdf=False)
+    validator.validate_measurements(dict(sed_measurements), ["Sed"])
+    report = json.loads(validator.report_writer.to_json())
+    assert "sensitivity" not in report["sections"][0]["records"][0]
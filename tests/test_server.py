@@ -0,0 +1,143 @@
+import json
+import os
+import socket
+import threading
+import pytest
+from aide_validation.measurement_cache import encode_measurement
+from aide_validation.server import ServerBusy, ValidationClient, ValidationServer
+from aide_validation.validator import Validator
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+
+def start(validation_server, **kwargs):
+    # serve on a free port in the background
+    server = validation_server.serve(port=0, **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def validation_server(tmp_path):
+    validation_server = ValidationServer(max_workers=2, report_dir=tmp_path)
+    server = start(validation_server)
+    yield validation_server, ValidationClient(port=server.server_address[1])
+    server.shutdown()
+    server.server_close()
+    validation_server.close()
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validate_measurements(validation_server, floc_measurements):
+    _, client = validation_server
+    measurements = encode_measurement(floc_measurements)
+
+    response = client.validate(measurements=measurements)
+
+    assert response["result"] == "Valid"
+    assert [section["title"] for section in response["sections"]] == ["Flocculator"]
+    checks = [record["check"] for record in response["sections"][0]["records"]]
+    assert checks == ["check_G_theta", "check_baffle_spacing"]
+    assert os.path.exists(response["pdf"])
+
+    flow = {"Flow": {"__quantity__": [15, "liter"]}}
+    response = client.validate(measurements=flow, processes=["Floc"])
+    assert response["result"] == "Error: 'TempCelsius'"
+    assert client.health() == {"status": "ok", "in_flight": 0}
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_bad_request(validation_server):
+    _, client = validation_server
+
+    with pytest.raises(ValueError):
+        client._request("POST", "/validate", {"processes": ["Floc"]})
+    with pytest.raises(ValueError):
+        client._request("GET", "/unknown")
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_back_pressure(tmp_path, monkeypatch, floc_measurements):
+    release = threading.Event()
+    started = threading.Event()
+    validate_measurements = Validator.validate_measurements
+
+    def blocked(self, *args, **kwargs):
+        started.set()
+        release.wait(10)
+        return validate_measurements(self, *args, **kwargs)
+
+    monkeypatch.setattr(Validator, "validate_measurements", blocked)
+    validation_server = ValidationServer(
+        max_workers=1, max_queue=0, report_dir=tmp_path
+    )
+    request = {"measurements": encode_measurement(floc_measurements)}
+
+    first = validation_server.submit(request)
+    started.wait(10)
+    with pytest.raises(ServerBusy):
+        validation_server.submit(request)
+
+    release.set()
+    assert first.result()["result"] == "Valid"
+    assert validation_server.submit(request).result()["result"] == "Valid"
+    validation_server.close()
+
+
+@pytest.mark.skipif(
+    skip_all_tests or not hasattr(socket, "AF_UNIX"), reason="Exclude all tests"
+)
+def test_unix_socket(tmp_path, floc_measurements):
+    socket_path = str(tmp_path / "validate.sock")
+    validation_server = ValidationServer(report_dir=tmp_path)
+    server = validation_server.serve(socket_path=socket_path)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    client = ValidationClient(socket_path=socket_path)
+    response = client.validate(measurements=encode_measurement(floc_measurements))
+
+    assert response["result"] == "Valid"
+    assert json.dumps(response)
+    server.shutdown()
+    server.server_close()
+    validation_server.close()
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validator_kwargs(tmp_path, floc_measurements):
+    validation_server = ValidationServer(
+        report_dir=tmp_path, pdf=False, sensitivity=True
+    )
+    request = {"measurements": encode_measurement(floc_measurements)}
+
+    response = validation_server.validate(request)
+
+    assert response["result"] == "Valid"
+    assert "pdf" not in response
+    assert not list(tmp_path.glob("*.pdf"))
+    assert "sensitivity" in response["sections"][0]["records"][0]
+    validation_server.close()
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_warm_fetcher(tmp_path, monkeypatch, floc_measurements):
+    import aide_validation.fetch as fetch
+
+    fetcher = fetch.OnshapeFetcher(client=object())
+    monkeypatch.setattr(fetch, "default_fetcher", lambda: fetcher)
+    fetchers = []
+
+    def fetch_url(self, url):
+        fetchers.append(self.fetcher)
+        return dict(floc_measurements), ["Floc"]
+
+    monkeypatch.setattr(Validator, "fetch", fetch_url)
+    validation_server = ValidationServer(report_dir=tmp_path, pdf=False)
+    validation_server.warm()
+
+    for _ in range(2):
+        response = validation_server.validate({"url": "https://example.com"})
+        assert response["result"] == "Valid"
+    assert fetchers == [fetcher, fetcher]
+    validation_server.close()
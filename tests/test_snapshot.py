@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from aide_validation.snapshot import SnapshotCorpus, SnapshotWriter, save_snapshots
+from aide_validation.units import u
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+
+@pytest.fixture
+def mixed_measurements(lfom_measurements):
+    measurements = dict(lfom_measurements)
+    measurements.update(
+        {
+            "Name": "plant",
+            "TempCelsius": 20,
+            "Flag": True,
+            "Map": {"a": 1 * u.m},
+            "H.Rows": np.array([0.1, 0.2]) * u.m,
+            "Empty": [],
+        }
+    )
+    return measurements
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_round_trip(tmp_path, mixed_measurements, floc_measurements):
+    snapshots = [(mixed_measurements, ["ET"]), (floc_measurements, ["Floc"])]
+    save_snapshots(tmp_path, snapshots)
+
+    corpus = SnapshotCorpus(tmp_path)
+
+    assert len(corpus) == 2
+    assert isinstance(corpus.values, np.memmap)
+    for (measurements, processes), (expected, expected_processes) in zip(
+        corpus, snapshots
+    ):
+        assert processes == expected_processes
+        assert list(measurements) == list(expected)
+        for key, value in expected.items():
+            if isinstance(value, u.Quantity):
+                assert measurements[key].units == value.units
+                assert np.allclose(measurements[key].magnitude, value.magnitude)
+            elif isinstance(value, list) and value and isinstance(value[0], u.Quantity):
+                assert [item.to(value[0].units).magnitude for item in value] == (
+                    pytest.approx([item.magnitude for item in measurements[key]])
+                )
+            else:
+                assert measurements[key] == value
+                assert type(measurements[key]) is type(value)
+    assert corpus[-1][1] == ["Floc"]
+    with pytest.raises(IndexError):
+        corpus[2]
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_column(tmp_path, lfom_measurements, floc_measurements):
+    with SnapshotWriter(tmp_path) as writer:
+        for flow in [10 * u.L, 0.02 * u.m**3]:
+            measurements = dict(floc_measurements)
+            measurements["Flow"] = flow
+            writer.add(measurements, ["Floc"])
+        assert writer.add(lfom_measurements) == 2
+        writer.add({"Name": "plant"})
+
+    corpus = SnapshotCorpus(tmp_path, mmap_mode=None)
+
+    assert np.allclose(corpus.column("Flow", "L")[:3], [10, 20, 10])
+    assert np.isnan(corpus.column("Flow", "L")[3])
+    assert np.allclose(corpus.column("Flow")[:3], [10, 0.02, 10])
+    # lists and missing measurements aren't scalars
+    assert np.isnan(corpus.column("H.LfomOrifices")).all()
+    assert np.isnan(corpus.column("Height")).all()
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_streamed_to_disk(tmp_path, lfom_measurements):
+    writer = SnapshotWriter(tmp_path)
+    writer.add(lfom_measurements, ["ET"])
+    writer.files["values"].flush()
+
+    # values are on disk as they are added, and the index is written last
+    assert (tmp_path / "values.bin").stat().st_size == 8 * 26
+    assert not (tmp_path / "index.json").exists()
+    writer.close()
+    assert len(SnapshotCorpus(tmp_path)) == 1
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_mixed_list_types(tmp_path):
+    measurements = {"Mixed": [1, 2.5], "Lengths": [1 * u.m, 2.5 * u.m]}
+    save_snapshots(tmp_path, [(measurements, [])])
+
+    ((snapshot, _),) = SnapshotCorpus(tmp_path)
+
+    assert [type(item) for item in snapshot["Mixed"]] == [int, float]
+    assert [type(item.magnitude) for item in snapshot["Lengths"]] == [int, float]
+    assert snapshot == measurements
@@ -0,0 +1,194 @@
+import pytest
+import numpy as np
+from aguaclara.core.units import u
+from aide_validation.report_writer import ReportSection
+import aide_validation.floc_validation as floc
+import aide_validation.lfom_validation as lfom
+import aide_validation.sed_validation as sed
+from aide_validation.sweep import grid, sweep
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+writer = ReportSection()
+
+
+def scalar_results(check, points, **fixed):
+    # run the scalar check once per point to compare against the sweep
+    results = []
+    for point in points:
+        writer.set_result("Valid")
+        check(report_writer=writer, **fixed, **point)
+        results.append(writer.get_result() == "Valid")
+    return results
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_grid():
+    axes = grid(a=[1, 2, 3], b=[4, 5])
+
+    assert axes["a"].shape == (3, 1)
+    assert axes["b"].shape == (1, 2)
+    assert np.broadcast(axes["a"], axes["b"]).shape == (3, 2)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_sweep_baffle_spacing():
+    baffle_s = np.array([0.25, 0.3, 0.3085, 0.5, 0.62, 0.7])
+    result = sweep(floc.check_baffle_spacing, channel_l=1.851, baffle_s=baffle_s)
+
+    points = [{"channel_l": 1.851 * u.m, "baffle_s": s * u.m} for s in baffle_s]
+    assert list(result.passed) == scalar_results(floc.check_baffle_spacing, points)
+    assert np.all((result.margin >= 0) == result.passed)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_sweep_G_theta():
+    axes = grid(channel_w=np.array([0.1, 0.312, 0.5]), hl=np.array([0.3, 0.5, 0.8]))
+    fixed = {
+        "q": 30 * u.L / u.s,
+        "channel_l": 1.851 * u.m,
+        "design_water_height": 2.428 * u.m,
+        "channel_n": 8,
+        "temp": 20 * u.degC,
+        "min_G_theta": 40000,
+    }
+    result = sweep("check_G_theta", **fixed, **axes)
+
+    points = [
+        {"channel_w": w * u.m, "hl": hl * u.m}
+        for w in [0.1, 0.312, 0.5]
+        for hl in [0.3, 0.5, 0.8]
+    ]
+    assert result.value.shape == (3, 3)
+    assert list(result.passed.ravel()) == scalar_results(
+        floc.check_G_theta, points, **fixed
+    )
+    assert np.all((result.margin > 0) == result.passed)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_sweep_diffuser():
+    vel_up = np.array([0.85, 1.0, 1.5])
+    max_hl = np.array([0.5, 1])
+    axes = grid(vel_up=vel_up * u.mm / u.s, max_hl=max_hl * u.cm)
+    fixed = {"w_sed": 42 * u.inch, "w_diffuser": 1 / 8 * u.inch, "temp": 20 * u.degC}
+    result = sweep("check_diffuser", **fixed, **axes)
+
+    points = [
+        {"vel_up": v * u.mm / u.s, "max_hl": hl * u.cm} for v in vel_up for hl in max_hl
+    ]
+    assert list(result.passed.ravel()) == scalar_results(
+        sed.check_diffuser, points, **fixed
+    )
+    assert np.all((result.margin > 0) == result.passed)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_sweep_sed_tank():
+    q_input = np.array([0.9, 0.975, 1, 1.2]) * u.L / u.s
+    fixed = {"length": 1.1 * u.m, "width": 42 * u.inch, "vel_up": 0.85 * u.mm / u.s}
+    result = sweep("check_sed_tank", q_input=q_input, **fixed)
+
+    points = [{"q_input": q} for q in q_input]
+    assert list(result.passed) == scalar_results(sed.check_sed_tank, points, **fixed)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_sweep_plate_settlers():
+    angle_plate = np.array([45, 55, 60, 70])
+    q_input = np.array([1, 1.2])
+    axes = grid(angle_plate=angle_plate * u.deg, q_input=q_input * u.L / u.s)
+    fixed = {
+        "vel_capture": 0.12 * u.mm / u.s,
+        "n_plate": 26,
+        "l_plate": 60 * u.cm,
+        "w_plate": 42 * u.inch,
+        "space_plate": 2.5 * u.cm,
+        "plate_thickness": 1 * u.mm,
+    }
+    result = sweep("check_plate_settlers", **fixed, **axes)
+
+    points = [
+        {"angle_plate": a * u.deg, "q_input": q * u.L / u.s}
+        for a in angle_plate
+        for q in q_input
+    ]
+    assert list(result.passed.ravel()) == scalar_results(
+        sed.check_plate_settlers, points, **fixed
+    )
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_sweep_inlet_manifold():
+    q_input = np.array([0.8, 1, 1.1, 1.5]) * u.L / u.s
+    fixed = {
+        "diam": 8.5 * u.cm,
+        "pi_flow_manifold": 0.8,
+        "vel_diffuser": 0.28 * u.m / u.s,
+    }
+    result = sweep("check_inlet_manifold", q_input=q_input, **fixed)
+
+    points = [{"q_input": q} for q in q_input]
+    assert list(result.passed) == scalar_results(
+        sed.check_inlet_manifold, points, **fixed
+    )
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_sweep_outlet_manifold():
+    n_orifices = np.array([6, 8, 10, 12])
+    fixed = {
+        "diam_orifice": 5 / 8 * u.inch,
+        "hl_design": 5 * u.cm,
+        "q_input": 1 * u.L / u.s,
+    }
+    result = sweep("check_outlet_manifold", n_orifices=n_orifices, **fixed)
+
+    points = [{"n_orifices": n} for n in n_orifices]
+    assert list(result.passed) == scalar_results(
+        sed.check_outlet_manifold, points, **fixed
+    )
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_sweep_flow_lfom_vert():
+    diameter = np.array([0.0145, 0.015875, 0.0165, 0.0175])
+    fixed = {
+        "ori_heights": np.linspace(0.0079375, 0.1920625, 12) * u.m,
+        "ori_numbers": [17, 4, 6, 3, 4, 3, 3, 3, 3, 2, 3, 1],
+        "cutoff": 0.05,
+        "q_input": 10 * u.L / u.s,
+    }
+    result = sweep("check_flow_lfom_vert", diameter=diameter * u.m, **fixed)
+
+    points = [{"diameter": d * u.m} for d in diameter]
+    assert list(result.passed) == scalar_results(
+        lfom.check_flow_lfom_vert, points, **fixed
+    )
+    assert np.all((result.margin > 0) == result.passed)
+
+    # chunks give the same flows as one pass
+    chunked = sweep("check_flow_lfom_vert", diameter=diameter, chunk_size=3, **fixed)
+    assert np.allclose(chunked.value, result.value)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_sweep_unknown_check():
+    with pytest.raises(ValueError):
+        sweep("check_unknown", q=1)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_plain_temperature_is_kelvin():
+    celsius = np.array([15.0, 20.0])
+    fixed = {"w_sed": 42 * u.inch, "w_diffuser": 1 / 8 * u.inch}
+    fixed.update({"vel_up": 0.85 * u.mm / u.s, "max_hl": 1 * u.cm})
+
+    result = sweep("check_diffuser", temp=celsius + 273.15, **fixed)
+    expected = sweep("check_diffuser", temp=u.Quantity(celsius, u.degC), **fixed)
+
+    assert np.allclose(result.value, expected.value)
+    # plain numbers aren't taken as degrees Celsius
+    with np.errstate(invalid="ignore"):
+        result = sweep("check_diffuser", temp=celsius, **fixed)
+    assert np.isnan(result.margin).all()
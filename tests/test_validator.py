@@ -1,13 +1,13 @@
-import time
 import pytest
 from aguaclara.core.units import u
-from aide_validation.validator import Validator
+from aide_validation.validator import Validator, combine_results
 
 # set skip_all_tests = True to focus on single test
 skip_all_tests = False
 
 
 @pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.network
 @pytest.mark.parametrize(
     "url, expected",
     [
@@ -33,11 +33,8 @@ skip_all_tests = False
         ),
     ],
 )
-def test_validate(url, expected):
-    # sleep one second so reports won't have the same name
-    time.sleep(1)
-
-    validator = Validator()
+def test_validate(tmp_path, url, expected):
+    validator = Validator(report_dir=str(tmp_path))
     result = validator.validate(url)
 
     assert result == expected
@@ -126,11 +123,8 @@ def test_validate(url, expected):
         ),
     ],
 )
-def test_validate_lfom(measure, expected):
-    # sleep one second so reports won't have the same name
-    time.sleep(1)
-
-    validator = Validator()
+def test_validate_lfom(tmp_path, measure, expected):
+    validator = Validator(report_dir=str(tmp_path))
     result = validator.validate_lfom(measure)
 
     assert result == expected
@@ -162,11 +156,8 @@ def test_validate_lfom(measure, expected):
         ),
     ],
 )
-def test_validate_floc(measure, expected):
-    # sleep one second so reports won't have the same name
-    time.sleep(1)
-
-    validator = Validator()
+def test_validate_floc(tmp_path, measure, expected):
+    validator = Validator(report_dir=str(tmp_path))
     result = validator.validate_floc(measure)
 
     assert result == expected
@@ -208,11 +199,169 @@ def test_validate_floc(measure, expected):
         ),
     ],
 )
-def test_validate_sed(measure, expected):
-    # sleep one second so reports won't have the same name
-    time.sleep(1)
-
-    validator = Validator()
+def test_validate_sed(tmp_path, measure, expected):
+    validator = Validator(report_dir=str(tmp_path))
     result = validator.validate_sed(measure)
 
     assert result == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validate_many(tmp_path, monkeypatch, lfom_measurements):
+    lfom = lfom_measurements
+    parsed = {
+        "valid": (lfom, ["ET"]),
+        "invalid": (dict(lfom, Flow=15 * u.L), ["ET"]),
+        "none": (lfom, []),
+    }
+
+    def fetch(self, url):
+        return parsed[url]
+
+    monkeypatch.setattr(Validator, "fetch", fetch)
+
+    urls = ["invalid", "missing", "valid", "none"]
+    results = Validator(report_dir=str(tmp_path)).validate_many(urls, max_workers=2)
+
+    assert results == [
+        "Invalid: Check Validation Report",
+        "Error: 'missing'",
+        "Valid",
+        "Invalid: No Unit Process Selected by Onshape Documenter",
+    ]
+    assert [result.url for result in results] == urls
+    assert len({result.report_name for result in results}) == len(urls)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "results, expected",
+    [
+        (["Valid", "Valid"], "Valid"),
+        (
+            ["Invalid: Check Validation Report", "Valid"],
+            "Invalid: Check Validation Report",
+        ),
+        (
+            ["Valid", "Invalid: Check Validation Report"],
+            "Invalid: Check Validation Report",
+        ),
+        (["Invalid: Check Validation Report", "Error: 'FB'"], "Error: 'FB'"),
+        (["Error: 'Flow'", "Error: 'FB'"], "Error: 'Flow'"),
+    ],
+)
+def test_combine_results(results, expected):
+    assert combine_results(results) == expected
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize(
+    "processes, expected, titles",
+    [
+        (["ET"], "Valid", ["LFOM"]),
+        # the invalid flocculator is no longer overwritten by the valid LFOM
+        (
+            ["Floc", "ET"],
+            "Invalid: Check Validation Report",
+            ["LFOM", "Flocculator"],
+        ),
+        (
+            ["ET", "Floc", "Sed"],
+            "Error: 'V.SedUp'",
+            ["LFOM", "Flocculator", "Sedimentation Tank"],
+        ),
+    ],
+)
+def test_validate_plant(
+    tmp_path, processes, expected, titles, lfom_measurements, floc_measurements
+):
+    measure = {**lfom_measurements, **floc_measurements, "Flow": 10 * u.L}
+    validator = Validator(report_dir=str(tmp_path))
+    result = validator.validate_measurements(measure, processes)
+
+    assert result == expected
+    assert validator.report_writer.get_result() == expected
+    # sections are always in the same order, whatever order processes are in
+    assert [section.title for section in validator.report_writer.sections] == titles
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_missing_measurements_reported_before_checks(tmp_path):
+    validator = Validator(report_dir=str(tmp_path))
+    result = validator.validate_measurements(
+        {"Flow": 15 * u.L, "TempCelsius": 20}, ["Floc", "Sed"]
+    )
+
+    assert result == "Error: 'N.FlocChannels'"
+    for section in validator.report_writer.sections:
+        assert [record.check for record in section.records] == [None]
+        assert section.records[0].template.startswith("Missing measurements: ")
+    assert "V.SedUp, V.SedC, ID.SedManifold" in (
+        validator.report_writer.sections[1].records[0].template
+    )
+
+
+# reports written by the checks when they did their arithmetic on pint
+# quantities, before they ran on SI magnitudes
+pint_reports = {
+    "lfom": (
+        "The expected flow rate, 10 liter / second, was very close to the one "
+        "calculated by this validation code, 10.19 liter / second.\n"
+    ),
+    "floc": (
+        "The G Theta, 46602.12359867121, was above the minimum value of 30000.\n"
+        "Ratio of channel length, 1.851 meter, to baffle spacing, 0.3085 meter "
+        "was within the acceptable range (between 3 and 6).\n"
+    ),
+    "sed": (
+        "INVALID: The max diffuser velocity based on floc shear, 367.1 "
+        "millimeter / second, is less than the one calculated by this "
+        "validation code, 432.5 meter * millimeter / inch / second.\n"
+        "INVALID: The max head loss, 0.05 meter, is less than the one "
+        "calculated by this validation code, 1478 centimeter.\n"
+        "The inlet manifold design flow rate, 3 liter / second, is less than "
+        "the one calculated by this validation code, 64.02 liter / second.\n"
+        "INVALID: The plate settlers' design flow rate, 3 liter / second, is "
+        "greater than the one calculated by this validation code, 1.135 "
+        "liter / second.\n"
+        "INVALID: The sed tank's design flow rate, 3 liter / second, is "
+        "greater than the one calculated by this validation code, 1.075 "
+        "liter / second.\n"
+        "INVALID: The outlet manifold design flow rate, 3 liter / second, is "
+        "greater than the one calculated by this validation code, 1.235 "
+        "liter / second.\n"
+    ),
+}
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_report_matches_pint_path(
+    tmp_path, lfom_measurements, floc_measurements, sed_measurements
+):
+    sed = dict(sed_measurements, Flow=3 * u.L)
+    sed["W.SedDiffuserInner"] = sed["W.SedDiffuserInner"] / 60
+    measurements = {
+        "lfom": lfom_measurements,
+        "floc": floc_measurements,
+        "sed": sed,
+    }
+
+    for name, expected in pint_reports.items():
+        validator = Validator(report_dir=str(tmp_path))
+        getattr(validator, "validate_" + name)(measurements[name])
+
+        assert validator.report_writer.to_text() == (
+            "AIDE Validation Report\n" + expected
+        )
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_validator_used_once(tmp_path, floc_measurements):
+    validator = Validator(report_dir=str(tmp_path), pdf=False)
+    assert validator.validate_measurements(floc_measurements, ["Floc"]) == "Valid"
+
+    with pytest.raises(RuntimeError):
+        validator.validate_measurements(floc_measurements, ["Floc"])
+    with pytest.raises(RuntimeError):
+        validator.validate("https://example.com")
+    assert len(validator.report_writer.sections) == 1
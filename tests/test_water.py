@@ -0,0 +1,57 @@
+import pytest
+import numpy as np
+from aguaclara.core.units import u
+import aguaclara.core.physchem as pc
+import aide_validation.water as water
+
+# set skip_all_tests = True to focus on single test
+skip_all_tests = False
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_table_error_bounds():
+    # many points between the table temperatures, including both ends
+    temps = np.linspace(water.TABLE_TEMP_MIN, water.TABLE_TEMP_MAX, 100003)
+
+    density = water.density_water(temps) / water.density_water_exact(temps)
+    viscosity = water.viscosity_kinematic_water(temps)
+    viscosity = viscosity / water.viscosity_kinematic_water_exact(temps)
+
+    assert np.max(np.abs(density - 1)) < water.DENSITY_ERROR
+    assert np.max(np.abs(viscosity - 1)) < water.VISCOSITY_ERROR
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+@pytest.mark.parametrize("temp", [0, 4.5, 20, 35])
+def test_matches_aguaclara(temp):
+    temp_k = (temp * u.degC).to(u.K).magnitude
+    density = pc.density_water(temp * u.degC).to(u.kg / u.m**3).magnitude
+    viscosity = pc.viscosity_kinematic_water(temp * u.degC).to(u.m**2 / u.s)
+
+    assert water.density_water(temp_k) == pytest.approx(density, rel=1e-12)
+    assert water.viscosity_kinematic_water(temp_k) == pytest.approx(
+        viscosity.magnitude, rel=1e-12
+    )
+    assert water.viscosity_kinematic_water(np.array([temp_k])) == pytest.approx(
+        viscosity.magnitude, rel=water.VISCOSITY_ERROR
+    )
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_outside_table():
+    temps = np.array([260.0, 293.15, 380.0])
+
+    viscosity = water.viscosity_kinematic_water(temps)
+
+    assert viscosity[0] == water.viscosity_kinematic_water_exact(260.0)
+    assert viscosity[2] == water.viscosity_kinematic_water_exact(380.0)
+
+
+@pytest.mark.skipif(skip_all_tests, reason="Exclude all tests")
+def test_scalar_memo():
+    water.density_water(291.15)
+    hits = water._properties.cache_info().hits
+
+    viscosity = water.viscosity_kinematic_water_exact(291.15)
+    assert water.viscosity_kinematic_water(291.15) == viscosity
+    assert water._properties.cache_info().hits == hits + 1